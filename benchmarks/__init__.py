@@ -0,0 +1 @@
+"""Benchmarks for TidyDir on synthetic directory trees."""
@@ -0,0 +1,185 @@
+"""Deterministic synthetic directory trees for benchmarks."""
+
+from __future__ import annotations
+
+import os
+import random
+import time
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from tidydir.fs import MemoryFileSystem
+
+# Extension weights roughly modelled on a busy Downloads folder
+DEFAULT_EXTENSION_MIX: dict[str, int] = {
+    ".jpg": 20,
+    ".png": 10,
+    ".pdf": 15,
+    ".docx": 8,
+    ".xlsx": 5,
+    ".mp4": 5,
+    ".mp3": 6,
+    ".txt": 10,
+    ".py": 6,
+    ".zip": 5,
+    ".json": 5,
+    ".xyz": 5,
+}
+
+# Age given to files selected as old; well past the default 365-day threshold
+OLD_FILE_AGE_DAYS = 400
+
+
+@dataclass
+class TreeSpec:
+    """Shape of a synthetic source tree."""
+
+    files: int
+    depth: int = 0
+    fanout: int = 10
+    conflict_rate: float = 0.0
+    old_rate: float = 0.1
+    file_size: int = 0
+    extension_mix: dict[str, int] = field(default_factory=lambda: dict(DEFAULT_EXTENSION_MIX))
+    seed: int = 0
+
+    def to_dict(self) -> dict[str, Any]:
+        """Return the spec as plain data."""
+        return asdict(self)
+
+
+# Named scenarios; "smoke" is small enough for CI and the test suite
+SCENARIOS: dict[str, TreeSpec] = {
+    "smoke": TreeSpec(files=500, depth=2, fanout=4, conflict_rate=0.1),
+    "flat-100k": TreeSpec(files=100_000),
+    "flat-1m": TreeSpec(files=1_000_000),
+    "deep-100k": TreeSpec(files=100_000, depth=6, fanout=6),
+    "colliding-50k": TreeSpec(files=50_000, depth=3, fanout=8, conflict_rate=0.5),
+}
+
+
+@dataclass
+class GeneratedTree:
+    """Paths and sizes of a generated tree."""
+
+    source: Path
+    target: Path
+    files: int
+    preexisting: int
+
+
+def _directories(root: Path, depth: int, fanout: int) -> list[Path]:
+    """List the leaf directories of a balanced tree."""
+    leaves = [root]
+    for level in range(depth):
+        leaves = [parent / f"d{level}_{i}" for parent in leaves for i in range(fanout)]
+    return leaves
+
+
+def generate_tree(
+    root: str | Path, spec: TreeSpec, fs: MemoryFileSystem | None = None
+) -> GeneratedTree:
+    """
+    Generate a source tree and a target tree with colliding names.
+
+    The same spec and seed always produce the same names, extensions, ages
+    and collisions. Colliding files are pre-created in the target's category
+    folders so that conflict resolution has to rename them.
+
+    Args:
+        root: Empty directory to create ``source/`` and ``target/`` in
+        spec: Shape of the tree
+        fs: In-memory file system to create the tree in instead of the disk
+
+    Returns:
+        Description of the generated tree
+    """
+    if fs is not None:
+        return _generate_in_memory(Path(root), spec, fs)
+
+    # Imported here so the generator only depends on tidydir for collisions
+    from tidydir.categories import FileCategory
+    from tidydir.organizer import FileOrganizer
+
+    rng = random.Random(spec.seed)
+    root = Path(root)
+    source = root / "source"
+    target = root / "target"
+    source.mkdir(parents=True)
+    target.mkdir(parents=True)
+
+    leaves = _directories(source, spec.depth, spec.fanout)
+    for leaf in leaves:
+        leaf.mkdir(parents=True, exist_ok=True)
+
+    extensions = list(spec.extension_mix)
+    weights = list(spec.extension_mix.values())
+    ext_to_category = FileOrganizer(source).ext_to_category
+    old_mtime = time.time() - OLD_FILE_AGE_DAYS * 86400
+    payload = b"x" * spec.file_size
+    preexisting = 0
+    made_dirs: set[Path] = set()
+
+    for index in range(spec.files):
+        ext = rng.choices(extensions, weights)[0]
+        name = f"file_{index:08d}{ext}"
+        path = leaves[index % len(leaves)] / name
+        with open(path, "wb") as f:
+            f.write(payload)
+
+        is_old = rng.random() < spec.old_rate
+        if is_old:
+            os.utime(path, (old_mtime, old_mtime))
+
+        if rng.random() < spec.conflict_rate:
+            category = ext_to_category.get(ext, FileCategory.FILES)
+            # Collide with the regular folder; old files still land without renames
+            existing_dir = target / category.value
+            if existing_dir not in made_dirs:
+                existing_dir.mkdir(parents=True, exist_ok=True)
+                made_dirs.add(existing_dir)
+            (existing_dir / name).touch()
+            preexisting += 1
+
+    return GeneratedTree(source=source, target=target, files=spec.files, preexisting=preexisting)
+
+
+def _generate_in_memory(root: Path, spec: TreeSpec, fs: MemoryFileSystem) -> GeneratedTree:
+    """Generate the tree of ``generate_tree`` in an in-memory file system."""
+    from tidydir.categories import FileCategory, extension_map
+
+    rng = random.Random(spec.seed)
+    source = root / "source"
+    target = root / "target"
+    fs.makedirs(str(source))
+    fs.makedirs(str(target))
+
+    leaves = [str(leaf) for leaf in _directories(source, spec.depth, spec.fanout)]
+    for leaf in leaves:
+        fs.makedirs(leaf)
+
+    extensions = list(spec.extension_mix)
+    weights = list(spec.extension_mix.values())
+    ext_to_category = extension_map()
+    now = time.time()
+    old_mtime = now - OLD_FILE_AGE_DAYS * 86400
+    preexisting = 0
+
+    # Same draws in the same order as on disk, so both trees match
+    for index in range(spec.files):
+        ext = rng.choices(extensions, weights)[0]
+        name = f"file_{index:08d}{ext}"
+        is_old = rng.random() < spec.old_rate
+        fs.add_file(
+            os.path.join(leaves[index % len(leaves)], name),
+            spec.file_size,
+            old_mtime if is_old else now,
+        )
+        if rng.random() < spec.conflict_rate:
+            category = ext_to_category.get(ext, FileCategory.FILES)
+            fs.add_file(os.path.join(target, category.value, name), 0, now)
+            preexisting += 1
+
+    return GeneratedTree(source=source, target=target, files=spec.files, preexisting=preexisting)
@@ -0,0 +1,85 @@
+"""
+Measure the import time of the CLI.
+
+Usage::
+
+    python -m benchmarks.importtime
+    python -m benchmarks.importtime --budget-ms 50 --top 15
+
+Runs ``python -X importtime -c "import tidydir.cli"`` several times in fresh
+interpreters, keeps the fastest cumulative time of every module and lists the
+slowest ones. The exit code is 1 when ``tidydir.cli`` exceeds the budget.
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+# Import time budget of ``tidydir.cli`` in milliseconds
+DEFAULT_BUDGET_MS = 50.0
+
+SRC_DIR = Path(__file__).resolve().parent.parent / "src"
+
+
+def measure_imports(module: str = "tidydir.cli", repeat: int = 5) -> dict[str, float]:
+    """
+    Measure the cumulative import time of a module and its dependencies.
+
+    Args:
+        module: Module to import
+        repeat: Number of fresh interpreters; the fastest time per module is kept
+
+    Returns:
+        Milliseconds per imported module, slowest first
+    """
+    env = dict(os.environ)
+    env["PYTHONPATH"] = os.pathsep.join(filter(None, [str(SRC_DIR), env.get("PYTHONPATH")]))
+    best: dict[str, float] = {}
+    for _ in range(max(1, repeat)):
+        completed = subprocess.run(
+            [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+            capture_output=True,
+            text=True,
+            env=env,
+            check=True,
+        )
+        for line in completed.stderr.splitlines():
+            # import time: self [us] | cumulative | imported package
+            if not line.startswith("import time:") or "cumulative" in line:
+                continue
+            _, cumulative, name = line.split("|", 2)
+            ms = int(cumulative) / 1000
+            name = name.strip()
+            best[name] = min(ms, best.get(name, ms))
+    return dict(sorted(best.items(), key=lambda item: item[1], reverse=True))
+
+
+def main(argv: list[str] | None = None) -> int:
+    """Run the import time benchmark."""
+    parser = argparse.ArgumentParser(description="Measure the import time of tidydir.cli")
+    parser.add_argument("--module", default="tidydir.cli", help="Module to import")
+    parser.add_argument("--repeat", type=int, default=5, help="Fresh interpreters to run")
+    parser.add_argument("--top", type=int, default=10, help="Slowest modules to list")
+    parser.add_argument(
+        "--budget-ms", type=float, default=DEFAULT_BUDGET_MS, help="Fail above this import time"
+    )
+    args = parser.parse_args(argv)
+
+    timings = measure_imports(args.module, args.repeat)
+    total = timings.get(args.module, 0.0)
+    print(f"{args.module}: {total:.1f} ms (budget {args.budget_ms:.0f} ms)")
+    for name, ms in list(timings.items())[: args.top]:
+        print(f"  {ms:8.1f} ms  {name}")
+
+    if total > args.budget_ms:
+        print(f"{args.module} exceeds the import budget", file=sys.stderr)
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
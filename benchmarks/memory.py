@@ -0,0 +1,107 @@
+"""
+Measure memory per planned file on a synthetic tree.
+
+Usage::
+
+    python -m benchmarks.memory flat-100k
+    python -m benchmarks.memory flat-1m --max-bytes-per-file 400
+
+The tree is generated first, then scanned and planned in a fresh process so
+that peak RSS reflects TidyDir alone and not the generator.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import multiprocessing
+import shutil
+import sys
+import tempfile
+from pathlib import Path
+from typing import Any
+
+from benchmarks.generate import SCENARIOS, TreeSpec, generate_tree
+from benchmarks.run import RESULTS_DIR
+
+
+def _measure(source: str, target: str, include_subdirs: bool) -> dict[str, Any]:
+    """Profile scan and planning; runs in a child process."""
+    from tidydir.memory import peak_rss_bytes, profile_memory
+    from tidydir.organizer import FileOrganizer
+
+    baseline_rss = peak_rss_bytes()
+    organizer = FileOrganizer(source, target, include_subdirs=include_subdirs)
+    report = profile_memory(organizer).to_dict()
+    report["baseline_rss_bytes"] = baseline_rss
+    return report
+
+
+def run_memory_benchmark(spec: TreeSpec, workdir: str | Path | None = None) -> dict[str, Any]:
+    """
+    Report memory per planned file for a tree generated from ``spec``.
+
+    Args:
+        spec: Shape of the tree
+        workdir: Directory to generate the tree in (a temporary one by default)
+
+    Returns:
+        Memory report of every phase
+    """
+    root = Path(tempfile.mkdtemp(prefix="tidydir-bench-", dir=workdir))
+    try:
+        tree = generate_tree(root, spec)
+        context = multiprocessing.get_context("spawn")
+        with context.Pool(1) as pool:
+            report = pool.apply(_measure, (str(tree.source), str(tree.target), spec.depth > 0))
+        report["spec"] = spec.to_dict()
+        report["files"] = tree.files
+        return report
+    finally:
+        shutil.rmtree(root, ignore_errors=True)
+
+
+def main(argv: list[str] | None = None) -> int:
+    """Command-line entry point."""
+    parser = argparse.ArgumentParser(prog="python -m benchmarks.memory", description=__doc__)
+    parser.add_argument("scenario", choices=sorted(SCENARIOS), help="Tree to measure")
+    parser.add_argument("--workdir", help="Directory to generate trees in")
+    parser.add_argument(
+        "--output", type=Path, help="Result file (default: results/<scenario>-memory.json)"
+    )
+    parser.add_argument(
+        "--max-bytes-per-file",
+        type=float,
+        help="Fail when the plan retains more than this many bytes per file",
+    )
+    args = parser.parse_args(argv)
+
+    report = run_memory_benchmark(SCENARIOS[args.scenario], args.workdir)
+    report["scenario"] = args.scenario
+
+    output = args.output or RESULTS_DIR / f"{args.scenario}-memory.json"
+    output.parent.mkdir(parents=True, exist_ok=True)
+    output.write_text(json.dumps(report, indent=2) + "\n")
+
+    print(f"{args.scenario}: {report['files']} files")
+    for phase in report["phases"]:
+        rss = phase["peak_rss_bytes"]
+        rss_text = f"{rss / 2**20:.1f} MiB" if rss is not None else "n/a"
+        print(
+            f"  {phase['phase']:<8} retained {phase['retained_per_item']:>8.0f} B/file"
+            f"  peak {phase['peak_per_item']:>8.0f} B/file  peak RSS {rss_text}"
+        )
+
+    if args.max_bytes_per_file is not None:
+        plan = next(phase for phase in report["phases"] if phase["phase"] == "plan")
+        if plan["retained_per_item"] > args.max_bytes_per_file:
+            print(
+                f"Plan retains {plan['retained_per_item']:.0f} B/file, "
+                f"budget is {args.max_bytes_per_file:.0f}"
+            )
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,229 @@
+"""
+Run TidyDir phase benchmarks on a synthetic tree.
+
+Usage::
+
+    python -m benchmarks.run smoke
+    python -m benchmarks.run flat-100k --save-baseline
+    python -m benchmarks.run flat-100k --threshold 0.2
+    python -m benchmarks.run flat-1m --memory-fs
+
+Each run times ``get_files_to_organize``, ``plan``, ``preview``,
+``print_preview`` and ``execute`` on a freshly generated tree, writes the timings as JSON and
+compares them against the stored baseline for the scenario. The exit code
+is 1 when any phase regressed past the threshold.
+
+With ``--memory-fs`` the tree lives in a ``MemoryFileSystem``, so the
+timings are the planner's own cost without any disk I/O; results and
+baselines are stored as ``<scenario>-memfs``, apart from the
+``<scenario>-memory`` reports of ``benchmarks.memory``.
+"""
+
+from __future__ import annotations
+
+import argparse
+import contextlib
+import gc
+import io
+import json
+import platform
+import shutil
+import sys
+import tempfile
+import time
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any
+
+from benchmarks.generate import SCENARIOS, TreeSpec, generate_tree
+
+BENCHMARK_DIR = Path(__file__).parent
+RESULTS_DIR = BENCHMARK_DIR / "results"
+BASELINES_DIR = BENCHMARK_DIR / "baselines"
+
+# Phases that are measured, in the order they run
+PHASES = ("get_files_to_organize", "plan", "preview", "print_preview", "execute")
+
+# Relative slowdown that counts as a regression
+DEFAULT_THRESHOLD = 0.25
+
+# Phases faster than this are too noisy to compare reliably
+MIN_COMPARABLE_SECONDS = 0.05
+
+
+def _time(func: Callable[[], Any]) -> float:
+    """Time a single call."""
+    start = time.perf_counter()
+    func()
+    return time.perf_counter() - start
+
+
+def run_benchmark(
+    spec: TreeSpec, workdir: str | Path | None = None, repeat: int = 3, memory_fs: bool = False
+) -> dict:
+    """
+    Time every phase on a tree generated from ``spec``.
+
+    Non-destructive phases report the best of ``repeat`` runs; ``execute``
+    moves the files and therefore runs once, last.
+
+    Args:
+        spec: Shape of the tree
+        workdir: Directory to generate the tree in (a temporary one by default)
+        repeat: Number of timed runs for the non-destructive phases
+        memory_fs: Generate the tree in a ``MemoryFileSystem`` instead of on disk
+
+    Returns:
+        Result document with per-phase seconds
+    """
+    from tidydir.fs import MemoryFileSystem
+    from tidydir.organizer import FileOrganizer
+
+    fs = MemoryFileSystem() if memory_fs else None
+    if fs is None:
+        root = Path(tempfile.mkdtemp(prefix="tidydir-bench-", dir=workdir))
+    else:
+        root = Path(workdir or tempfile.gettempdir()).absolute() / "tidydir-bench-memfs"
+    try:
+        started = time.perf_counter()
+        tree = generate_tree(root, spec, fs)
+        generate_seconds = time.perf_counter() - started
+        if fs is not None:
+            # Keep the collector from rescanning millions of tree objects
+            gc.freeze()
+
+        include_subdirs = spec.depth > 0
+        timings: dict[str, float] = {}
+
+        def best(phase: str, func: Callable[[], Any]) -> None:
+            timings[phase] = min(_time(func) for _ in range(repeat))
+
+        organizer = FileOrganizer(tree.source, tree.target, include_subdirs=include_subdirs, fs=fs)
+        best("get_files_to_organize", organizer.get_files_to_organize)
+        best("plan", organizer.plan)
+        best("preview", organizer.preview)
+
+        plan = organizer.plan()
+        with contextlib.redirect_stdout(io.StringIO()):
+            best("print_preview", lambda: organizer.print_preview(plan))
+
+        organizer = FileOrganizer(
+            tree.source, tree.target, include_subdirs=include_subdirs, show_progress=False, fs=fs
+        )
+        with contextlib.redirect_stdout(io.StringIO()):
+            timings["execute"] = _time(organizer.execute)
+
+        return {
+            "spec": spec.to_dict(),
+            "files": tree.files,
+            "preexisting": tree.preexisting,
+            "memory_fs": memory_fs,
+            "generate_seconds": round(generate_seconds, 6),
+            "phases": {phase: round(timings[phase], 6) for phase in PHASES},
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "timestamp": time.time(),
+        }
+    finally:
+        if fs is None:
+            shutil.rmtree(root, ignore_errors=True)
+        else:
+            gc.unfreeze()
+
+
+def compare_results(
+    result: dict, baseline: dict, threshold: float = DEFAULT_THRESHOLD
+) -> list[str]:
+    """
+    Compare a result with a baseline.
+
+    Args:
+        result: Result of ``run_benchmark``
+        baseline: Stored result to compare against
+        threshold: Allowed relative slowdown, e.g. 0.25 for 25%
+
+    Returns:
+        One message per regressed phase
+    """
+    regressions = []
+    for phase, base_seconds in baseline.get("phases", {}).items():
+        seconds = result["phases"].get(phase)
+        if seconds is None or max(seconds, base_seconds) < MIN_COMPARABLE_SECONDS:
+            continue
+        limit = base_seconds * (1 + threshold)
+        if seconds > limit:
+            regressions.append(
+                f"{phase}: {seconds:.3f}s vs baseline {base_seconds:.3f}s "
+                f"(+{(seconds / base_seconds - 1) * 100:.0f}%, limit +{threshold * 100:.0f}%)"
+            )
+    return regressions
+
+
+def _write_json(path: Path, data: dict) -> None:
+    """Write a JSON document, creating parent directories."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(data, indent=2) + "\n")
+
+
+def main(argv: list[str] | None = None) -> int:
+    """Command-line entry point."""
+    parser = argparse.ArgumentParser(prog="python -m benchmarks.run", description=__doc__)
+    parser.add_argument("scenario", choices=sorted(SCENARIOS), help="Tree to benchmark")
+    parser.add_argument("--repeat", type=int, default=3, help="Runs per non-destructive phase")
+    parser.add_argument("--workdir", help="Directory to generate trees in")
+    parser.add_argument(
+        "--memory-fs",
+        action="store_true",
+        help="Use an in-memory file system, timing no disk I/O",
+    )
+    parser.add_argument(
+        "--output", type=Path, help="Result file (default: results/<scenario>.json)"
+    )
+    parser.add_argument(
+        "--baseline", type=Path, help="Baseline (default: baselines/<scenario>.json)"
+    )
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=DEFAULT_THRESHOLD,
+        help=f"Allowed relative slowdown per phase (default: {DEFAULT_THRESHOLD})",
+    )
+    parser.add_argument(
+        "--save-baseline", action="store_true", help="Store this run as the new baseline"
+    )
+    args = parser.parse_args(argv)
+
+    result = run_benchmark(SCENARIOS[args.scenario], args.workdir, args.repeat, args.memory_fs)
+    name = f"{args.scenario}-memfs" if args.memory_fs else args.scenario
+    result["scenario"] = name
+
+    output = args.output or RESULTS_DIR / f"{name}.json"
+    _write_json(output, result)
+
+    print(f"{name}: {result['files']} files")
+    for phase, seconds in result["phases"].items():
+        rate = result["files"] / seconds if seconds else 0
+        print(f"  {phase:<22} {seconds:>9.3f}s {rate:>12.0f} files/s")
+
+    baseline_path = args.baseline or BASELINES_DIR / f"{name}.json"
+    if args.save_baseline:
+        _write_json(baseline_path, result)
+        print(f"Baseline saved to {baseline_path}")
+        return 0
+
+    if not baseline_path.exists():
+        print(f"No baseline at {baseline_path}; run with --save-baseline to create one")
+        return 0
+
+    regressions = compare_results(result, json.loads(baseline_path.read_text()), args.threshold)
+    if regressions:
+        print("Regressions:")
+        for message in regressions:
+            print(f"  {message}")
+        return 1
+    print("No regressions against baseline")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -5,10 +5,58 @@ This package provides functionality to organize files into categories based on t
 file extensions, with support for archiving old files and preview mode.
 """
 
-from tidydir.categories import CATEGORY_EXTENSIONS
-from tidydir.organizer import FileCategory, FileOrganizer, OrganizeResult
+from __future__ import annotations
+
+# Not imported from ``typing``, which alone takes longer to import than the CLI
+TYPE_CHECKING = False
+if TYPE_CHECKING:
+    from typing import Any
+
+    from tidydir.categories import CATEGORY_EXTENSIONS, FileCategory
+    from tidydir.fs import FileSystem, LocalFileSystem, MemoryFileSystem
+    from tidydir.hooks import HookEvent
+    from tidydir.organizer import FileOrganizer, OrganizeResult
 
 __version__ = "0.1.0"
 __author__ = "thraal"
 __email__ = "thraal@gmail.com"
-__all__ = ["FileOrganizer", "FileCategory", "OrganizeResult", "CATEGORY_EXTENSIONS"]
+__all__ = [
+    "FileOrganizer",
+    "FileCategory",
+    "OrganizeResult",
+    "CATEGORY_EXTENSIONS",
+    "HookEvent",
+    "FileSystem",
+    "LocalFileSystem",
+    "MemoryFileSystem",
+]
+
+# Public names and the modules they live in; imported on first access so
+# that ``import tidydir`` stays cheap
+_LAZY_IMPORTS = {
+    "CATEGORY_EXTENSIONS": "tidydir.categories",
+    "FileCategory": "tidydir.categories",
+    "HookEvent": "tidydir.hooks",
+    "FileSystem": "tidydir.fs",
+    "LocalFileSystem": "tidydir.fs",
+    "MemoryFileSystem": "tidydir.fs",
+    "FileOrganizer": "tidydir.organizer",
+    "OrganizeResult": "tidydir.organizer",
+}
+
+
+def __getattr__(name: str) -> Any:
+    """Import public names on first access."""
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    import importlib
+
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    """List the module's attributes including lazily imported ones."""
+    return sorted([*globals(), *_LAZY_IMPORTS])
@@ -0,0 +1,256 @@
+"""
+String-based path helpers for the planning hot loop.
+
+Planning handles millions of names, so it works on plain ``str`` paths and
+``os.scandir`` entries; ``pathlib.Path`` objects are only created where the
+public API hands them out.
+"""
+
+from __future__ import annotations
+
+import errno
+import os
+import shutil
+import stat
+from collections.abc import Callable, Iterable, Iterator
+from typing import BinaryIO
+
+SEP = os.sep
+
+# Log files written by TidyDir itself are never organized
+LOG_PREFIX = "tidydir_"
+LOG_SUFFIX = ".log"
+
+# Lock and lease files of concurrent runs; never organized or descended into
+LOCK_DIR_NAME = ".tidydir-locks"
+
+# Read size when splitting a NUL-separated file list
+LIST_BUFFER = 64 * 1024
+
+
+def split_ext(name: str) -> tuple[str, str]:
+    """
+    Split a file name into stem and suffix like ``Path.stem``/``Path.suffix``.
+
+    Args:
+        name: File name without directory
+
+    Returns:
+        Tuple of stem and suffix; the suffix is empty for names such as
+        ``".bashrc"`` or ``"file."``
+    """
+    stem, dot, ext = name.rpartition(".")
+    if not dot or not stem or not ext:
+        return name, ""
+    return stem, dot + ext
+
+
+def join(directory: str, name: str) -> str:
+    """Join a directory and a name without going through ``os.path``."""
+    if directory.endswith(SEP):
+        return directory + name
+    return directory + SEP + name
+
+
+def is_log_file(name: str) -> bool:
+    """Check whether a name matches ``tidydir_*.log``."""
+    return name.startswith(LOG_PREFIX) and name.endswith(LOG_SUFFIX)
+
+
+def scan_files(root: str, recursive: bool) -> Iterator[tuple[str, os.DirEntry[str]]]:
+    """
+    Yield the regular files below a directory.
+
+    Symlinks to files are included; symlinked directories are not descended
+    into, so link cycles cannot cause endless scans.
+
+    Args:
+        root: Directory to scan
+        recursive: Whether to descend into subdirectories
+
+    Yields:
+        Tuples of the containing directory and the file's directory entry
+
+    Raises:
+        OSError: If ``root`` itself cannot be listed
+    """
+    pending = [root]
+    first = True
+    while pending:
+        directory = pending.pop()
+        try:
+            entries = os.scandir(directory)
+        except OSError:
+            if first:
+                raise
+            continue
+        first = False
+        subdirs = []
+        with entries:
+            for entry in entries:
+                try:
+                    if entry.is_file():
+                        if not is_log_file(entry.name):
+                            yield directory, entry
+                    elif (
+                        recursive
+                        and entry.is_dir(follow_symlinks=False)
+                        and entry.name != LOCK_DIR_NAME
+                    ):
+                        subdirs.append(entry.path)
+                except OSError:
+                    continue
+        # Visit subdirectories in listing order
+        pending.extend(reversed(subdirs))
+
+
+class PathEntry:
+    """A listed file with the parts of ``os.DirEntry`` that planning uses."""
+
+    __slots__ = ("path", "name", "_stat")
+
+    def __init__(self, path: str, name: str, st: os.stat_result) -> None:
+        """
+        Initialize the PathEntry.
+
+        Args:
+            path: Absolute path of the file
+            name: File name without directory
+            st: Result of ``os.stat`` on the file
+        """
+        self.path = path
+        self.name = name
+        self._stat = st
+
+    def stat(self) -> os.stat_result:
+        """Get the stat result taken when the file was listed."""
+        return self._stat
+
+
+def list_files(
+    paths: Iterable[str | os.PathLike[str]],
+    on_skipped: Callable[[str, str], None] | None = None,
+    stat_path: Callable[[str], os.stat_result] = os.stat,
+) -> Iterator[tuple[str, PathEntry]]:
+    """
+    Yield the regular files of an explicit list of paths.
+
+    Paths are consumed lazily, made absolute and stat()ed once each, so a
+    list can be planned while it is still being produced. Paths listed
+    again are yielded once. Symlinks to files are included, as in
+    ``scan_files``; TidyDir's own log and lock files are left out.
+
+    Args:
+        paths: Paths of files, absolute or relative to the working directory
+        on_skipped: Called with the path and the reason for every path that
+            is missing or not a regular file
+        stat_path: Function used to stat each path
+
+    Yields:
+        Tuples of the containing directory and the file's entry
+    """
+    seen: set[str] = set()
+    for listed in paths:
+        path = os.path.abspath(listed)
+        if path in seen:
+            continue
+        seen.add(path)
+        directory, name = os.path.split(path)
+        if is_log_file(name) or os.path.basename(directory) == LOCK_DIR_NAME:
+            continue
+        try:
+            st = stat_path(path)
+        except OSError as e:
+            if on_skipped is not None:
+                on_skipped(path, e.strerror or str(e))
+            continue
+        if not stat.S_ISREG(st.st_mode):
+            if on_skipped is not None:
+                on_skipped(path, "Not a regular file")
+            continue
+        yield directory, PathEntry(path, name, st)
+
+
+def read_path_list(stream: BinaryIO, null: bool = False) -> Iterator[str]:
+    """
+    Read paths from a stream as they arrive.
+
+    Names are decoded with the file system encoding, so any name ``find``
+    prints can be read back; empty entries are skipped.
+
+    Args:
+        stream: Binary stream, such as ``sys.stdin.buffer``
+        null: Whether paths are separated by NUL bytes (``find -print0``)
+            instead of newlines
+
+    Yields:
+        Paths in list order
+    """
+    if not null:
+        for line in stream:
+            line = line.removesuffix(b"\n")
+            if os.name == "nt":
+                line = line.removesuffix(b"\r")
+            if line:
+                yield os.fsdecode(line)
+        return
+
+    pending = b""
+    while chunk := stream.read(LIST_BUFFER):
+        *complete, pending = (pending + chunk).split(b"\0")
+        for item in complete:
+            if item:
+                yield os.fsdecode(item)
+    if pending:
+        yield os.fsdecode(pending)
+
+
+def list_subdirs(root: str) -> list[str]:
+    """
+    Get the subdirectories of a directory in scan order.
+
+    Symlinked directories and the lock directory are left out, as in
+    ``scan_files``.
+
+    Args:
+        root: Directory to list
+
+    Returns:
+        Paths of the subdirectories
+
+    Raises:
+        OSError: If ``root`` cannot be listed
+    """
+    subdirs = []
+    with os.scandir(root) as entries:
+        for entry in entries:
+            try:
+                if entry.is_dir(follow_symlinks=False) and entry.name != LOCK_DIR_NAME:
+                    subdirs.append(entry.path)
+            except OSError:
+                continue
+    return subdirs
+
+
+def move_file(source: str, target: str) -> None:
+    """
+    Move a file, renaming in place when source and target share a device.
+
+    An existing file at the target is never replaced.
+
+    Args:
+        source: File to move
+        target: Destination path, which must not exist
+
+    Raises:
+        FileExistsError: If something already exists at the target
+        OSError: If the file could not be moved
+    """
+    if os.path.lexists(target):
+        raise FileExistsError(errno.EEXIST, os.strerror(errno.EEXIST), target)
+    try:
+        os.rename(source, target)
+    except OSError as e:
+        if e.errno != errno.EXDEV:
+            raise
+        shutil.move(source, target)
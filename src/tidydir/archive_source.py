@@ -0,0 +1,348 @@
+"""Organizing the members of a tar or zip archive without extracting it first."""
+
+from __future__ import annotations
+
+import os
+import posixpath
+import shutil
+import tarfile
+import time
+import zipfile
+from collections import deque
+from collections.abc import Iterator
+from pathlib import Path
+from typing import IO
+
+from tidydir._paths import join, split_ext
+from tidydir.categories import FileCategory
+from tidydir.hooks import HookEvent
+from tidydir.organizer import FileOrganizer, OrganizeResult
+from tidydir.plan import CompactPlan, FileOperation
+
+# Suffixes stripped from an archive's name to get its default target
+ARCHIVE_SUFFIXES = (".tar.gz", ".tar.bz2", ".tar.xz", ".tgz", ".tbz2", ".txz", ".tar", ".zip")
+
+# Read size when streaming a member to disk
+COPY_BUFFER = 1024 * 1024
+
+# Member names that cannot be a file name
+_SKIPPED_NAMES = frozenset({"", ".", ".."})
+
+# Directory inside the archive, file name, size, mtime and data (when requested)
+Member = tuple[str, str, int, float, IO[bytes] | None]
+
+
+def is_archive(path: str | Path) -> bool:
+    """
+    Check whether a path is a tar or zip archive.
+
+    Args:
+        path: Path to check
+
+    Returns:
+        True for a regular file that ``tarfile`` or ``zipfile`` can read
+    """
+    if not os.path.isfile(path):
+        return False
+    try:
+        return zipfile.is_zipfile(path) or tarfile.is_tarfile(path)
+    except OSError:
+        return False
+
+
+def default_target(path: str | Path) -> Path:
+    """
+    Get the directory an archive is organized into by default.
+
+    This is where extracting the archive would usually put it: next to the
+    archive, named after it without its suffix (``bundle.tar.gz`` →
+    ``bundle``).
+
+    Args:
+        path: Archive path
+
+    Returns:
+        Target directory
+    """
+    path = Path(path)
+    name = path.name
+    for suffix in ARCHIVE_SUFFIXES:
+        if name.lower().endswith(suffix) and len(name) > len(suffix):
+            return path.with_name(name[: -len(suffix)])
+    return path.with_name(f"{name}.d")
+
+
+def iter_members(path: str | Path, with_data: bool = False) -> Iterator[Member]:
+    """
+    Iterate over the regular files of an archive in archive order.
+
+    Tar archives, compressed or not, are read as a stream in a single pass.
+    Directories, links and other special members are skipped, as are
+    members whose name is empty, ``.`` or ``..``. Only the last component
+    of a member's name is ever used as a file name, so no member can be
+    written outside its target directory.
+
+    Args:
+        path: Archive path
+        with_data: Also yield an open file of each member's data, valid
+            until the next member is requested
+
+    Yields:
+        Directory inside the archive, file name, size, mtime and data
+    """
+    if zipfile.is_zipfile(path):
+        with zipfile.ZipFile(path) as zf:
+            for info in zf.infolist():
+                if info.is_dir():
+                    continue
+                directory, name = posixpath.split(info.filename.lstrip("/"))
+                if name in _SKIPPED_NAMES:
+                    continue
+                mtime = time.mktime((*info.date_time, 0, 0, -1))
+                if with_data:
+                    with zf.open(info) as data:
+                        yield directory, name, info.file_size, mtime, data
+                else:
+                    yield directory, name, info.file_size, mtime, None
+        return
+
+    with tarfile.open(path, "r|*") as tf:
+        for member in tf:
+            if not member.isfile():
+                continue
+            directory, name = posixpath.split(member.name.lstrip("/"))
+            if name in _SKIPPED_NAMES:
+                continue
+            if directory.startswith("./"):
+                directory = directory[2:]
+            directory = "" if directory == "." else directory
+            stream = tf.extractfile(member) if with_data else None
+            yield directory, name, member.size, float(member.mtime), stream
+
+
+class ArchiveSource:
+    """
+    Organize the members of an archive straight into category directories.
+
+    Members are classified by name with the organizer's extension map and
+    aged by their stored mtime, then streamed into their target directories
+    under the usual conflict rules. Nothing is extracted first, so every
+    byte is written once; the archive itself is left untouched.
+    """
+
+    def __init__(self, organizer: FileOrganizer, path: str | Path | None = None) -> None:
+        """
+        Initialize the ArchiveSource.
+
+        Args:
+            organizer: Organizer providing the target, categories and naming
+                rules; members in subdirectories of the archive are only
+                included with ``include_subdirs``
+            path: Archive to organize (defaults to the organizer's source)
+
+        Raises:
+            ValueError: If the path is not a tar or zip archive, or the
+                organizer is not on the local file system
+        """
+        if not organizer.fs.local:
+            raise ValueError("Archive sources need the local file system")
+        self.organizer = organizer
+        self.path = str(path if path is not None else organizer.source_dir)
+        if not is_archive(self.path):
+            raise ValueError(f"Not a tar or zip archive: {self.path}")
+
+    def _members(self, with_data: bool) -> Iterator[Member]:
+        """Iterate over the members the organizer's settings include."""
+        include_subdirs = self.organizer.include_subdirs
+        for member in iter_members(self.path, with_data):
+            if member[0] and not include_subdirs:
+                continue
+            yield member
+
+    def _start_run(self) -> set[str]:
+        """Reset the organizer's run state and return the set of claimed target paths."""
+        organizer = self.organizer
+        organizer.stats.reset()
+        organizer.conflicts.clear()
+        organizer.errors.clear()
+        organizer._layout = organizer._sharder = None
+        self._sharder = organizer.get_sharder()
+        self._cutoff = organizer.old_files_cutoff.timestamp()
+        self._dirs: dict[FileCategory, str] = {}
+        return set()
+
+    def _place(self, name: str, mtime: float) -> tuple[FileCategory, bool, str]:
+        """Classify a member and get its target directory."""
+        organizer = self.organizer
+        category = organizer.ext_to_category.get(split_ext(name)[1].lower(), FileCategory.FILES)
+        if mtime < self._cutoff:
+            return category, True, organizer.get_archive_layout().directory(category, mtime)
+        target_dir = self._dirs.get(category)
+        if target_dir is None:
+            target_dir = self._dirs[category] = join(str(organizer.target_dir), category.value)
+        if self._sharder is not None:
+            target_dir = self._sharder.directory(target_dir, name, mtime)
+        return category, False, target_dir
+
+    def plan(self) -> CompactPlan:
+        """
+        Plan the organization of the archive without writing anything.
+
+        Returns:
+            The plan; its source paths point inside the archive
+        """
+        organizer = self.organizer
+        claimed = self._start_run()
+        on_planned = organizer.hooks.dispatcher(HookEvent.PLANNED)
+        plan = CompactPlan()
+        with organizer.stats.timer("scan") as scan:
+            for directory, name, size, mtime, _ in self._members(with_data=False):
+                category, is_old, target_dir = self._place(name, mtime)
+                target_name = organizer._resolve_name(target_dir, name, claimed)
+                source_dir = join(self.path, directory) if directory else self.path
+                if target_name != name:
+                    organizer.conflicts.append(
+                        (Path(source_dir, name), Path(target_dir, target_name))
+                    )
+                plan.append(source_dir, name, target_dir, target_name, category, is_old, size)
+                if on_planned is not None:
+                    on_planned(
+                        FileOperation(
+                            Path(source_dir, name),
+                            Path(target_dir, target_name),
+                            category,
+                            is_old,
+                            size,
+                        )
+                    )
+            scan.items = len(plan)
+        organizer.stats.incr("files_planned", len(plan))
+        organizer.stats.incr("conflicts", len(organizer.conflicts))
+        return plan
+
+    def _write(self, data: IO[bytes], target_dir: str, name: str, claimed: set[str]) -> str:
+        """Stream a member into a free name in its target directory."""
+        flags = os.O_WRONLY | os.O_CREAT | os.O_EXCL | getattr(os, "O_BINARY", 0)
+        while True:
+            target_name = self.organizer._resolve_name(target_dir, name, claimed)
+            target = join(target_dir, target_name)
+            try:
+                fd = os.open(target, flags, 0o666)
+                break
+            except FileExistsError:
+                # Created since the name was resolved; take the next free one
+                continue
+        try:
+            with open(fd, "wb") as out:
+                shutil.copyfileobj(data, out, COPY_BUFFER)
+        except BaseException:
+            os.unlink(target)
+            raise
+        return target_name
+
+    def execute(self, plan: CompactPlan | None = None) -> OrganizeResult:
+        """
+        Organize the archive in one pass over its data.
+
+        Args:
+            plan: Plan from ``plan`` to carry out, so the files written are
+                the ones previewed; members not in it are skipped. Without a
+                plan, members are placed while the archive is read.
+
+        Returns:
+            Result of the organization; ``moved_count`` counts written files
+        """
+        organizer = self.organizer
+        logger = organizer.logger
+        planned: dict[str, deque[int]] | None = None
+        if plan is None:
+            claimed = self._start_run()
+        else:
+            organizer.errors.clear()
+            claimed = set()
+            planned = {}
+            for index, source_path, _, _ in plan.iter_moves():
+                planned.setdefault(source_path, deque()).append(index)
+        conflicts = len(organizer.conflicts)
+        created: set[str] = set()
+        on_moved = organizer.hooks.dispatcher(HookEvent.MOVED)
+        on_failed = organizer.hooks.dispatcher(HookEvent.FAILED)
+        total = written = 0
+
+        print(f"\nExtracting files from {os.path.basename(self.path)}...")
+
+        with organizer.stats.timer("extract") as extract:
+            for directory, name, size, mtime, data in self._members(with_data=True):
+                assert data is not None
+                source_dir = join(self.path, directory) if directory else self.path
+                if planned is None:
+                    category, is_old, target_dir = self._place(name, mtime)
+                    wanted = name
+                else:
+                    indices = planned.get(join(source_dir, name))
+                    if not indices:
+                        continue
+                    assert plan is not None
+                    op = plan[indices.popleft()]
+                    category, is_old = op.category, op.is_old
+                    target_dir, wanted = str(op.target.parent), op.target.name
+                total += 1
+                source = Path(source_dir, name)
+                try:
+                    if target_dir not in created:
+                        os.makedirs(target_dir, exist_ok=True)
+                        created.add(target_dir)
+                    target_name = self._write(data, target_dir, wanted, claimed)
+                    target = join(target_dir, target_name)
+                    os.utime(target, (mtime, mtime))
+                except Exception as e:
+                    organizer.errors.append((source, str(e)))
+                    if logger:
+                        logger.error(
+                            "Failed to extract %s: %s",
+                            source,
+                            e,
+                            extra={"event": "failed", "source": source},
+                        )
+                    if on_failed is not None:
+                        on_failed(
+                            FileOperation(source, Path(target_dir, wanted), category, is_old, size),
+                            e,
+                        )
+                    continue
+
+                written += 1
+                if target_name != wanted:
+                    organizer.conflicts.append((source, Path(target)))
+                if logger:
+                    logger.info(
+                        "Extracted: %s → %s",
+                        source,
+                        target,
+                        extra={"event": "moved", "source": source, "target": target},
+                    )
+                if on_moved is not None:
+                    on_moved(FileOperation(source, Path(target), category, is_old, size))
+            extract.items = total
+
+        if plan is not None:
+            # Planned members missing from the archive count as not organized
+            total = len(plan)
+        organizer.stats.incr("files_moved", written)
+        organizer.stats.incr("files_failed", len(organizer.errors))
+        organizer.stats.incr("conflicts", len(organizer.conflicts) - conflicts)
+
+        print(f"\n✅ Completed: {written}/{total} files organized")
+        if organizer.errors:
+            print(f"\n❌ Errors: {len(organizer.errors)} files failed")
+            for file_path, error in organizer.errors[:5]:
+                print(f"  {file_path.name}: {error}")
+            if len(organizer.errors) > 5:
+                print(f"  ... and {len(organizer.errors) - 5} more")
+
+        return OrganizeResult(
+            moved_count=written,
+            total_count=total,
+            errors=organizer.errors,
+            conflicts=organizer.conflicts,
+        )
@@ -0,0 +1,320 @@
+"""Organize many directories in one run on a shared worker pool."""
+
+from __future__ import annotations
+
+import errno
+import json
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass, field, fields
+from pathlib import Path
+from typing import Any
+
+from tidydir.layout import DEFAULT_ARCHIVE_LAYOUT
+from tidydir.logs import LogFormat
+from tidydir.organizer import FileOrganizer, OrganizeResult
+from tidydir.plan import CompactPlan
+from tidydir.sharding import ShardBy
+from tidydir.stats import RunStats
+
+# Threads shared by every root; moves are I/O-bound, so more than one per core
+DEFAULT_WORKERS = 8
+
+# Moves per task, so large roots are spread over the pool
+CHUNK_SIZE = 512
+
+
+@dataclass
+class BatchEntry:
+    """One root of a batch manifest."""
+
+    source: Path
+    target: Path | None = None
+    subdirs: bool = False
+    days: int = 365
+    log: bool = False
+    log_format: LogFormat = LogFormat.TEXT
+    archive_layout: str = DEFAULT_ARCHIVE_LAYOUT
+    max_per_dir: int | None = None
+    shard_by: ShardBy = ShardBy.HASH
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any] | str, base_dir: Path) -> BatchEntry:
+        """
+        Create an entry from a manifest item.
+
+        Args:
+            data: Manifest item, either a source path or an object with a
+                ``source`` key and optional ``target``, ``subdirs``, ``days``,
+                ``log``, ``log_format``, ``archive_layout``, ``max_per_dir``
+                and ``shard_by`` keys
+            base_dir: Directory relative paths are resolved against
+
+        Returns:
+            The entry
+
+        Raises:
+            ValueError: If the item is malformed
+        """
+        if isinstance(data, str):
+            data = {"source": data}
+        if not isinstance(data, dict) or "source" not in data:
+            raise ValueError(f"Manifest entry needs a source: {data!r}")
+        known = {f.name for f in fields(cls)}
+        unknown = set(data) - known
+        if unknown:
+            raise ValueError(f"Unknown manifest keys: {', '.join(sorted(unknown))}")
+
+        target = data.get("target")
+        max_per_dir = data.get("max_per_dir")
+        return cls(
+            source=base_dir / Path(data["source"]).expanduser(),
+            target=base_dir / Path(target).expanduser() if target else None,
+            subdirs=bool(data.get("subdirs", False)),
+            days=int(data.get("days", 365)),
+            log=bool(data.get("log", False)),
+            log_format=LogFormat(data.get("log_format", LogFormat.TEXT)),
+            archive_layout=str(data.get("archive_layout", DEFAULT_ARCHIVE_LAYOUT)),
+            max_per_dir=int(max_per_dir) if max_per_dir is not None else None,
+            shard_by=ShardBy(data.get("shard_by", ShardBy.HASH)),
+        )
+
+    def create_organizer(self, log_console: bool = True) -> FileOrganizer:
+        """
+        Create the organizer for this root.
+
+        Args:
+            log_console: Whether to echo log lines to the console
+
+        Returns:
+            The organizer
+        """
+        return FileOrganizer(
+            source_dir=self.source,
+            target_dir=self.target,
+            include_subdirs=self.subdirs,
+            old_files_days=self.days,
+            enable_logging=self.log,
+            log_format=self.log_format,
+            log_console=log_console,
+            show_progress=False,
+            archive_layout=self.archive_layout,
+            max_per_dir=self.max_per_dir,
+            shard_by=self.shard_by,
+        )
+
+
+def load_manifest(path: str | Path) -> list[BatchEntry]:
+    """
+    Read a batch manifest.
+
+    The manifest is a JSON list of entries, or an object with a ``roots``
+    list and optional ``defaults`` applied to every entry. Relative paths are
+    resolved against the manifest's directory.
+
+    Args:
+        path: Manifest file
+
+    Returns:
+        The entries in manifest order
+
+    Raises:
+        ValueError: If the manifest is malformed
+        OSError: If the manifest cannot be read
+    """
+    path = Path(path)
+    with open(path, encoding="utf-8") as f:
+        try:
+            data = json.load(f)
+        except json.JSONDecodeError as e:
+            raise ValueError(f"Invalid manifest {path}: {e}") from e
+
+    defaults: dict[str, Any] = {}
+    if isinstance(data, dict):
+        defaults = data.get("defaults", {})
+        data = data.get("roots")
+    if not isinstance(data, list) or not isinstance(defaults, dict):
+        raise ValueError(f"Manifest {path} must be a list of roots or have a 'roots' list")
+
+    base_dir = path.parent
+    entries = []
+    for item in data:
+        if isinstance(item, str):
+            item = {"source": item}
+        entries.append(BatchEntry.from_dict({**defaults, **item}, base_dir))
+    return entries
+
+
+@dataclass
+class BatchResult:
+    """Outcome of one root of a batch."""
+
+    entry: BatchEntry
+    result: OrganizeResult
+    error: str | None = None
+    stats: RunStats = field(default_factory=RunStats)
+
+
+class BatchRunner:
+    """
+    Organize several roots with one bounded thread pool.
+
+    Every root is planned as a task on the pool. As soon as a root's plan is
+    ready, its moves are split into chunks and queued on the same pool, so
+    small roots finish early and large ones are spread over all workers.
+    Roots with the same target directory are organized one after another.
+    """
+
+    def __init__(
+        self,
+        entries: list[BatchEntry],
+        workers: int = DEFAULT_WORKERS,
+        chunk_size: int = CHUNK_SIZE,
+        preview: bool = False,
+        log_console: bool = True,
+        check_space: bool = True,
+    ) -> None:
+        """
+        Initialize the BatchRunner.
+
+        Args:
+            entries: Roots to organize
+            workers: Maximum number of worker threads
+            chunk_size: Moves per task
+            preview: Only plan, without moving files
+            log_console: Whether to echo log lines to the console
+            check_space: Fail roots whose target devices lack the space or
+                inodes for their plan before moving any of their files
+
+        Raises:
+            ValueError: If ``workers`` is less than 1
+        """
+        if workers < 1:
+            raise ValueError("workers must be at least 1")
+        self.entries = entries
+        self.workers = workers
+        self.chunk_size = max(1, chunk_size)
+        self.preview = preview
+        self.log_console = log_console
+        self.check_space = check_space
+        self.stats = RunStats()
+        self._lock = threading.Lock()
+
+    def _plan(self, organizer: FileOrganizer) -> CompactPlan:
+        """Check and plan one root, preparing its directories unless previewing."""
+        issues = organizer.check_permissions()
+        if issues:
+            raise PermissionError("; ".join(issues))
+        plan = organizer.plan()
+        if plan and not self.preview and self.check_space:
+            issues = organizer.check_space(plan)
+            if issues:
+                raise OSError(errno.ENOSPC, "; ".join(issues))
+        if plan and not self.preview:
+            organizer.errors.clear()
+            organizer.prepare_directories(plan)
+        return plan
+
+    def _move(self, organizer: FileOrganizer, plan: CompactPlan, start: int, stop: int) -> int:
+        """Move one chunk of a root's plan."""
+        started = time.perf_counter()
+        moved = organizer.move_operations(plan, start, stop)
+        with self._lock:
+            organizer.stats.add("move", time.perf_counter() - started, stop - start)
+        return moved
+
+    def run(self) -> list[BatchResult]:
+        """
+        Organize every root.
+
+        Returns:
+            One result per manifest entry, in manifest order
+        """
+        results: list[BatchResult] = []
+        organizers: list[FileOrganizer | None] = []
+        for entry in self.entries:
+            try:
+                organizers.append(entry.create_organizer(self.log_console))
+                results.append(BatchResult(entry, OrganizeResult(0, 0)))
+            except Exception as e:
+                organizers.append(None)
+                results.append(BatchResult(entry, OrganizeResult(0, 0), error=str(e)))
+
+        # Roots sharing a target run one after another, each planned once
+        # the previous one has moved its files, so they never pick the same
+        # free name
+        following: dict[int, int] = {}
+        first: dict[Path, int] = {}
+        last: dict[Path, int] = {}
+        for i, organizer in enumerate(organizers):
+            if organizer is None:
+                continue
+            target = organizer.target_dir
+            if target in last:
+                following[last[target]] = i
+            else:
+                first[target] = i
+            last[target] = i
+
+        plans: dict[int, CompactPlan] = {}
+        moved = [0] * len(self.entries)
+        chunks = [0] * len(self.entries)
+        with ThreadPoolExecutor(self.workers, thread_name_prefix="tidydir-batch") as pool:
+            pending: dict[Future[Any], tuple[int, bool]] = {}
+
+            def start(i: int) -> None:
+                organizer = organizers[i]
+                assert organizer is not None
+                pending[pool.submit(self._plan, organizer)] = (i, True)
+
+            def finish(i: int) -> None:
+                if not chunks[i] and i in following:
+                    start(following.pop(i))
+
+            for i in first.values():
+                start(i)
+            while pending:
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    i, planning = pending.pop(future)
+                    if not planning:
+                        chunks[i] -= 1
+                        try:
+                            moved[i] += future.result()
+                        except Exception as e:
+                            results[i].error = str(e)
+                        finish(i)
+                        continue
+                    try:
+                        plan = plans[i] = future.result()
+                    except Exception as e:
+                        results[i].error = str(e)
+                        finish(i)
+                        continue
+                    if not self.preview:
+                        organizer = organizers[i]
+                        assert organizer is not None
+                        for chunk_start in range(0, len(plan), self.chunk_size):
+                            stop = min(chunk_start + self.chunk_size, len(plan))
+                            move = pool.submit(self._move, organizer, plan, chunk_start, stop)
+                            pending[move] = (i, False)
+                            chunks[i] += 1
+                    finish(i)
+
+        for i, organizer in enumerate(organizers):
+            if organizer is None:
+                continue
+            plan = plans.get(i, CompactPlan())
+            organizer.stats.incr("files_moved", moved[i])
+            organizer.stats.incr("files_failed", len(organizer.errors))
+            organizer.close_logging()
+            results[i].result = OrganizeResult(
+                moved_count=moved[i],
+                total_count=len(plan),
+                errors=organizer.errors,
+                conflicts=organizer.conflicts,
+            )
+            results[i].stats = organizer.stats
+            self.stats.merge(organizer.stats)
+        return results
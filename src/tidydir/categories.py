@@ -1,7 +1,25 @@
-"""File category definitions and extension mappings."""
+"""
+File category definitions and extension mappings.
 
+The extension lists in ``tidydir._extensions`` are only imported to build the
+extension-to-category table. The table is cached on disk as a ``marshal``
+file keyed by a CRC-32 of that module's source, so later runs load it with a
+single read and never build the sets.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import marshal
+import os
+import sys
+import zlib
 from enum import Enum
 
+TYPE_CHECKING = False
+if TYPE_CHECKING:
+    from tidydir._extensions import CATEGORY_EXTENSIONS as CATEGORY_EXTENSIONS
+
 
 class FileCategory(str, Enum):
     """Enumeration of file categories."""
@@ -25,1064 +43,137 @@ class FileCategory(str, Enum):
     FILES = "Files"  # Default category
 
 
-# File extension mappings to categories
-CATEGORY_EXTENSIONS: dict[FileCategory, set[str]] = {
-    FileCategory.APPLICATIONS: {
-        ".exe",
-        ".msi",
-        ".app",
-        ".deb",
-        ".rpm",
-        ".dmg",
-        ".pkg",
-        ".appimage",
-        ".apk",
-        ".ipa",
-        ".xpi",
-        ".vsix",
-    },
-    FileCategory.ARCHIVES: {
-        ".zip",
-        ".tar",
-        ".gz",
-        ".rar",
-        ".7z",
-        ".bz2",
-        ".xz",
-        ".tgz",
-        ".tar.gz",
-        ".tar.bz2",
-        ".tar.xz",
-        ".cab",
-        ".arj",
-        ".z",
-        ".lz",
-        ".lzma",
-        ".lzo",
-        ".rz",
-        ".sz",
-        ".dz",
-    },
-    FileCategory.DOCUMENTS: {
-        ".pdf",
-        ".doc",
-        ".docx",
-        ".odt",
-        ".rtf",
-        ".tex",
-        ".wpd",
-        ".wps",
-        ".pages",
-        ".key",
-        ".odp",
-        ".ods",
-        ".odf",
-        ".xps",
-        ".ps",
-        ".eps",
-        ".prn",
-        ".dvi",
-    },
-    FileCategory.FONTS: {
-        ".ttf",
-        ".otf",
-        ".woff",
-        ".woff2",
-        ".eot",
-        ".fon",
-        ".fnt",
-        ".ttc",
-        ".pfb",
-        ".pfm",
-        ".afm",
-        ".sfd",
-        ".vlw",
-    },
-    FileCategory.IMAGES: {
-        ".jpg",
-        ".jpeg",
-        ".png",
-        ".gif",
-        ".bmp",
-        ".svg",
-        ".ico",
-        ".tiff",
-        ".webp",
-        ".psd",
-        ".xcf",
-        ".raw",
-        ".heif",
-        ".heic",
-        ".dng",
-        ".cr2",
-        ".nef",
-        ".arw",
-        ".orf",
-        ".rw2",
-        ".pef",
-        ".sr2",
-        ".raf",
-        ".mrw",
-        ".dcr",
-        ".mos",
-        ".nrw",
-        ".ptx",
-        ".pxn",
-        ".r3d",
-        ".x3f",
-        ".srw",
-        ".tga",
-        ".dds",
-        ".jfif",
-        ".jp2",
-        ".jpx",
-        ".pbm",
-        ".pgm",
-        ".ppm",
-        ".pnm",
-        ".mng",
-        ".apng",
-        ".clip",
-        ".cpt",
-        ".exr",
-        ".hdr",
-        ".picti",
-        ".sct",
-        ".sgi",
-        ".targa",
-        ".vicar",
-        ".viff",
-        ".cur",
-        ".ani",
-    },
-    FileCategory.SCRIPTS: {
-        ".py",
-        ".js",
-        ".sh",
-        ".bat",
-        ".ps1",
-        ".rb",
-        ".pl",
-        ".php",
-        ".bash",
-        ".zsh",
-        ".fish",
-        ".ksh",
-        ".csh",
-        ".tcsh",
-        ".awk",
-        ".sed",
-        ".lua",
-        ".tcl",
-        ".r",
-        ".m",
-        ".ahk",
-        ".au3",
-        ".applescript",
-        ".vbs",
-        ".cmd",
-        ".psm1",
-        ".psd1",
-        ".ps1xml",
-    },
-    FileCategory.TEXT: {
-        ".txt",
-        ".md",
-        ".log",
-        ".csv",
-        ".json",
-        ".xml",
-        ".yaml",
-        ".yml",
-        ".ini",
-        ".cfg",
-        ".conf",
-        ".properties",
-        ".toml",
-        ".rst",
-        ".tex",
-        ".adoc",
-        ".textile",
-        ".creole",
-        ".mediawiki",
-        ".wiki",
-        ".nfo",
-        ".readme",
-        ".asc",
-        ".etx",
-        ".irclog",
-        ".man",
-        ".me",
-        ".plain",
-        ".rpt",
-        ".ans",
-        ".ascii",
-        ".diz",
-        ".ezt",
-        ".info",
-        ".lit",
-        ".lnt",
-        ".text",
-        ".strings",
-        ".vtt",
-        ".srt",
-        ".sub",
-        ".sbv",
-        ".ssa",
-        ".ass",
-    },
-    FileCategory.VIDEOS: {
-        ".mp4",
-        ".avi",
-        ".mkv",
-        ".mov",
-        ".wmv",
-        ".flv",
-        ".webm",
-        ".m4v",
-        ".mpg",
-        ".mpeg",
-        ".3gp",
-        ".3g2",
-        ".f4v",
-        ".f4p",
-        ".ogv",
-        ".ogg",
-        ".drc",
-        ".mng",
-        ".qt",
-        ".yuv",
-        ".rm",
-        ".rmvb",
-        ".asf",
-        ".amv",
-        ".m2v",
-        ".svi",
-        ".mxf",
-        ".roq",
-        ".nsv",
-        ".f4a",
-        ".f4b",
-        ".m2ts",
-        ".mts",
-        ".vob",
-        ".dv",
-        ".mj2",
-        ".mjpeg",
-        ".m1v",
-        ".m2p",
-        ".m2t",
-        ".m4p",
-        ".minipsf",
-        ".nut",
-        ".bik",
-        ".smk",
-        ".viv",
-        ".daf",
-        ".divx",
-        ".evo",
-        ".mk3d",
-        ".ivf",
-        ".mpe",
-        ".mpv",
-        ".mpv2",
-        ".fli",
-        ".flc",
-        ".fxm",
-        ".emf",
-        ".ts",
-        ".tsv",
-        ".tsa",
-        ".camrec",
-        ".dav",
-        ".wtv",
-        ".ssif",
-        ".smv",
-        ".rv",
-        ".dvr-ms",
-        ".mswmm",
-        ".mseq",
-        ".seq",
-        ".clpi",
-        ".rec",
-        ".bdm",
-        ".bdmv",
-    },
-    FileCategory.THREE_D: {
-        ".obj",
-        ".fbx",
-        ".dae",
-        ".3ds",
-        ".blend",
-        ".stl",
-        ".ply",
-        ".gltf",
-        ".glb",
-        ".usdz",
-        ".x3d",
-        ".x3db",
-        ".bvh",
-        ".dxf",
-        ".lwo",
-        ".lws",
-        ".m3d",
-        ".md2",
-        ".md3",
-        ".md5",
-        ".mesh",
-        ".mot",
-        ".ms3d",
-        ".nif",
-        ".off",
-        ".ogex",
-        ".q3d",
-        ".q3s",
-        ".raw",
-        ".smd",
-        ".u3d",
-        ".vrml",
-        ".wrl",
-        ".x",
-        ".xgl",
-        ".zgl",
-        ".3dm",
-        ".max",
-        ".3dxml",
-        ".x3dz",
-        ".x3dbz",
-        ".x3dv",
-        ".x3dvz",
-        ".c4d",
-        ".lxo",
-        ".ma",
-        ".mb",
-        ".jas",
-        ".mdl",
-        ".wire",
-        ".iges",
-        ".igs",
-        ".step",
-        ".stp",
-    },
-    FileCategory.DISK_IMAGES: {
-        ".iso",
-        ".img",
-        ".vhd",
-        ".vhdx",
-        ".vdi",
-        ".vmdk",
-        ".dmg",
-        ".cdr",
-        ".dvd",
-        ".wim",
-        ".swm",
-        ".esd",
-        ".nrg",
-        ".mdf",
-        ".mds",
-        ".mdx",
-        ".ccd",
-        ".sub",
-        ".ima",
-        ".udf",
-        ".bin",
-        ".cue",
-        ".daa",
-        ".pxi",
-        ".nri",
-        ".isz",
-        ".eui",
-        ".vcd",
-        ".bwt",
-        ".cdi",
-        ".b5t",
-        ".b6t",
-        ".bwi",
-        ".bws",
-        ".bwa",
-        ".ape",
-        ".flac",
-        ".wv",
-        ".sdi",
-        ".mde",
-        ".md0",
-        ".md1",
-        ".md2",
-        ".xa",
-        ".ede",
-        ".eds",
-        ".ddi",
-        ".gbi",
-        ".tib",
-        ".vbox-extpack",
-    },
-    FileCategory.VMS: {
-        ".ova",
-        ".ovf",
-        ".vbox",
-        ".vbox-prev",
-        ".vmc",
-        ".vmwarevm",
-        ".vmx",
-        ".vmxf",
-        ".vmsd",
-        ".vmsn",
-        ".vmss",
-        ".nvram",
-        ".vmem",
-        ".vmtm",
-        ".vmt",
-        ".vhd",
-        ".vhdx",
-        ".avhd",
-        ".avhdx",
-        ".vud",
-        ".vdi",
-        ".hdd",
-        ".pvs",
-        ".sav",
-        ".xva",
-        ".qcow",
-        ".qcow2",
-        ".qed",
-        ".vhdp",
-    },
-    FileCategory.AUDIO: {
-        ".mp3",
-        ".wav",
-        ".flac",
-        ".aac",
-        ".ogg",
-        ".wma",
-        ".m4a",
-        ".opus",
-        ".ape",
-        ".mka",
-        ".au",
-        ".aiff",
-        ".aif",
-        ".aifc",
-        ".dts",
-        ".dtshd",
-        ".ac3",
-        ".amr",
-        ".awb",
-        ".dss",
-        ".dvf",
-        ".m4b",
-        ".m4p",
-        ".mmf",
-        ".mpc",
-        ".msv",
-        ".oga",
-        ".mogg",
-        ".ra",
-        ".rm",
-        ".raw",
-        ".sln",
-        ".tta",
-        ".voc",
-        ".vox",
-        ".wv",
-        ".webm",
-        ".8svx",
-        ".cda",
-        ".mid",
-        ".midi",
-        ".mus",
-        ".sib",
-        ".sid",
-        ".xm",
-        ".it",
-        ".s3m",
-        ".mod",
-        ".mtm",
-        ".umx",
-        ".vgm",
-        ".vgz",
-        ".alac",
-        ".mlp",
-        ".dsd",
-        ".dsf",
-        ".dff",
-        ".tak",
-        ".thd",
-        ".caf",
-        ".kar",
-        ".snd",
-        ".vqf",
-        ".spx",
-        ".spc",
-        ".gym",
-        ".adx",
-        ".dsp",
-        ".adp",
-        ".ymf",
-        ".ast",
-        ".afc",
-        ".lwav",
-        ".smp",
-        ".aud",
-        ".sng",
-        ".imf",
-        ".m15",
-        ".ply",
-        ".m3u",
-        ".m3u8",
-        ".pls",
-        ".asx",
-        ".xspf",
-    },
-    FileCategory.EBOOKS: {
-        ".epub",
-        ".mobi",
-        ".azw",
-        ".azw3",
-        ".fb2",
-        ".lit",
-        ".pdb",
-        ".kf8",
-        ".azw4",
-        ".tpz",
-        ".prc",
-        ".tcr",
-        ".snb",
-        ".webz",
-        ".txtz",
-        ".htmlz",
-        ".oeb",
-        ".lrf",
-        ".lrx",
-        ".cbr",
-        ".cbz",
-        ".cbt",
-        ".cba",
-        ".cb7",
-        ".djvu",
-        ".ibooks",
-        ".oxps",
-        ".xps",
-        ".fb3",
-        ".kfx",
-        ".acsm",
-        ".mart",
-        ".mbp",
-        ".ybk",
-        ".koob",
-        ".eal",
-        ".ebk",
-        ".ebx",
-        ".etd",
-        ".hsb",
-        ".lrs",
-        ".nat",
-        ".ncx",
-        ".odb",
-        ".odf",
-        ".odm",
-        ".odt",
-        ".opu",
-        ".opf",
-        ".pef",
-        ".phl",
-        ".rzb",
-        ".rzs",
-        ".tcz",
-        ".tr",
-        ".tr3",
-        ".xeb",
-        ".ava",
-        ".bkk",
-        ".brn",
-        ".ceb",
-        ".dnl",
-        ".edn",
-        ".eit",
-        ".ebm",
-        ".ebo",
-        ".ebr",
-        ".ebs",
-        ".ecw",
-        ".emd",
-        ".emo",
-        ".eny",
-        ".eot",
-        ".eta",
-        ".etx",
-        ".evi",
-        ".evy",
-        ".fax",
-        ".fcf",
-        ".fdr",
-        ".fds",
-        ".fdt",
-        ".fdx",
-        ".fft",
-        ".fha",
-        ".fhd",
-        ".fhf",
-        ".fik",
-        ".fkb",
-        ".fub",
-        ".gho",
-        ".gpd",
-        ".han",
-        ".hbk",
-        ".htz",
-        ".htx",
-        ".htz4",
-        ".htz5",
-        ".hux",
-        ".hvx",
-        ".hya",
-        ".hyb",
-        ".isx",
-        ".jbr",
-        ".jcr",
-        ".kdz",
-        ".keb",
-        ".key",
-        ".kfn",
-        ".kml",
-        ".kne",
-        ".kon",
-        ".kpf",
-        ".kpw",
-        ".lbr",
-        ".lbxcol",
-        ".lbxoeb",
-        ".lbxosh",
-        ".ldo",
-        ".lix",
-        ".llb",
-        ".lrt",
-        ".lrv",
-        ".ltr",
-        ".lts",
-        ".ltz",
-        ".lza",
-        ".mag",
-        ".meb",
-        ".mht",
-        ".mpub",
-        ".msg",
-        ".mwp",
-        ".nfx",
-        ".nva",
-        ".obb",
-        ".obk",
-        ".obo",
-        ".odc",
-        ".odg",
-        ".odi",
-        ".odp",
-        ".ods",
-        ".oebzip",
-        ".onb",
-        ".oop",
-        ".opz",
-        ".orn",
-        ".orv",
-        ".osi",
-        ".otb",
-        ".ott",
-        ".otu",
-        ".otz",
-        ".oux",
-        ".ove",
-        ".ovx",
-        ".owb",
-        ".owc",
-        ".oxb",
-        ".p7a",
-        ".p7s",
-        ".pck",
-        ".pcz",
-        ".pdg",
-        ".pdz",
-        ".pea",
-        ".peb",
-        ".pec",
-        ".pex",
-        ".pez",
-        ".pfg",
-        ".pfr",
-        ".pk",
-        ".pkg",
-        ".plb",
-        ".plc",
-        ".pld",
-        ".plf",
-        ".pli",
-        ".plx",
-        ".pma",
-        ".pmd",
-        ".pml",
-        ".pmlz",
-        ".pmn",
-        ".pmo",
-        ".pmr",
-        ".pmu",
-        ".pmx",
-        ".pmz",
-        ".pnc",
-        ".pnz",
-        ".pot",
-        ".ppa",
-        ".ppb",
-        ".ppn",
-        ".ppo",
-        ".ppp",
-        ".ppw",
-        ".ppx",
-        ".pqa",
-        ".pqb",
-    },
-    FileCategory.SPREADSHEETS: {
-        ".xls",
-        ".xlsx",
-        ".ods",
-        ".xlsm",
-        ".xlsb",
-        ".xltx",
-        ".xltm",
-        ".csv",
-        ".tsv",
-        ".dif",
-        ".dbf",
-        ".prn",
-        ".slk",
-        ".gnumeric",
-        ".numbers",
-        ".et",
-        ".wks",
-        ".wk1",
-        ".wk2",
-        ".wk3",
-        ".wk4",
-        ".xlr",
-        ".xlt",
-        ".xlam",
-        ".xla",
-        ".xlw",
-        ".xlc",
-        ".ots",
-        ".sxc",
-        ".stc",
-        ".fods",
-        ".wq1",
-        ".wq2",
-        ".wku",
-        ".dex",
-        ".px",
-    },
-    FileCategory.PRESENTATIONS: {
-        ".ppt",
-        ".pptx",
-        ".odp",
-        ".pps",
-        ".ppsx",
-        ".pptm",
-        ".ppsm",
-        ".potx",
-        ".potm",
-        ".pot",
-        ".otp",
-        ".sxi",
-        ".sti",
-        ".pez",
-        ".prz",
-        ".shw",
-        ".show",
-        ".slp",
-        ".sspss",
-        ".ope",
-        ".sdd",
-        ".sdp",
-        ".sdw",
-        ".sgl",
-        ".sor",
-        ".sxd",
-        ".sxg",
-        ".sxm",
-        ".sxw",
-        ".uop",
-        ".vor",
-        ".vsd",
-        ".vss",
-        ".vst",
-        ".vdx",
-        ".vsx",
-        ".vtx",
-        ".vsw",
-        ".vsdx",
-        ".vssx",
-        ".vstx",
-        ".vsdm",
-        ".vssm",
-        ".vstm",
-        ".gslides",
-        ".fodp",
-        ".sldx",
-        ".sldm",
-    },
-    FileCategory.CODE: {
-        ".c",
-        ".cpp",
-        ".h",
-        ".hpp",
-        ".cc",
-        ".cxx",
-        ".c++",
-        ".hh",
-        ".hxx",
-        ".h++",
-        ".cp",
-        ".tcc",
-        ".inl",
-        ".ipp",
-        ".def",
-        ".odl",
-        ".idl",
-        ".rc",
-        ".rc2",
-        ".rct",
-        ".rgs",
-        ".r",
-        ".rd",
-        ".rsx",
-        ".fx",
-        ".fxh",
-        ".hlsl",
-        ".vsh",
-        ".psh",
-        ".cg",
-        ".shd",
-        ".glsl",
-        ".shader",
-        ".java",
-        ".class",
-        ".jar",
-        ".groovy",
-        ".scala",
-        ".clj",
-        ".cljs",
-        ".cljc",
-        ".edn",
-        ".kt",
-        ".kts",
-        ".dart",
-        ".cs",
-        ".csx",
-        ".vb",
-        ".vbs",
-        ".bas",
-        ".frm",
-        ".cls",
-        ".ctl",
-        ".pag",
-        ".dsr",
-        ".dob",
-        ".vbhtml",
-        ".vbproj",
-        ".vbproj.user",
-        ".sln",
-        ".csproj",
-        ".fs",
-        ".fsi",
-        ".ml",
-        ".mli",
-        ".fsx",
-        ".fsscript",
-        ".pas",
-        ".pp",
-        ".inc",
-        ".lpr",
-        ".lfm",
-        ".dpr",
-        ".dpk",
-        ".dproj",
-        ".groupproj",
-        ".bdsgroup",
-        ".bdsproj",
-        ".bpr",
-        ".dfm",
-        ".nfm",
-        ".xfm",
-        ".fmx",
-        ".res",
-        ".chr",
-        ".rs",
-        ".rlib",
-        ".so",
-        ".dll",
-        ".dylib",
-        ".a",
-        ".lib",
-        ".la",
-        ".lo",
-        ".exp",
-        ".pdb",
-        ".idb",
-        ".ilk",
-        ".manifest",
-        ".dep",
-        ".iobj",
-        ".ipdb",
-        ".pch",
-        ".gch",
-        ".pchi",
-        ".hdmp",
-        ".ncb",
-        ".aps",
-        ".sbr",
-        ".bsc",
-        ".fd",
-        ".fe",
-        ".tlog",
-        ".lastbuildstate",
-        ".meta",
-        ".obj",
-        ".pgc",
-        ".pgd",
-        ".rsp",
-        ".tli",
-        ".tlh",
-        ".tmp",
-        ".tmp_proj",
-        ".vspscc",
-        ".vssscc",
-        ".builds",
-        ".pidb",
-        ".svclog",
-        ".scc",
-        ".vcxproj",
-        ".vcxproj.filters",
-        ".vcxproj.user",
-        ".vcproj",
-        ".vdproj",
-        ".dbproj",
-        ".dbproj.user",
-        ".go",
-        ".s",
-        ".S",
-        ".asm",
-        ".nasm",
-        ".yasm",
-        ".swift",
-        ".playground",
-        ".m",
-        ".mm",
-        ".M",
-        ".d",
-        ".di",
-        ".dd",
-        ".ddoc",
-        ".map",
-        ".pc",
-        ".pod",
-        ".rst",
-        ".hs",
-        ".lhs",
-        ".hi",
-        ".hc",
-        ".cabal",
-        ".erl",
-        ".hrl",
-        ".beam",
-        ".app",
-        ".yrl",
-        ".xrl",
-        ".ex",
-        ".exs",
-        ".eex",
-        ".jl",
-        ".nim",
-        ".nims",
-        ".nimble",
-        ".zig",
-        ".v",
-        ".vh",
-        ".sv",
-        ".svh",
-        ".vhd",
-        ".vhdl",
-        ".vho",
-        ".vhs",
-        ".vht",
-        ".vhw",
-        ".vhc",
-        ".ucf",
-        ".qsf",
-        ".tcl",
-        ".sdc",
-        ".xdc",
-        ".xise",
-        ".gise",
-        ".ise",
-        ".xmp",
-        ".xco",
-        ".ngc",
-        ".ngo",
-        ".asy",
-        ".prj",
-        ".psl",
-        ".rpt",
-        ".veo",
-        ".vmo",
-        ".syr",
-        ".par",
-        ".pad",
-        ".unroutes",
-        ".xpi",
-        ".xst",
-        ".stx",
-        ".ngm",
-        ".mrp",
-        ".xrpt",
-        ".drc",
-        ".bgn",
-        ".bit",
-        ".xwbt",
-        ".ngd",
-        ".bld",
-        ".ncd",
-        ".ngr",
-        ".pcf",
-        ".auto",
-        ".trace",
-        ".twr",
-        ".twx",
-        ".cmd_log",
-        ".jhd",
-        ".ant",
-        ".gradle",
-        ".mvn",
-        ".ivy",
-        ".project",
-        ".classpath",
-        ".settings",
-        ".idea",
-        ".iml",
-        ".ipr",
-        ".iws",
-        ".pro",
-        ".pri",
-        ".cmake",
-        ".ninja",
-        ".mk",
-        ".makefile",
-        ".gnumakefile",
-        ".rules",
-        ".ninja_deps",
-        ".ninja_log",
-        ".bazel",
-        ".bzl",
-        ".BUILD",
-        ".WORKSPACE",
-        ".gn",
-        ".gni",
-        ".gyp",
-        ".gypi",
-    },
-}
+# Bumped whenever the layout of the cached table changes
+TABLE_VERSION = 1
+
+# Source the cached table is built from
+EXTENSIONS_SOURCE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "_extensions.py")
+
+_extension_map: dict[str, FileCategory] | None = None
+
+
+def __getattr__(name: str) -> dict[FileCategory, set[str]]:
+    """Import ``CATEGORY_EXTENSIONS`` on first access."""
+    if name != "CATEGORY_EXTENSIONS":
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    from tidydir._extensions import CATEGORY_EXTENSIONS
+
+    globals()[name] = CATEGORY_EXTENSIONS
+    return CATEGORY_EXTENSIONS
+
+
+def cache_dir() -> str:
+    """
+    Get the directory of the on-disk extension table.
+
+    ``TIDYDIR_CACHE_DIR`` overrides the default, which is ``tidydir`` in
+    ``XDG_CACHE_HOME`` (``~/.cache``), or in ``LOCALAPPDATA`` on Windows.
+    """
+    configured = os.environ.get("TIDYDIR_CACHE_DIR")
+    if configured:
+        return configured
+    if sys.platform == "win32" and os.environ.get("LOCALAPPDATA"):
+        base = os.environ["LOCALAPPDATA"]
+    else:
+        base = os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache")
+    return os.path.join(base, "tidydir")
+
+
+def build_extension_map() -> dict[str, FileCategory]:
+    """
+    Build the extension-to-category table from ``CATEGORY_EXTENSIONS``.
+
+    Extensions are lowercased; an extension listed under several categories
+    maps to the last one.
+
+    Returns:
+        Mapping of lowercase extensions to categories
+    """
+    from tidydir._extensions import CATEGORY_EXTENSIONS
+
+    ext_map: dict[str, FileCategory] = {}
+    for category, extensions in CATEGORY_EXTENSIONS.items():
+        for ext in extensions:
+            ext_map[ext.lower()] = category
+    return ext_map
+
+
+def _table_path() -> str | None:
+    """Get the cache file of the current extension lists, or None without a source."""
+    try:
+        with open(EXTENSIONS_SOURCE, "rb") as f:
+            source = f.read()
+    except OSError:
+        return None
+    key = f"{TABLE_VERSION}-{sys.implementation.cache_tag}-{len(source):x}-{zlib.crc32(source):08x}"
+    return os.path.join(cache_dir(), f"categories-{key}.marshal")
+
+
+def _load_table(path: str) -> dict[str, FileCategory] | None:
+    """Load a cached table, or return None if it is missing or unreadable."""
+    try:
+        with open(path, "rb") as f:
+            table = marshal.loads(f.read())
+        ext_map: dict[str, FileCategory] = {}
+        for value, extensions in table.items():
+            ext_map.update(dict.fromkeys(extensions, FileCategory(value)))
+        return ext_map
+    except (OSError, EOFError, ValueError, TypeError, AttributeError):
+        return None
+
+
+def _save_table(path: str, ext_map: dict[str, FileCategory]) -> None:
+    """
+    Write a table atomically and remove tables of older extension lists.
+
+    Only tables of the same table version and interpreter are removed, so
+    other interpreters, virtual environments and installed versions sharing
+    the cache directory keep theirs.
+    """
+    table: dict[str, list[str]] = {}
+    for ext, category in ext_map.items():
+        table.setdefault(category.value, []).append(ext)
+    directory, name = os.path.split(path)
+    prefix = f"categories-{TABLE_VERSION}-{sys.implementation.cache_tag}-"
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    try:
+        os.makedirs(directory, exist_ok=True)
+        with open(tmp_path, "wb") as f:
+            f.write(marshal.dumps({value: tuple(exts) for value, exts in table.items()}))
+        os.replace(tmp_path, path)
+        with os.scandir(directory) as entries:
+            for entry in entries:
+                if (
+                    entry.name.startswith(prefix)
+                    and entry.name.endswith(".marshal")
+                    and entry.name != name
+                ):
+                    os.unlink(entry.path)
+    except OSError:
+        # An unwritable cache only costs the rebuild on the next run
+        with contextlib.suppress(OSError):
+            os.unlink(tmp_path)
+
+
+def extension_map() -> dict[str, FileCategory]:
+    """
+    Get the extension-to-category table.
+
+    The table is built once per process, from the on-disk cache when it
+    matches the current extension lists and otherwise from
+    ``CATEGORY_EXTENSIONS``, refreshing the cache.
+
+    Returns:
+        A new mapping of lowercase extensions to categories, which the
+        caller may modify
+    """
+    global _extension_map
+    if _extension_map is None:
+        path = _table_path()
+        ext_map = _load_table(path) if path is not None else None
+        if ext_map is None:
+            ext_map = build_extension_map()
+            if path is not None:
+                _save_table(path, ext_map)
+        _extension_map = ext_map
+    return dict(_extension_map)
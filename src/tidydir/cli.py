@@ -1,15 +1,44 @@
-"""Command-line interface for TidyDir."""
+"""
+Command-line interface for TidyDir.
 
-import argparse
+Only ``os`` and ``sys`` are imported up front. ``argparse`` is imported when
+the parser is built and the organizer once a run actually starts, so
+``--version``, ``--help`` and argument errors return quickly.
+"""
+
+from __future__ import annotations
+
+import os
 import sys
-from pathlib import Path
 
 from tidydir import __version__
-from tidydir.organizer import FileOrganizer
+
+TYPE_CHECKING = False
+if TYPE_CHECKING:
+    import argparse
+    from collections.abc import Iterable
+    from contextlib import AbstractContextManager
+    from typing import BinaryIO
+
+    from tidydir.organizer import FileOrganizer
+    from tidydir.plan import CompactPlan
+    from tidydir.stats import RunStats
+
+# Choices of the enum-valued options, kept here so building the parser needs
+# no imports; tests check them against the enums
+LOG_FORMATS = ("text", "json")
+STATS_FORMATS = ("text", "json")
+OUTPUT_FORMATS = ("text", "json", "ndjson")
+LINK_MODES = ("symlink", "hardlink")
+ARCHIVE_LAYOUT = "archive_{today}/{category}"
+ARCHIVE_FORMATS = ("tar.xz", "tar.gz", "zip")
+SHARD_MODES = ("hash", "date")
 
 
 def create_parser() -> argparse.ArgumentParser:
     """Create and configure argument parser."""
+    import argparse
+
     parser = argparse.ArgumentParser(
         prog="tidydir",
         description="Organize files into categories based on their type",
@@ -17,12 +46,18 @@ def create_parser() -> argparse.ArgumentParser:
         formatter_class=argparse.RawDescriptionHelpFormatter,
     )
 
-    parser.add_argument("source", help="Source directory to organize")
+    parser.add_argument(
+        "source", nargs="?", help="Source directory, or tar/zip archive, to organize"
+    )
 
     parser.add_argument("-v", "--version", action="version", version=f"%(prog)s {__version__}")
 
     parser.add_argument(
-        "-t", "--target", "--target-dir", help="Target directory (default: source directory)"
+        "-t",
+        "--target",
+        "--target-dir",
+        help="Target directory (default: source directory; for an archive, its name "
+        "without the suffix)",
     )
 
     parser.add_argument(
@@ -42,17 +77,272 @@ def create_parser() -> argparse.ArgumentParser:
         help="Days threshold for old files (default: 365)",
     )
 
+    parser.add_argument(
+        "--archive-layout",
+        default=ARCHIVE_LAYOUT,
+        metavar="TEMPLATE",
+        help="Directories old files are archived in, from {year}, {month}, {day} "
+        "(file mtime), {today} and {category} (default: %(default)s)",
+    )
+
+    parser.add_argument(
+        "--archive-format",
+        choices=ARCHIVE_FORMATS,
+        help="Pack old files into one compressed archive per archive directory "
+        "instead of moving them",
+    )
+
+    parser.add_argument(
+        "--max-per-dir",
+        type=int,
+        metavar="N",
+        help="Cap category directories at N entries; once one is full, new files go to "
+        "shard subdirectories such as Images/3f/",
+    )
+
+    parser.add_argument(
+        "--shard-by",
+        choices=SHARD_MODES,
+        default="hash",
+        help="Shard subdirectories are named after a hash of the file name or the year "
+        "and month of its mtime (default: %(default)s)",
+    )
+
+    parser.add_argument(
+        "--reshard",
+        action="store_true",
+        help="Move files out of category directories with more than --max-per-dir "
+        "entries into shard subdirectories, instead of organizing SOURCE",
+    )
+
     parser.add_argument(
         "-p", "--preview", action="store_true", help="Preview only, don't move files"
     )
 
+    parser.add_argument(
+        "--processes",
+        type=int,
+        default=1,
+        metavar="N",
+        help="Plan with N worker processes, one top-level subdirectory at a time; "
+        "only used with --subdirs (default: 1)",
+    )
+
+    parser.add_argument(
+        "--move-workers",
+        type=int,
+        metavar="N",
+        help="Move small files with N threads while large files are copied in a lane "
+        "of their own (default: move one file at a time)",
+    )
+
+    parser.add_argument(
+        "--large-workers",
+        type=int,
+        default=2,
+        metavar="N",
+        help="Threads of the large-file lane with --move-workers (default: %(default)s)",
+    )
+
+    parser.add_argument(
+        "--large-file-mb",
+        type=int,
+        default=64,
+        metavar="MB",
+        help="Files of at least MB mebibytes go to the large-file lane (default: %(default)s)",
+    )
+
+    parser.add_argument(
+        "--lock",
+        action="store_true",
+        help="Coordinate with other tidydir instances on the same tree using lock files; "
+        "each instance takes the top-level subdirectories no other instance holds",
+    )
+
+    parser.add_argument(
+        "--ignore-space",
+        action="store_true",
+        help="Warn instead of refusing to run when a target device lacks the free space "
+        "or inodes for the files copied to it",
+    )
+
+    parser.add_argument(
+        "--files-from",
+        metavar="FILE",
+        help="Organize the files listed in FILE, one path per line, instead of scanning "
+        "SOURCE; - reads the list from stdin as it is written",
+    )
+
+    parser.add_argument(
+        "-0",
+        "--null",
+        action="store_true",
+        help="Paths in --files-from are separated by NUL bytes, as printed by find -print0",
+    )
+
+    parser.add_argument(
+        "-y",
+        "--yes",
+        action="store_true",
+        help="Organize without asking for confirmation, e.g. when stdin carries --files-from -",
+    )
+
+    parser.add_argument(
+        "--format",
+        choices=OUTPUT_FORMATS,
+        default="text",
+        help="Preview output format; json and ndjson stream every planned operation to "
+        "stdout and imply --preview (default: text)",
+    )
+
     parser.add_argument(
         "-l", "--log", "--enable-logging", action="store_true", help="Enable logging to file"
     )
 
+    parser.add_argument(
+        "--log-format",
+        choices=LOG_FORMATS,
+        default="text",
+        help="Log line format; json writes one JSON object per line (default: text)",
+    )
+
+    parser.add_argument(
+        "--no-log-console",
+        dest="log_console",
+        action="store_false",
+        help="Write log lines to the log file only, without echoing them to the console",
+    )
+
+    parser.add_argument(
+        "--no-progress",
+        dest="progress",
+        action="store_false",
+        help="Don't show live progress while moving files",
+    )
+
+    parser.add_argument(
+        "--stats",
+        choices=STATS_FORMATS,
+        help="Print per-phase timings and counters to stderr when the run ends",
+    )
+
+    parser.add_argument(
+        "--stats-textfile",
+        metavar="PATH",
+        help="Write per-phase timings and counters as a Prometheus node-exporter textfile",
+    )
+
+    parser.add_argument(
+        "--profile",
+        action="store_true",
+        help="Run under cProfile and write the statistics to a .pstats file",
+    )
+
+    parser.add_argument(
+        "--profile-output",
+        metavar="PATH",
+        default="tidydir.pstats",
+        help="File the --profile statistics are written to (default: tidydir.pstats)",
+    )
+
+    parser.add_argument(
+        "--memory-report",
+        action="store_true",
+        help="Measure memory per planned file for each phase and exit without moving files",
+    )
+
+    parser.add_argument(
+        "--estimate",
+        action="store_true",
+        help="Estimate file count, size, category mix and run time by sampling, then exit",
+    )
+
+    parser.add_argument(
+        "--estimate-seconds",
+        type=float,
+        default=2.0,
+        metavar="SECONDS",
+        help="Time budget for --estimate (default: 2)",
+    )
+
+    parser.add_argument(
+        "--estimate-entries",
+        type=int,
+        default=100_000,
+        metavar="N",
+        help="Budget of directory entries and stat calls for --estimate (default: 100000)",
+    )
+
+    parser.add_argument(
+        "--batch",
+        metavar="MANIFEST",
+        help="Organize every root listed in a JSON manifest instead of SOURCE, without "
+        "asking for confirmation",
+    )
+
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=8,
+        metavar="N",
+        help="Worker threads shared by all roots in --batch mode (default: 8)",
+    )
+
+    parser.add_argument(
+        "--view",
+        choices=LINK_MODES,
+        help="Build a categorized view in the target directory using links instead of "
+        "moving files; hardlink views never delete the last copy of a file, so a replaced "
+        "source keeps its old link and gets a new one named NAME_1",
+    )
+
     return parser
 
 
+def run_view(organizer: FileOrganizer, mode: str, preview: bool) -> int:
+    """
+    Build or update a link view of the source directory.
+
+    Args:
+        organizer: Configured organizer whose target directory holds the view
+        mode: Link mode to use
+        preview: Only report the changes without touching the view
+
+    Returns:
+        Exit code
+    """
+    from tidydir.view import LinkMode, ViewBuilder
+
+    try:
+        builder = ViewBuilder(organizer, LinkMode(mode))
+    except ValueError as e:
+        print(f"❌ Error: {e}")
+        return 1
+
+    if preview:
+        diff = builder.diff()
+        print("\n=== VIEW PREVIEW ===\n")
+        print(f"Links to create: {len(diff.create)}")
+        print(f"Links to keep: {len(diff.keep)}")
+        print(f"Links to remove: {len(diff.remove)}")
+        print("\n(Preview mode - the view was not changed)")
+        return 0
+
+    result = builder.sync()
+    print(
+        f"\n✅ View updated: {result.created_count} created, {result.kept_count} kept, "
+        f"{result.removed_count} removed"
+    )
+    if result.errors:
+        print(f"\n❌ Errors: {len(result.errors)} entries failed")
+        for file_path, error in result.errors[:5]:
+            print(f"  {file_path.name}: {error}")
+        if len(result.errors) > 5:
+            print(f"  ... and {len(result.errors) - 5} more")
+        return 1
+    return 0
+
+
 def confirm_action(prompt: str = "Proceed? (yes/no): ") -> bool:
     """
     Ask user for confirmation.
@@ -61,10 +351,15 @@ def confirm_action(prompt: str = "Proceed? (yes/no): ") -> bool:
         prompt: The prompt to display
 
     Returns:
-        True if user confirms, False otherwise
+        True if user confirms, False otherwise or when stdin is exhausted
     """
     while True:
-        response = input(prompt).lower().strip()
+        try:
+            response = input(prompt).lower().strip()
+        except EOFError:
+            # Nobody to ask, e.g. when stdin carries the --files-from list
+            print()
+            return False
         if response in ("yes", "y"):
             return True
         elif response in ("no", "n"):
@@ -75,19 +370,106 @@ def confirm_action(prompt: str = "Proceed? (yes/no): ") -> bool:
 
 def main() -> int:
     """Main entry point for the CLI."""
+    # Answer --version without building the parser
+    if sys.argv[1:] in (["--version"], ["-v"]):
+        print(f"tidydir {__version__}")
+        return 0
+
     parser = create_parser()
     args = parser.parse_args()
+    if (args.source is None) == (args.batch is None):
+        parser.error("specify either a source directory or --batch MANIFEST")
+    if args.null and not args.files_from:
+        parser.error("--null requires --files-from")
+    if args.files_from:
+        for option, value in (
+            ("--batch", args.batch),
+            ("--view", args.view),
+            ("--estimate", args.estimate),
+            ("--memory-report", args.memory_report),
+            ("--lock", args.lock),
+        ):
+            if value:
+                parser.error(f"--files-from cannot be used with {option}")
+    if args.max_per_dir is not None and args.max_per_dir < 1:
+        parser.error("--max-per-dir must be positive")
+    if args.reshard:
+        if args.max_per_dir is None:
+            parser.error("--reshard requires --max-per-dir")
+        for option, value in (
+            ("--batch", args.batch),
+            ("--files-from", args.files_from),
+            ("--view", args.view),
+            ("--estimate", args.estimate),
+            ("--memory-report", args.memory_report),
+            ("--lock", args.lock),
+            ("--format", args.format != "text"),
+        ):
+            if value:
+                parser.error(f"--reshard cannot be used with {option}")
+    if args.view:
+        for option, value in (
+            ("--archive-format", args.archive_format),
+            ("--processes", args.processes != 1),
+            ("--move-workers", args.move_workers),
+            ("--max-per-dir", args.max_per_dir is not None),
+        ):
+            if value:
+                parser.error(f"--view cannot be used with {option}")
+
+    if args.profile:
+        return run_profiled(args)
+    return run(args)
+
+
+def run_profiled(args: argparse.Namespace) -> int:
+    """
+    Run the CLI under cProfile and dump the statistics.
+
+    Args:
+        args: Parsed command-line arguments
+
+    Returns:
+        Exit code of the profiled run
+    """
+    import cProfile
+
+    profiler = cProfile.Profile()
+    try:
+        return profiler.runcall(run, args)
+    finally:
+        profiler.dump_stats(args.profile_output)
+        print(f"Profile written to {args.profile_output}", file=sys.stderr)
+
+
+def run(args: argparse.Namespace) -> int:
+    """
+    Run the CLI with parsed arguments.
+
+    Args:
+        args: Parsed command-line arguments
+
+    Returns:
+        Exit code
+    """
+    if args.batch:
+        return run_batch(args)
 
     # Validate source directory
-    source_path = Path(args.source)
-    if not source_path.exists():
-        print(f"❌ Error: Source directory does not exist: {source_path}")
+    if not os.path.exists(args.source):
+        print(f"❌ Error: Source directory does not exist: {args.source}")
         return 1
 
-    if not source_path.is_dir():
-        print(f"❌ Error: Source path is not a directory: {source_path}")
+    if not os.path.isdir(args.source):
+        from tidydir.archive_source import is_archive
+
+        if is_archive(args.source):
+            return run_archive(args)
+        print(f"❌ Error: Source path is not a directory: {args.source}")
         return 1
 
+    from tidydir.organizer import FileOrganizer
+
     # Create organizer
     try:
         organizer = FileOrganizer(
@@ -96,11 +478,274 @@ def main() -> int:
             include_subdirs=args.subdirs,
             old_files_days=args.days,
             enable_logging=args.log,
+            log_format=args.log_format,
+            log_console=args.log_console,
+            show_progress=args.progress,
+            processes=args.processes,
+            lock=args.lock,
+            archive_layout=args.archive_layout,
+            archive_format=args.archive_format,
+            max_per_dir=args.max_per_dir,
+            shard_by=args.shard_by,
+            move_workers=args.move_workers,
+            large_workers=args.large_workers,
+            large_file_size=args.large_file_mb * 1024 * 1024,
+        )
+    except Exception as e:
+        print(f"❌ Error initializing organizer: {e}")
+        return 1
+
+    try:
+        if not args.files_from:
+            return organize(organizer, args)
+        from tidydir._paths import read_path_list
+
+        try:
+            file_list = open_file_list(args.files_from)
+        except OSError as e:
+            print(f"❌ Error reading file list: {e}")
+            return 1
+        with file_list as stream:
+            return organize(organizer, args, read_path_list(stream, args.null))
+    finally:
+        report_stats(organizer.stats, str(organizer.source_dir), args)
+
+
+def open_file_list(path: str) -> AbstractContextManager[BinaryIO]:
+    """
+    Open the file list given to --files-from.
+
+    Args:
+        path: Path of the list, or ``-`` for stdin
+
+    Returns:
+        Context manager of the binary stream; stdin is left open on exit
+
+    Raises:
+        OSError: If the list cannot be opened
+    """
+    if path == "-":
+        import contextlib
+
+        return contextlib.nullcontext(sys.stdin.buffer)
+    return open(path, "rb")
+
+
+def run_archive(args: argparse.Namespace) -> int:
+    """
+    Organize the members of a tar or zip archive without extracting it first.
+
+    Args:
+        args: Parsed command-line arguments
+
+    Returns:
+        Exit code
+    """
+    unsupported = [
+        option
+        for option, value in (
+            ("--archive-format", args.archive_format),
+            ("--view", args.view),
+            ("--estimate", args.estimate),
+            ("--memory-report", args.memory_report),
+            ("--lock", args.lock),
+            ("--files-from", args.files_from),
+            ("--reshard", args.reshard),
+            ("--format", args.format != "text"),
+        )
+        if value
+    ]
+    if unsupported:
+        print(f"❌ Error: {', '.join(unsupported)} cannot be used with an archive source")
+        return 1
+
+    from tidydir.archive_source import ArchiveSource, default_target
+    from tidydir.organizer import FileOrganizer
+
+    try:
+        organizer = FileOrganizer(
+            source_dir=args.source,
+            target_dir=args.target or default_target(args.source),
+            include_subdirs=args.subdirs,
+            old_files_days=args.days,
+            enable_logging=args.log,
+            log_format=args.log_format,
+            log_console=args.log_console,
+            archive_layout=args.archive_layout,
+            max_per_dir=args.max_per_dir,
+            shard_by=args.shard_by,
         )
+        source = ArchiveSource(organizer)
     except Exception as e:
         print(f"❌ Error initializing organizer: {e}")
         return 1
 
+    try:
+        issues = organizer.check_permissions()
+        if issues:
+            print("❌ Permission issues detected:")
+            for issue in issues:
+                print(f"  - {issue}")
+            return 1
+
+        # Reading the archive to preview it is a pass of its own; a tar
+        # archive is read again when it is organized
+        try:
+            plan = source.plan()
+            organizer.print_preview(plan)
+        except Exception as e:
+            print(f"❌ Error during preview: {e}")
+            return 1
+
+        if not plan:
+            print("\nNo files to organize.")
+            return 0
+
+        if not check_space(organizer, plan, args):
+            return 1
+
+        if args.preview:
+            print("\n(Preview mode - no files were extracted)")
+            return 0
+
+        if not args.yes and not confirm_action("\nProceed with organization? (yes/no): "):
+            print("Operation cancelled")
+            return 0
+
+        try:
+            result = source.execute(plan)
+        except KeyboardInterrupt:
+            print("\n\n⚠️  Operation interrupted by user")
+            return 130
+        except Exception as e:
+            print(f"\n❌ Error during execution: {e}")
+            return 1
+        return 0 if result.moved_count == result.total_count else 1
+    finally:
+        report_stats(organizer.stats, str(organizer.source_dir), args)
+
+
+def run_batch(args: argparse.Namespace) -> int:
+    """
+    Organize every root of a batch manifest.
+
+    Args:
+        args: Parsed command-line arguments
+
+    Returns:
+        Exit code; 1 if any root failed or had errors
+    """
+    from tidydir.batch import BatchRunner, load_manifest
+
+    try:
+        entries = load_manifest(args.batch)
+        runner = BatchRunner(
+            entries,
+            args.workers,
+            preview=args.preview,
+            log_console=args.log_console,
+            check_space=not args.ignore_space,
+        )
+    except (OSError, ValueError) as e:
+        print(f"❌ Error reading manifest: {e}")
+        return 1
+
+    try:
+        results = runner.run()
+    finally:
+        report_stats(runner.stats, str(args.batch), args)
+
+    failed = False
+    verb = "planned" if args.preview else "organized"
+    for item in results:
+        result = item.result
+        if item.error:
+            failed = True
+            print(f"❌ {item.entry.source}: {item.error}")
+        elif result.errors:
+            failed = True
+            print(
+                f"⚠️  {item.entry.source}: {result.moved_count}/{result.total_count} files "
+                f"{verb}, {len(result.errors)} errors"
+            )
+        else:
+            count = result.total_count if args.preview else result.moved_count
+            print(f"✅ {item.entry.source}: {count} files {verb}")
+
+    total = sum(item.result.total_count for item in results)
+    moved = sum(item.result.moved_count for item in results)
+    if args.preview:
+        print(f"\n{len(results)} roots, {total} files planned (Preview mode - no files were moved)")
+    else:
+        print(f"\n{len(results)} roots, {moved}/{total} files organized")
+    return 1 if failed else 0
+
+
+def report_stats(stats: RunStats, source: str, args: argparse.Namespace) -> None:
+    """
+    Emit the run statistics requested on the command line.
+
+    Args:
+        stats: Statistics of the run
+        source: Source directory or manifest, used as a metric label
+        args: Parsed command-line arguments
+    """
+    if args.stats:
+        print(stats.render(args.stats), file=sys.stderr)
+
+    if args.stats_textfile:
+        labels = {"source": source}
+        try:
+            stats.write_textfile(args.stats_textfile, labels)
+        except OSError as e:
+            print(f"⚠️  Could not write stats textfile: {e}", file=sys.stderr)
+
+
+def check_space(organizer: FileOrganizer, plan: CompactPlan, args: argparse.Namespace) -> bool:
+    """
+    Report target devices that lack room for a plan.
+
+    Args:
+        organizer: Configured organizer
+        plan: Plan about to be executed
+        args: Parsed command-line arguments
+
+    Returns:
+        False if the run must stop: something is short, and the run is
+        neither a preview nor told to --ignore-space
+    """
+    issues = organizer.check_space(plan)
+    if not issues:
+        return True
+    refuse = not args.preview and not args.ignore_space
+    print(
+        "\n❌ Not enough room on the target:" if refuse else "\n⚠️  Not enough room on the target:"
+    )
+    for issue in issues:
+        print(f"  - {issue}")
+    if refuse:
+        print("Nothing was moved; use --ignore-space to run anyway")
+    return not refuse
+
+
+def organize(
+    organizer: FileOrganizer, args: argparse.Namespace, paths: Iterable[str] | None = None
+) -> int:
+    """
+    Preview and, unless in preview mode, execute the organization.
+
+    The plan that is previewed and checked for space is the one executed,
+    so files that appear after the preview are left for the next run.
+
+    Args:
+        organizer: Configured organizer
+        args: Parsed command-line arguments
+        paths: Files to organize instead of scanning the source; ignored
+            with --reshard
+
+    Returns:
+        Exit code
+    """
     # Check permissions
     issues = organizer.check_permissions()
     if issues:
@@ -109,9 +754,44 @@ def main() -> int:
             print(f"  - {issue}")
         return 1
 
+    if args.memory_report:
+        from tidydir.memory import profile_memory
+
+        print(profile_memory(organizer).to_text())
+        return 0
+
+    if args.estimate:
+        from tidydir.estimate import estimate
+
+        report = estimate(organizer, args.estimate_seconds, args.estimate_entries)
+        print(report.to_text() if args.format == "text" else report.to_json())
+        return 0
+
+    # Link view mode never moves files, so it needs no confirmation
+    if args.view:
+        return run_view(organizer, args.view, args.preview)
+
+    # Machine-readable previews never move files
+    if args.format != "text":
+        from tidydir.output import stream_preview
+
+        try:
+            stream_preview(organizer, args.format, paths=paths)
+        except Exception as e:
+            print(f"❌ Error during preview: {e}", file=sys.stderr)
+            return 1
+        return 0
+
     # Preview operations
     try:
-        operations = organizer.preview()
+        if args.reshard:
+            from tidydir.sharding import plan_reshard
+
+            operations = plan_reshard(organizer)
+        elif paths is None:
+            operations = organizer.plan()
+        else:
+            operations = organizer.plan_paths(paths)
         organizer.print_preview(operations)
     except Exception as e:
         print(f"❌ Error during preview: {e}")
@@ -122,19 +802,23 @@ def main() -> int:
         print("\nNo files to organize.")
         return 0
 
+    # Refuse before moving anything rather than fail halfway
+    if not check_space(organizer, operations, args):
+        return 1
+
     # If preview mode, exit here
     if args.preview:
         print("\n(Preview mode - no files were moved)")
         return 0
 
     # Confirm action
-    if not confirm_action("\nProceed with organization? (yes/no): "):
+    if not args.yes and not confirm_action("\nProceed with organization? (yes/no): "):
         print("Operation cancelled")
         return 0
 
-    # Execute organization
+    # Execute the plan that was previewed and checked for space
     try:
-        result = organizer.execute()
+        result = organizer.execute(operations)
     except KeyboardInterrupt:
         print("\n\n⚠️  Operation interrupted by user")
         return 130  # Standard exit code for SIGINT
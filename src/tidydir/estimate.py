@@ -0,0 +1,388 @@
+"""Sampling-based estimates of a run's size and duration."""
+
+from __future__ import annotations
+
+import json
+import math
+import os
+import random
+import shutil
+import statistics
+import tempfile
+import time
+from collections import Counter
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+from tidydir._paths import is_log_file, join, split_ext
+from tidydir.categories import FileCategory
+from tidydir.progress import format_duration, format_size
+
+if TYPE_CHECKING:
+    from tidydir.organizer import FileOrganizer
+
+# Default sampling budget
+DEFAULT_SECONDS = 2.0
+DEFAULT_ENTRIES = 100_000
+
+# Files stat()ed per directory visit
+STATS_PER_VISIT = 16
+
+# Upper bound on random walks, reached only on small, fully cached trees
+MAX_PROBES = 5_000
+
+# Two-sided 95% interval under the normal approximation
+Z_95 = 1.96
+
+
+@dataclass
+class Estimate:
+    """An estimated quantity with a 95% confidence interval."""
+
+    value: float
+    low: float
+    high: float
+
+    @classmethod
+    def from_samples(cls, samples: list[float]) -> Estimate:
+        """
+        Estimate a mean from independent samples.
+
+        Args:
+            samples: Unbiased per-probe estimates
+
+        Returns:
+            The mean with its confidence interval
+        """
+        if not samples:
+            return cls(0.0, 0.0, 0.0)
+        mean = math.fsum(samples) / len(samples)
+        if len(samples) < 2:
+            return cls(mean, mean, mean)
+        half_width = Z_95 * statistics.stdev(samples) / math.sqrt(len(samples))
+        return cls(mean, max(0.0, mean - half_width), mean + half_width)
+
+    def scaled(self, factor: float) -> Estimate:
+        """Multiply the estimate and its interval by a constant."""
+        return Estimate(self.value * factor, self.low * factor, self.high * factor)
+
+
+@dataclass
+class EstimateReport:
+    """Estimated size, category mix and duration of a run."""
+
+    files: Estimate
+    bytes: Estimate
+    old_files: Estimate
+    categories: dict[str, Estimate]
+    projected_seconds: Estimate
+    seconds_per_file: float
+    seconds_per_move: float | None
+    probes: int
+    directories_listed: int
+    entries_listed: int
+    files_statted: int
+    elapsed: float
+    notes: list[str] = field(default_factory=list)
+
+    def to_dict(self) -> dict[str, Any]:
+        """Return the report as plain data."""
+        return asdict(self)
+
+    def to_json(self) -> str:
+        """Return the report as a JSON document."""
+        return json.dumps(self.to_dict(), indent=2)
+
+    def to_text(self) -> str:
+        """Return the report as human-readable text."""
+
+        def count(e: Estimate) -> str:
+            return f"~{e.value:,.0f} (95% CI {e.low:,.0f} – {e.high:,.0f})"
+
+        def size(e: Estimate) -> str:
+            return (
+                f"~{format_size(e.value)} " f"(95% CI {format_size(e.low)} – {format_size(e.high)})"
+            )
+
+        lines = [
+            "=== ESTIMATE ===",
+            f"Files:      {count(self.files)}",
+            f"Size:       {size(self.bytes)}",
+            f"Old files:  {count(self.old_files)}",
+            "",
+            "Files by category:",
+        ]
+        total = self.files.value or 1.0
+        for name, e in self.categories.items():
+            lines.append(f"  {name}: {count(e)}  {100 * e.value / total:.1f}%")
+        lines += [
+            "",
+            f"Projected run time: ~{format_duration(self.projected_seconds.value)} "
+            f"(95% CI {format_duration(self.projected_seconds.low)} – "
+            f"{format_duration(self.projected_seconds.high)})",
+            f"Sampled {self.probes} walks, {self.directories_listed} directories, "
+            f"{self.entries_listed} entries and {self.files_statted} stat calls "
+            f"in {self.elapsed:.2f}s",
+        ]
+        lines += [f"Note: {note}" for note in self.notes]
+        return "\n".join(lines)
+
+
+@dataclass
+class _Listing:
+    """Cached contents of one directory."""
+
+    names: list[str]
+    subdirs: list[str]
+    categories: Counter[FileCategory]
+
+
+class TreeSampler:
+    """
+    Estimate a tree's totals from random walks.
+
+    Each walk starts at the source directory and descends into a randomly
+    chosen subdirectory until it reaches a leaf. Every directory on the way
+    contributes its totals weighted by the product of the branching factors
+    above it, which gives an unbiased estimate of the whole tree (Knuth's
+    search-tree estimator). Walks are repeated until the budget runs out and
+    their spread gives the confidence intervals. Sizes and ages come from a
+    random sample of each visited directory's files.
+
+    Directory listings are cached and always read completely, so a single
+    huge directory may exceed the entry budget once.
+    """
+
+    def __init__(
+        self,
+        organizer: FileOrganizer,
+        max_seconds: float = DEFAULT_SECONDS,
+        max_entries: int = DEFAULT_ENTRIES,
+        seed: int | None = None,
+    ) -> None:
+        """
+        Initialize the TreeSampler.
+
+        Args:
+            organizer: Organizer whose source and rules are sampled
+            max_seconds: Time budget for sampling
+            max_entries: Budget of directory entries listed plus files stat()ed
+            seed: Seed for reproducible sampling
+
+        Raises:
+            ValueError: If the organizer is not on the local file system
+        """
+        if not organizer.fs.local:
+            raise ValueError("Estimates sample the local file system")
+        self.organizer = organizer
+        self.max_seconds = max_seconds
+        self.max_entries = max_entries
+        self._random = random.Random(seed)
+        self._cutoff = organizer.old_files_cutoff.timestamp()
+        self._listings: dict[str, _Listing] = {}
+        self._stats: dict[str, tuple[int, bool]] = {}
+        self._entries = 0
+        self._list_seconds = 0.0
+        self._stat_seconds = 0.0
+
+    def _list(self, directory: str) -> _Listing:
+        """List a directory once, classifying its files."""
+        listing = self._listings.get(directory)
+        if listing is not None:
+            return listing
+
+        ext_map = self.organizer.ext_to_category
+        recursive = self.organizer.include_subdirs
+        names: list[str] = []
+        subdirs: list[str] = []
+        categories: Counter[FileCategory] = Counter()
+        started = time.perf_counter()
+        try:
+            with os.scandir(directory) as entries:
+                for entry in entries:
+                    self._entries += 1
+                    try:
+                        if entry.is_file():
+                            if not is_log_file(entry.name):
+                                names.append(entry.name)
+                                ext = split_ext(entry.name)[1].lower()
+                                categories[ext_map.get(ext, FileCategory.FILES)] += 1
+                        elif recursive and entry.is_dir(follow_symlinks=False):
+                            subdirs.append(entry.path)
+                    except OSError:
+                        continue
+        except OSError:
+            pass
+        self._list_seconds += time.perf_counter() - started
+
+        listing = self._listings[directory] = _Listing(names, subdirs, categories)
+        return listing
+
+    def _stat(self, path: str) -> tuple[int, bool]:
+        """Get a file's size and whether it is old, once per file."""
+        cached = self._stats.get(path)
+        if cached is not None:
+            return cached
+        started = time.perf_counter()
+        try:
+            st = os.stat(path)
+            result = (st.st_size, st.st_mtime < self._cutoff)
+        except OSError:
+            # Unreadable files count as empty and not old, as in a real run
+            result = (0, False)
+        self._stat_seconds += time.perf_counter() - started
+        self._entries += 1
+        self._stats[path] = result
+        return result
+
+    def _walk(self) -> tuple[float, float, float, dict[FileCategory, float]]:
+        """Do one random walk and return its estimate of the tree's totals."""
+        directory = str(self.organizer.source_dir)
+        weight = 1.0
+        files = size = old = 0.0
+        categories: dict[FileCategory, float] = {}
+        while True:
+            listing = self._list(directory)
+            if listing.names:
+                count = len(listing.names)
+                sample = self._random.sample(listing.names, min(count, STATS_PER_VISIT))
+                stats = [self._stat(join(directory, name)) for name in sample]
+                files += weight * count
+                size += weight * count * sum(s for s, _ in stats) / len(stats)
+                old += weight * count * sum(o for _, o in stats) / len(stats)
+                for category, n in listing.categories.items():
+                    categories[category] = categories.get(category, 0.0) + weight * n
+            if not listing.subdirs:
+                break
+            weight *= len(listing.subdirs)
+            directory = self._random.choice(listing.subdirs)
+        return files, size, old, categories
+
+    def run(self) -> EstimateReport:
+        """
+        Sample until the budget is spent.
+
+        Returns:
+            The estimate report
+        """
+        started = time.perf_counter()
+        walks: list[tuple[float, float, float, dict[FileCategory, float]]] = []
+        while len(walks) < MAX_PROBES:
+            walks.append(self._walk())
+            elapsed = time.perf_counter() - started
+            if len(walks) >= 2 and (
+                elapsed >= self.max_seconds or self._entries >= self.max_entries
+            ):
+                break
+        elapsed = time.perf_counter() - started
+
+        files = Estimate.from_samples([w[0] for w in walks])
+        categories = {
+            category.value: Estimate.from_samples([w[3].get(category, 0.0) for w in walks])
+            for category in sorted({c for w in walks for c in w[3]})
+        }
+
+        # Planning cost per file: listing plus one stat call
+        entries = sum(
+            len(listing.names) + len(listing.subdirs) for listing in self._listings.values()
+        )
+        seconds_per_file = self._list_seconds / max(1, entries) + self._stat_seconds / max(
+            1, len(self._stats)
+        )
+        seconds_per_move = measure_move_cost(self.organizer.target_dir)
+        per_file = seconds_per_file + (seconds_per_move or 0.0)
+
+        notes: list[str] = []
+        if seconds_per_move is None:
+            notes.append("could not time renames in the target; projection covers planning only")
+        if _device(self.organizer.source_dir) != _device(self.organizer.target_dir):
+            notes.append(
+                "source and target are on different devices; moves copy data and the "
+                "projection does not include copy time"
+            )
+
+        return EstimateReport(
+            files=files,
+            bytes=Estimate.from_samples([w[1] for w in walks]),
+            old_files=Estimate.from_samples([w[2] for w in walks]),
+            categories=categories,
+            projected_seconds=files.scaled(per_file),
+            seconds_per_file=seconds_per_file,
+            seconds_per_move=seconds_per_move,
+            probes=len(walks),
+            directories_listed=len(self._listings),
+            entries_listed=entries,
+            files_statted=len(self._stats),
+            elapsed=elapsed,
+            notes=notes,
+        )
+
+
+def _existing_ancestor(path: Path) -> Path:
+    """Get the closest existing directory at or above a path."""
+    while not path.exists() and path.parent != path:
+        path = path.parent
+    return path
+
+
+def _device(path: Path) -> int | None:
+    """Get the device id of a path's closest existing ancestor."""
+    try:
+        return _existing_ancestor(path).stat().st_dev
+    except OSError:
+        return None
+
+
+def measure_move_cost(target_dir: Path, repeats: int = 20) -> float | None:
+    """
+    Time same-device renames in the target file system.
+
+    A scratch directory is created next to the target and removed again.
+
+    Args:
+        target_dir: Target directory of the run; need not exist yet
+        repeats: Number of renames to time
+
+    Returns:
+        Seconds per rename, or None if the target is not writable
+    """
+    try:
+        scratch = tempfile.mkdtemp(prefix=".tidydir-estimate-", dir=_existing_ancestor(target_dir))
+    except OSError:
+        return None
+    try:
+        a, b = os.path.join(scratch, "a"), os.path.join(scratch, "b")
+        open(a, "wb").close()
+        started = time.perf_counter()
+        for _ in range(repeats // 2):
+            os.rename(a, b)
+            os.rename(b, a)
+        return (time.perf_counter() - started) / (2 * (repeats // 2))
+    except OSError:
+        return None
+    finally:
+        shutil.rmtree(scratch, ignore_errors=True)
+
+
+def estimate(
+    organizer: FileOrganizer,
+    max_seconds: float = DEFAULT_SECONDS,
+    max_entries: int = DEFAULT_ENTRIES,
+    seed: int | None = None,
+) -> EstimateReport:
+    """
+    Estimate a run without planning every file.
+
+    Uses the same classification and age rules as ``FileOrganizer.plan``.
+
+    Args:
+        organizer: Organizer to estimate
+        max_seconds: Time budget for sampling
+        max_entries: Budget of directory entries listed plus files stat()ed
+        seed: Seed for reproducible sampling
+
+    Returns:
+        The estimate report
+    """
+    return TreeSampler(organizer, max_seconds, max_entries, seed).run()
@@ -0,0 +1,357 @@
+"""File system backends the organizer plans and moves files on."""
+
+from __future__ import annotations
+
+import errno
+import os
+import stat
+import time
+from abc import ABC, abstractmethod
+from collections.abc import Iterator
+from pathlib import Path
+from typing import Protocol
+
+from tidydir._paths import (
+    LOCK_DIR_NAME,
+    is_log_file,
+    join,
+    list_subdirs,
+    move_file,
+    scan_files,
+)
+
+
+class FileStat(Protocol):
+    """The parts of ``os.stat_result`` that planning uses."""
+
+    @property
+    def st_mode(self) -> int:
+        """File type and permissions."""
+        ...
+
+    @property
+    def st_size(self) -> int:
+        """Size in bytes."""
+        ...
+
+    @property
+    def st_mtime(self) -> float:
+        """Modification time in seconds since the epoch."""
+        ...
+
+
+class FileEntry(Protocol):
+    """The parts of ``os.DirEntry`` that planning uses."""
+
+    @property
+    def name(self) -> str:
+        """File name without directory."""
+        ...
+
+    @property
+    def path(self) -> str:
+        """Full path of the file."""
+        ...
+
+    def stat(self) -> FileStat:
+        """Get the file's status."""
+        ...
+
+
+class FileSystem(ABC):
+    """
+    Operations the organizer performs on the files it plans and moves.
+
+    Subclasses implement scanning, stat, existence checks, directory
+    creation and moves; a backend that leaves one out cannot be created.
+    Paths are plain ``str`` in the backend's own syntax. Permission checks,
+    locking, logging, packing and parallel planning always use the local
+    disk, so they need a ``local`` backend.
+    """
+
+    # Whether paths refer to the local disk
+    local = False
+
+    @abstractmethod
+    def resolve(self, path: str | Path) -> Path:
+        """Make a path absolute in this file system."""
+
+    @abstractmethod
+    def scan(self, root: str, recursive: bool) -> Iterator[tuple[str, FileEntry]]:
+        """
+        Yield the regular files below a directory, like ``scan_files``.
+
+        Raises:
+            OSError: If ``root`` itself cannot be listed
+        """
+
+    @abstractmethod
+    def list_subdirs(self, root: str) -> list[str]:
+        """
+        Get the subdirectories of a directory in scan order, like ``list_subdirs``.
+
+        Raises:
+            OSError: If ``root`` cannot be listed
+        """
+
+    @abstractmethod
+    def count_entries(self, path: str, limit: int | None = None) -> int:
+        """
+        Count the entries of a directory, files and subdirectories alike.
+
+        Args:
+            path: Directory path
+            limit: Stop counting at this many entries
+
+        Returns:
+            Number of entries, at most ``limit``; 0 if the directory does not exist
+
+        Raises:
+            OSError: If the directory exists but cannot be listed
+        """
+
+    @abstractmethod
+    def stat(self, path: str) -> os.stat_result:
+        """
+        Get the status of a file, following symlinks.
+
+        Raises:
+            OSError: If the path does not exist
+        """
+
+    @abstractmethod
+    def exists(self, path: str) -> bool:
+        """Check whether anything, even a broken symlink, exists at a path."""
+
+    @abstractmethod
+    def makedirs(self, path: str) -> None:
+        """
+        Create a directory and its parents; existing ones are fine.
+
+        Raises:
+            OSError: If a component exists and is not a directory
+        """
+
+    @abstractmethod
+    def move(self, source: str, target: str) -> None:
+        """
+        Move a file into an existing directory, never replacing a file there.
+
+        Raises:
+            FileExistsError: If something already exists at the target
+            OSError: If the file could not be moved
+        """
+
+
+class LocalFileSystem(FileSystem):
+    """The local disk; every operation is the ``os`` call planning used before."""
+
+    local = True
+
+    # Plain functions, so the hot loops pay no extra call per file
+    scan = staticmethod(scan_files)
+    list_subdirs = staticmethod(list_subdirs)
+    stat = staticmethod(os.stat)
+    exists = staticmethod(os.path.lexists)
+    move = staticmethod(move_file)
+
+    def resolve(self, path: str | Path) -> Path:
+        """Make a path absolute, resolving symlinks."""
+        return Path(path).resolve()
+
+    def count_entries(self, path: str, limit: int | None = None) -> int:
+        """Count the entries of a directory, listing no more than ``limit``."""
+        count = 0
+        try:
+            with os.scandir(path) as it:
+                for _ in it:
+                    count += 1
+                    if count == limit:
+                        break
+        except FileNotFoundError:
+            return 0
+        return count
+
+    def makedirs(self, path: str) -> None:
+        """Create a directory and its parents."""
+        os.makedirs(path, exist_ok=True)
+
+
+class MemoryEntry:
+    """A file of a ``MemoryFileSystem``; it is its own stat result."""
+
+    __slots__ = ("path", "name", "st_size", "st_mtime")
+
+    st_mode = stat.S_IFREG | 0o644
+
+    def __init__(self, path: str, name: str, size: int, mtime: float) -> None:
+        """
+        Initialize the MemoryEntry.
+
+        Args:
+            path: Full path of the file
+            name: File name without directory
+            size: Size in bytes
+            mtime: Modification time in seconds since the epoch
+        """
+        self.path = path
+        self.name = name
+        self.st_size = size
+        self.st_mtime = mtime
+
+    def stat(self) -> MemoryEntry:
+        """Get the file's status."""
+        return self
+
+
+class _Directory:
+    """Files and subdirectories of one directory, in creation order."""
+
+    __slots__ = ("files", "subdirs")
+
+    def __init__(self) -> None:
+        self.files: dict[str, MemoryEntry] = {}
+        self.subdirs: dict[str, None] = {}
+
+
+def _error(code: int, path: str) -> OSError:
+    """Build the error ``os`` raises for an error code and path."""
+    return OSError(code, os.strerror(code), path)
+
+
+class MemoryFileSystem(FileSystem):
+    """
+    A file tree held in dictionaries, for tests and I/O-free benchmarks.
+
+    Each file is a name with a size and an mtime, and there is no file
+    data. Directories keep their entries in creation order, which plays
+    the role of listing order. Paths use the local ``os.sep`` syntax and
+    are made absolute against the working directory, without touching
+    the disk. Files are also indexed by full path, so existence checks
+    and stat are single dict lookups.
+    """
+
+    def __init__(self) -> None:
+        """Initialize an empty file system."""
+        self._dirs: dict[str, _Directory] = {}
+        self._files: dict[str, MemoryEntry] = {}
+
+    def resolve(self, path: str | Path) -> Path:
+        """Make a path absolute without resolving symlinks."""
+        return Path(os.path.abspath(path))
+
+    def add_file(self, path: str | Path, size: int = 0, mtime: float | None = None) -> None:
+        """
+        Create a file and its parent directories; an existing file is replaced.
+
+        Args:
+            path: Path of the file
+            size: Size in bytes
+            mtime: Modification time (defaults to now)
+
+        Raises:
+            OSError: If the path is a directory, or a parent is a file
+        """
+        path = os.path.abspath(path)
+        if path in self._dirs:
+            raise _error(errno.EISDIR, path)
+        directory, name = os.path.split(path)
+        self.makedirs(directory)
+        entry = MemoryEntry(path, name, size, time.time() if mtime is None else mtime)
+        self._dirs[directory].files[name] = self._files[path] = entry
+
+    def listdir(self, path: str | Path) -> list[str]:
+        """
+        List the names in a directory, files first, in creation order.
+
+        Raises:
+            FileNotFoundError: If the directory does not exist
+        """
+        directory = self._dirs.get(os.path.abspath(path))
+        if directory is None:
+            raise _error(errno.ENOENT, str(path))
+        return [*directory.files, *directory.subdirs]
+
+    def scan(self, root: str, recursive: bool) -> Iterator[tuple[str, MemoryEntry]]:
+        """Yield the files below a directory, depth first in creation order."""
+        if root not in self._dirs:
+            raise _error(errno.ENOENT, root)
+        pending = [root]
+        while pending:
+            path = pending.pop()
+            directory = self._dirs[path]
+            # Listed up front, so files may be moved while the scan runs
+            for entry in list(directory.files.values()):
+                if not is_log_file(entry.name):
+                    yield path, entry
+            if recursive:
+                pending.extend(
+                    join(path, name)
+                    for name in reversed(directory.subdirs)
+                    if name != LOCK_DIR_NAME
+                )
+
+    def list_subdirs(self, root: str) -> list[str]:
+        """Get the subdirectories of a directory."""
+        directory = self._dirs.get(root)
+        if directory is None:
+            raise _error(errno.ENOENT, root)
+        return [join(root, name) for name in directory.subdirs if name != LOCK_DIR_NAME]
+
+    def count_entries(self, path: str, limit: int | None = None) -> int:
+        """Count the files and subdirectories of a directory."""
+        directory = self._dirs.get(path)
+        if directory is None:
+            return 0
+        count = len(directory.files) + len(directory.subdirs)
+        return count if limit is None else min(count, limit)
+
+    def stat(self, path: str) -> os.stat_result:
+        """Get the status of a file or directory."""
+        if path in self._dirs:
+            return os.stat_result((stat.S_IFDIR | 0o755, 0, 0, 1, 0, 0, 0, 0, 0, 0))
+        entry = self._files.get(path)
+        if entry is None:
+            raise _error(errno.ENOENT, path)
+        mtime = entry.st_mtime
+        return os.stat_result(
+            (entry.st_mode, 0, 0, 1, 0, 0, entry.st_size, int(mtime), int(mtime), int(mtime)),
+            {"st_atime": mtime, "st_mtime": mtime, "st_ctime": mtime},
+        )
+
+    def exists(self, path: str) -> bool:
+        """Check whether a file or directory exists."""
+        return path in self._files or path in self._dirs
+
+    def makedirs(self, path: str) -> None:
+        """Create a directory and its parents."""
+        missing = []
+        while path not in self._dirs:
+            if path in self._files:
+                raise _error(errno.EEXIST, path)
+            parent, name = os.path.split(path)
+            if parent == path:
+                # The root of the file system
+                self._dirs[path] = _Directory()
+                break
+            missing.append((parent, name, path))
+            path = parent
+        for parent, name, child in reversed(missing):
+            self._dirs[parent].subdirs[name] = None
+            self._dirs[child] = _Directory()
+
+    def move(self, source: str, target: str) -> None:
+        """Move a file, refusing to replace anything at the target."""
+        entry = self._files.get(source)
+        if entry is None:
+            raise _error(errno.ENOENT, source)
+        if target in self._dirs or target in self._files:
+            raise _error(errno.EEXIST, target)
+        target_dir, target_name = os.path.split(target)
+        destination = self._dirs.get(target_dir)
+        if destination is None:
+            raise _error(errno.ENOENT, target)
+        del self._files[source]
+        del self._dirs[os.path.dirname(source)].files[entry.name]
+        moved = MemoryEntry(target, target_name, entry.st_size, entry.st_mtime)
+        destination.files[target_name] = self._files[target] = moved
@@ -0,0 +1,94 @@
+"""Per-file event callbacks for tracing and instrumentation."""
+
+from __future__ import annotations
+
+from collections.abc import Callable
+from enum import Enum
+from typing import Any
+
+Hook = Callable[..., None]
+
+
+class HookEvent(str, Enum):
+    """
+    Events emitted for every file during a run.
+
+    Callback arguments per event:
+
+    - ``scanned``: the source ``Path``
+    - ``classified``: the source ``Path`` and its ``FileCategory``
+    - ``planned``: the ``FileOperation``
+    - ``moved``: the ``FileOperation``
+    - ``failed``: the ``FileOperation`` and the exception raised
+    """
+
+    SCANNED = "scanned"
+    CLASSIFIED = "classified"
+    PLANNED = "planned"
+    MOVED = "moved"
+    FAILED = "failed"
+
+
+class HookRegistry:
+    """Registry of callbacks per event."""
+
+    def __init__(self) -> None:
+        """Initialize an empty registry."""
+        self._hooks: dict[HookEvent, list[Hook]] = {}
+
+    def register(self, event: HookEvent | str, callback: Hook) -> None:
+        """
+        Register a callback for an event.
+
+        Args:
+            event: Event to listen for
+            callback: Function called with the event's arguments
+        """
+        self._hooks.setdefault(HookEvent(event), []).append(callback)
+
+    def unregister(self, event: HookEvent | str, callback: Hook) -> None:
+        """
+        Remove a previously registered callback.
+
+        Args:
+            event: Event the callback was registered for
+            callback: The callback to remove
+
+        Raises:
+            ValueError: If the callback is not registered for the event
+        """
+        event = HookEvent(event)
+        callbacks = self._hooks.get(event, [])
+        callbacks.remove(callback)
+        if not callbacks:
+            self._hooks.pop(event, None)
+
+    def dispatcher(self, event: HookEvent) -> Hook | None:
+        """
+        Get a single callable that notifies every callback of an event.
+
+        Loops fetch the dispatcher once and skip the call entirely when it is
+        None, so events without callbacks cost one comparison per file.
+
+        Args:
+            event: Event to dispatch
+
+        Returns:
+            The dispatcher, or None when nothing is registered
+        """
+        callbacks = self._hooks.get(event)
+        if not callbacks:
+            return None
+        if len(callbacks) == 1:
+            return callbacks[0]
+        snapshot = tuple(callbacks)
+
+        def dispatch(*args: Any) -> None:
+            for callback in snapshot:
+                callback(*args)
+
+        return dispatch
+
+    def __bool__(self) -> bool:
+        """Whether any callback is registered."""
+        return bool(self._hooks)
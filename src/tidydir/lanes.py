@@ -0,0 +1,128 @@
+"""Moving small and large files in separate lanes of worker threads."""
+
+from __future__ import annotations
+
+import threading
+import time
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from tidydir.organizer import FileOrganizer
+    from tidydir.plan import CompactPlan
+    from tidydir.progress import ProgressReporter
+
+# Size from which a file is moved in the large-file lane
+LARGE_FILE_SIZE = 64 * 1024 * 1024
+
+# Threads of the large-file lane; a few concurrent copies fill the bandwidth
+DEFAULT_LARGE_WORKERS = 2
+
+# Small files moved per task
+SMALL_CHUNK = 256
+
+
+class LaneScheduler:
+    """
+    Move a plan's files in a small-file lane and a large-file lane.
+
+    Files are routed by the size recorded at scan time. Small files are
+    moved in chunks by many threads, so renames and short copies keep up
+    their rate; large files are moved one per task by a few threads of
+    their own, so multi-gigabyte copies use the bandwidth without holding
+    up the small files queued behind them. Both lanes run at the same
+    time, each in plan order, but files of different lanes finish in no
+    particular order, and hooks are called from the worker threads.
+    """
+
+    def __init__(
+        self,
+        small_workers: int,
+        large_workers: int = DEFAULT_LARGE_WORKERS,
+        large_file_size: int = LARGE_FILE_SIZE,
+        chunk_size: int = SMALL_CHUNK,
+    ) -> None:
+        """
+        Initialize the LaneScheduler.
+
+        Args:
+            small_workers: Threads of the small-file lane
+            large_workers: Threads of the large-file lane
+            large_file_size: Size in bytes from which a file is large
+            chunk_size: Small files moved per task
+
+        Raises:
+            ValueError: If a lane has no threads or the size is not positive
+        """
+        if small_workers < 1 or large_workers < 1:
+            raise ValueError("Each move lane needs at least one worker")
+        if large_file_size < 1:
+            raise ValueError(f"Large file size must be positive: {large_file_size}")
+        self.small_workers = small_workers
+        self.large_workers = large_workers
+        self.large_file_size = large_file_size
+        self.chunk_size = max(1, chunk_size)
+
+    def run(
+        self,
+        organizer: FileOrganizer,
+        plan: CompactPlan,
+        progress: ProgressReporter | None = None,
+    ) -> int:
+        """
+        Move every file of a plan into its prepared target directory.
+
+        Failures are appended to the organizer's ``errors``, as with
+        ``FileOrganizer.move_operations``.
+
+        Args:
+            organizer: Organizer whose file system, hooks and logger are used
+            plan: Plan to execute
+            progress: Reporter advanced once per small-file chunk and once
+                per large file
+
+        Returns:
+            Number of files moved
+        """
+        from concurrent.futures import Future, ThreadPoolExecutor
+
+        small, large = plan.split_by_size(self.large_file_size)
+        progress_lock = threading.Lock()
+        lane_seconds = {"move_small": 0.0, "move_large": 0.0}
+
+        def move(indices: list[int], lane: str) -> int:
+            started = time.perf_counter()
+            moved = organizer._move_each(plan, plan.iter_moves_at(indices), None)
+            elapsed = time.perf_counter() - started
+            with progress_lock:
+                lane_seconds[lane] += elapsed
+                if progress is not None:
+                    progress.advance(plan.bytes_at(indices), len(indices))
+            return moved
+
+        futures: list[Future[int]] = []
+        with (
+            ThreadPoolExecutor(
+                self.large_workers, thread_name_prefix="tidydir-large"
+            ) as large_pool,
+            ThreadPoolExecutor(
+                self.small_workers, thread_name_prefix="tidydir-small"
+            ) as small_pool,
+        ):
+            # Large files are queued first so their copies start right away
+            for index in large:
+                futures.append(large_pool.submit(move, [index], "move_large"))
+            for start in range(0, len(small), self.chunk_size):
+                chunk = small[start : start + self.chunk_size].tolist()
+                futures.append(small_pool.submit(move, chunk, "move_small"))
+            try:
+                moved = sum(future.result() for future in futures)
+            except BaseException:
+                # Don't start further moves after an interrupt
+                for future in futures:
+                    future.cancel()
+                raise
+
+        # Lane time is summed over threads, like CPU time
+        organizer.stats.add("move_small", lane_seconds["move_small"], len(small))
+        organizer.stats.add("move_large", lane_seconds["move_large"], len(large))
+        return moved
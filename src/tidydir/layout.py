@@ -0,0 +1,177 @@
+"""Archive directory layouts."""
+
+from __future__ import annotations
+
+import os
+import re
+import string
+import time
+from collections.abc import Iterable
+from datetime import datetime
+
+from tidydir._paths import join
+from tidydir.categories import FileCategory
+
+# Layout of the archive before layouts were configurable
+DEFAULT_ARCHIVE_LAYOUT = "archive_{today}/{category}"
+
+# Fields a layout may use; the date fields come from each file's mtime
+LAYOUT_FIELDS = ("year", "month", "day", "category", "today")
+DATE_FIELDS = frozenset({"year", "month", "day"})
+
+# Every UTC offset in use is a multiple of 15 minutes, so local midnight
+# always falls on a slot boundary and all mtimes in one slot share a date
+SLOT_SECONDS = 900
+
+# What each field expands to, for recognizing existing archive directories
+_FIELD_PATTERNS = {
+    "year": r"\d{4}",
+    "month": r"\d{2}",
+    "day": r"\d{2}",
+    "today": r"\d{8}",
+}
+
+Date = tuple[str, str, str]
+
+
+class ArchiveLayout:
+    """
+    Template of the directories old files are archived in.
+
+    A layout is a ``/``-separated path relative to the target directory,
+    such as ``archive/{year}/{month}/{category}``. ``{year}``, ``{month}``
+    and ``{day}`` are taken from each file's mtime in local time,
+    ``{today}`` is the date of the run and ``{category}`` the file's
+    category. Dates are looked up once per 15-minute slot of mtimes and
+    directory paths once per bucket, so the per-file cost is two dict
+    lookups.
+    """
+
+    def __init__(
+        self,
+        template: str = DEFAULT_ARCHIVE_LAYOUT,
+        root: str = "",
+        today: datetime | None = None,
+    ) -> None:
+        """
+        Initialize the ArchiveLayout.
+
+        Args:
+            template: Layout template
+            root: Directory the layout is relative to
+            today: Date used for ``{today}`` (defaults to now)
+
+        Raises:
+            ValueError: If the template is empty, not relative, or uses an
+                unknown field
+        """
+        self.template = template
+        self.root = root
+        self.components = template.replace("\\", "/").split("/")
+        if not template or template.startswith(("/", "\\")) or os.path.isabs(template):
+            raise ValueError(f"Archive layout must be a relative path: {template!r}")
+        if any(part in ("", ".", "..") for part in self.components):
+            raise ValueError(f"Archive layout has an empty or relative component: {template!r}")
+
+        self.fields: set[str] = set()
+        for part in self.components:
+            for _, name, spec, conversion in string.Formatter().parse(part):
+                if name is None:
+                    continue
+                if name not in LAYOUT_FIELDS or spec or conversion:
+                    raise ValueError(
+                        f"Unknown archive layout field {{{name}}}; "
+                        f"use {', '.join('{' + f + '}' for f in LAYOUT_FIELDS)}"
+                    )
+                self.fields.add(name)
+
+        self.uses_mtime = bool(self.fields & DATE_FIELDS)
+        self.today = (today or datetime.now()).strftime("%Y%m%d")
+        self._dates: dict[int, Date] = {}
+        self._dirs: dict[tuple[FileCategory, Date | None], str] = {}
+        self._pattern: re.Pattern[str] | None = None
+
+    def __reduce__(self) -> tuple[type[ArchiveLayout], tuple[str, str, datetime]]:
+        """Pickle only the template, root and date, not the caches."""
+        return (ArchiveLayout, (self.template, self.root, datetime.strptime(self.today, "%Y%m%d")))
+
+    def date_key(self, mtime: float) -> Date | None:
+        """
+        Get the local date of an mtime, or None if the layout uses no date.
+
+        Args:
+            mtime: Modification time in seconds since the epoch
+
+        Returns:
+            Zero-padded year, month and day
+        """
+        if not self.uses_mtime:
+            return None
+        slot = int(mtime) // SLOT_SECONDS
+        date = self._dates.get(slot)
+        if date is None:
+            t = time.localtime(slot * SLOT_SECONDS)
+            date = self._dates[slot] = (f"{t.tm_year:04d}", f"{t.tm_mon:02d}", f"{t.tm_mday:02d}")
+        return date
+
+    def relative_dir(self, category: FileCategory, date: Date | None = None) -> str:
+        """
+        Expand the layout for one bucket.
+
+        Args:
+            category: File category
+            date: Date as returned by ``date_key``
+
+        Returns:
+            Directory relative to the layout's root
+        """
+        year, month, day = date or ("", "", "")
+        values = {
+            "year": year,
+            "month": month,
+            "day": day,
+            "category": category.value,
+            "today": self.today,
+        }
+        return os.path.join(*(part.format_map(values) for part in self.components))
+
+    def directory(self, category: FileCategory, mtime: float) -> str:
+        """
+        Get the archive directory of a file.
+
+        Args:
+            category: File category
+            mtime: Modification time in seconds since the epoch
+
+        Returns:
+            Directory under the layout's root
+        """
+        key = (category, self.date_key(mtime))
+        directory = self._dirs.get(key)
+        if directory is None:
+            directory = self._dirs[key] = join(self.root, self.relative_dir(*key))
+        return directory
+
+    def matches(self, parts: Iterable[str]) -> bool:
+        """
+        Check whether a relative directory could have been made by this layout.
+
+        Args:
+            parts: Components of the directory relative to the layout's root
+
+        Returns:
+            True if the directory fits the layout
+        """
+        if self._pattern is None:
+            fields = dict(_FIELD_PATTERNS)
+            fields["category"] = "(?:" + "|".join(re.escape(c.value) for c in FileCategory) + ")"
+            components = []
+            for part in self.components:
+                regex = ""
+                for literal, name, _, _ in string.Formatter().parse(part):
+                    regex += re.escape(literal)
+                    if name is not None:
+                        regex += fields[name]
+                components.append(regex)
+            self._pattern = re.compile("/".join(components))
+        return self._pattern.fullmatch("/".join(parts)) is not None
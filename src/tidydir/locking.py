@@ -0,0 +1,172 @@
+"""
+Advisory locks that let several instances share one tree.
+
+Locks are ``flock`` locks on files in a ``.tidydir-locks`` directory. They
+are released by the operating system when a process exits, so a crashed run
+never leaves a stale lock behind. On Windows locking is a no-op.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import os
+import sys
+import threading
+from pathlib import Path
+from types import TracebackType
+
+from tidydir._paths import LOCK_DIR_NAME
+
+if sys.platform != "win32":
+    import fcntl
+
+TARGET_LOCK_NAME = "target.lock"
+
+
+class FileLock:
+    """
+    Exclusive advisory lock on a file.
+
+    The lock also excludes other threads of the same process, so one object
+    can be shared by worker threads.
+    """
+
+    def __init__(self, path: str | Path) -> None:
+        """
+        Initialize the FileLock.
+
+        Args:
+            path: Lock file, created if needed
+        """
+        self.path = Path(path)
+        self._fd: int | None = None
+        self._thread_lock = threading.Lock()
+
+    @property
+    def locked(self) -> bool:
+        """Whether this object holds the lock."""
+        return self._fd is not None
+
+    def acquire(self, blocking: bool = True) -> bool:
+        """
+        Take the lock.
+
+        Args:
+            blocking: Wait for the lock instead of giving up when it is held
+
+        Returns:
+            True if the lock is now held
+        """
+        if not self._thread_lock.acquire(blocking):
+            return False
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            fd = os.open(self.path, os.O_RDWR | os.O_CREAT, 0o644)
+        except OSError:
+            self._thread_lock.release()
+            raise
+        if sys.platform != "win32":
+            try:
+                fcntl.flock(fd, fcntl.LOCK_EX | (0 if blocking else fcntl.LOCK_NB))
+            except BlockingIOError:
+                os.close(fd)
+                self._thread_lock.release()
+                return False
+        self._fd = fd
+        return True
+
+    def release(self) -> None:
+        """Release the lock if it is held."""
+        if self._fd is None:
+            return
+        if sys.platform != "win32":
+            fcntl.flock(self._fd, fcntl.LOCK_UN)
+        os.close(self._fd)
+        self._fd = None
+        self._thread_lock.release()
+
+    def __enter__(self) -> FileLock:
+        """Take the lock, waiting for it if needed."""
+        self.acquire()
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        """Release the lock."""
+        self.release()
+
+
+def lock_dir(directory: str | Path) -> Path:
+    """Get the lock directory of a source or target directory."""
+    return Path(directory, LOCK_DIR_NAME)
+
+
+def target_lock(target_dir: str | Path) -> FileLock:
+    """
+    Get the lock that serializes moves into a target directory.
+
+    Args:
+        target_dir: Target root of a run
+
+    Returns:
+        The (not yet acquired) lock
+    """
+    return FileLock(lock_dir(target_dir) / TARGET_LOCK_NAME)
+
+
+class PartitionLeases:
+    """
+    Leases on the partitions of a source tree.
+
+    A partition is the source directory itself (its top-level files) or one
+    of its top-level subdirectories. An instance only plans the partitions
+    it holds a lease on, so concurrent instances split a tree between them.
+    """
+
+    def __init__(self, source_dir: str | Path) -> None:
+        """
+        Initialize the PartitionLeases.
+
+        Args:
+            source_dir: Source directory whose partitions are leased
+        """
+        self.directory = lock_dir(source_dir)
+        self._leases: dict[str, FileLock] = {}
+
+    def _lease_path(self, partition: str) -> Path:
+        """Get the lease file of a partition."""
+        digest = hashlib.sha1(partition.encode("utf-8", "surrogateescape"), usedforsecurity=False)
+        return self.directory / f"{digest.hexdigest()[:16]}.lease"
+
+    def acquire(self, partition: str) -> bool:
+        """
+        Try to lease a partition without waiting.
+
+        Args:
+            partition: Path of the partition
+
+        Returns:
+            True if this instance holds the lease, False if another one does
+        """
+        if partition in self._leases:
+            return True
+        lease = FileLock(self._lease_path(partition))
+        if not lease.acquire(blocking=False):
+            return False
+        self._leases[partition] = lease
+        return True
+
+    @property
+    def held(self) -> list[str]:
+        """Partitions currently leased by this instance."""
+        return list(self._leases)
+
+    def release_all(self) -> None:
+        """Give up every lease."""
+        for lease in self._leases.values():
+            lease.release()
+        self._leases.clear()
@@ -0,0 +1,147 @@
+"""Non-blocking logging used for per-file operation records."""
+
+from __future__ import annotations
+
+import io
+import json
+import logging
+import queue
+from datetime import datetime
+from enum import Enum
+from logging.handlers import QueueHandler, QueueListener
+from pathlib import Path
+from typing import Any, cast
+
+# Attributes every LogRecord carries; anything else was passed through ``extra``
+_RECORD_ATTRS = frozenset(vars(logging.makeLogRecord({}))) | {"message", "asctime"}
+
+# Write buffer of the log file; records are flushed in bulk rather than per line
+_FILE_BUFFER_SIZE = 1 << 16
+
+
+class LogFormat(str, Enum):
+    """Supported log line formats."""
+
+    TEXT = "text"
+    JSON = "json"
+
+
+class JsonLinesFormatter(logging.Formatter):
+    """Format records as one JSON object per line."""
+
+    def format(self, record: logging.LogRecord) -> str:
+        """Serialize the record, including any structured ``extra`` fields."""
+        data: dict[str, Any] = {
+            "time": datetime.fromtimestamp(record.created).isoformat(),
+            "level": record.levelname,
+            "message": record.getMessage(),
+        }
+        for key, value in record.__dict__.items():
+            if key not in _RECORD_ATTRS:
+                data[key] = value
+        if record.exc_info:
+            data["exception"] = self.formatException(record.exc_info)
+        return json.dumps(data, ensure_ascii=False, default=str)
+
+
+class BufferedFileHandler(logging.FileHandler):
+    """File handler that batches writes instead of flushing every record."""
+
+    def _open(self) -> io.TextIOWrapper:
+        """Open the log file with a large write buffer."""
+        # The handler owns the stream and closes it in close()
+        stream = open(  # noqa: SIM115
+            self.baseFilename,
+            self.mode,
+            buffering=_FILE_BUFFER_SIZE,
+            encoding=self.encoding,
+            errors=self.errors,
+        )
+        return cast(io.TextIOWrapper, stream)
+
+    def emit(self, record: logging.LogRecord) -> None:
+        """Write the record to the buffer, flushing only for errors."""
+        if self.stream is None:
+            self.stream = self._open()
+        stream = self.stream
+        try:
+            stream.write(self.format(record) + self.terminator)
+            if record.levelno >= logging.ERROR:
+                stream.flush()
+        except Exception:
+            self.handleError(record)
+
+
+class DeferredQueueHandler(QueueHandler):
+    """Queue handler that leaves all formatting to the listener thread."""
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        """Enqueue the record untouched; the queue never leaves this process."""
+        return record
+
+
+def setup_queue_logger(
+    name: str,
+    log_file: Path,
+    log_format: LogFormat = LogFormat.TEXT,
+    console: bool = True,
+) -> tuple[logging.Logger, QueueListener]:
+    """
+    Create a logger whose records are written by a background thread.
+
+    The calling thread only appends records to an in-memory queue, so logging
+    from the move loop costs little more than the call itself.
+
+    Args:
+        name: Logger name
+        log_file: File to append log lines to
+        log_format: Format of the log lines
+        console: Whether to echo log lines to the console
+
+    Returns:
+        The logger and the running listener, which must be stopped to flush
+    """
+    formatter: logging.Formatter
+    if LogFormat(log_format) is LogFormat.JSON:
+        formatter = JsonLinesFormatter()
+    else:
+        formatter = logging.Formatter("%(asctime)s - %(levelname)s - %(message)s")
+
+    handlers: list[logging.Handler] = []
+
+    file_handler = BufferedFileHandler(log_file, mode="a", encoding="utf-8")
+    file_handler.setFormatter(formatter)
+    handlers.append(file_handler)
+
+    if console:
+        console_handler = logging.StreamHandler()
+        console_handler.setFormatter(formatter)
+        handlers.append(console_handler)
+
+    log_queue: queue.SimpleQueue[logging.LogRecord] = queue.SimpleQueue()
+    listener = QueueListener(log_queue, *handlers, respect_handler_level=False)
+
+    logger = logging.getLogger(name)
+    logger.setLevel(logging.INFO)
+    logger.handlers.clear()
+    logger.addHandler(DeferredQueueHandler(log_queue))
+
+    listener.start()
+    return logger, listener
+
+
+def stop_queue_logger(logger: logging.Logger, listener: QueueListener) -> None:
+    """
+    Drain the queue, flush and close every handler of a queue logger.
+
+    Args:
+        logger: Logger returned by ``setup_queue_logger``
+        listener: Listener returned by ``setup_queue_logger``
+    """
+    for handler in logger.handlers[:]:
+        logger.removeHandler(handler)
+        handler.close()
+
+    listener.stop()
+    for handler in listener.handlers:
+        handler.close()
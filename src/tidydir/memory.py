@@ -0,0 +1,180 @@
+"""Memory profiling of the scan and planning phases."""
+
+from __future__ import annotations
+
+import contextlib
+import json
+import os
+import sys
+import tracemalloc
+from collections.abc import Iterator
+from dataclasses import asdict, dataclass, field
+from typing import TYPE_CHECKING, Any
+
+from tidydir.progress import format_size
+
+if TYPE_CHECKING:
+    from tidydir.organizer import FileOrganizer
+
+
+def peak_rss_bytes() -> int | None:
+    """
+    Get the peak resident set size of this process.
+
+    Returns:
+        Peak RSS in bytes, or None where the platform doesn't report it
+    """
+    if sys.platform == "win32":
+        return None
+
+    import resource
+
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports kilobytes, macOS reports bytes
+    return int(peak) if sys.platform == "darwin" else int(peak) * 1024
+
+
+@dataclass
+class PhaseMemory:
+    """Memory used by one phase."""
+
+    phase: str
+    items: int
+    retained_bytes: int
+    peak_bytes: int
+    peak_rss_bytes: int | None
+
+    @property
+    def retained_per_item(self) -> float:
+        """Bytes still allocated after the phase, per item."""
+        return self.retained_bytes / self.items if self.items else 0.0
+
+    @property
+    def peak_per_item(self) -> float:
+        """Peak bytes allocated during the phase, per item."""
+        return self.peak_bytes / self.items if self.items else 0.0
+
+
+@dataclass
+class MemoryReport:
+    """Memory usage of every measured phase."""
+
+    phases: list[PhaseMemory] = field(default_factory=list)
+
+    def to_dict(self) -> dict[str, Any]:
+        """Return the report as plain data."""
+        return {
+            "phases": [
+                {
+                    **asdict(phase),
+                    "retained_per_item": round(phase.retained_per_item, 1),
+                    "peak_per_item": round(phase.peak_per_item, 1),
+                }
+                for phase in self.phases
+            ]
+        }
+
+    def to_json(self) -> str:
+        """Return the report as a JSON document."""
+        return json.dumps(self.to_dict(), indent=2)
+
+    def to_text(self) -> str:
+        """Return the report as a human-readable table."""
+        lines = [
+            "=== MEMORY REPORT ===",
+            f"{'Phase':<8} {'Items':>10} {'Retained':>12} {'B/item':>8}"
+            f" {'Peak':>12} {'B/item':>8} {'Peak RSS':>12}",
+        ]
+        for p in self.phases:
+            rss = format_size(p.peak_rss_bytes) if p.peak_rss_bytes is not None else "n/a"
+            lines.append(
+                f"{p.phase:<8} {p.items:>10} {format_size(p.retained_bytes):>12}"
+                f" {p.retained_per_item:>8.0f} {format_size(p.peak_bytes):>12}"
+                f" {p.peak_per_item:>8.0f} {rss:>12}"
+            )
+        return "\n".join(lines)
+
+
+class MemoryProfiler:
+    """Measure allocations per phase with tracemalloc."""
+
+    def __init__(self) -> None:
+        """Initialize the profiler."""
+        self.report = MemoryReport()
+        self._started_tracing = False
+
+    def __enter__(self) -> MemoryProfiler:
+        """Start tracing allocations."""
+        if not tracemalloc.is_tracing():
+            tracemalloc.start()
+            self._started_tracing = True
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        """Stop tracing if this profiler started it."""
+        if self._started_tracing:
+            tracemalloc.stop()
+            self._started_tracing = False
+
+    @contextlib.contextmanager
+    def measure(self, phase: str) -> Iterator[PhaseMemory]:
+        """
+        Measure a phase.
+
+        The yielded record's ``items`` should be set inside the block so the
+        per-item figures can be computed.
+
+        Args:
+            phase: Phase name
+        """
+        before, _ = tracemalloc.get_traced_memory()
+        tracemalloc.reset_peak()
+        record = PhaseMemory(phase, 0, 0, 0, None)
+        try:
+            yield record
+        finally:
+            current, peak = tracemalloc.get_traced_memory()
+            record.retained_bytes = max(0, current - before)
+            record.peak_bytes = max(0, peak - before)
+            record.peak_rss_bytes = peak_rss_bytes()
+            self.report.phases.append(record)
+
+
+def profile_memory(organizer: FileOrganizer) -> MemoryReport:
+    """
+    Measure the memory an organizer needs to scan and plan its source.
+
+    Each phase keeps its result alive until the end, so ``retained`` shows
+    what the phase's data structures cost per file. Nothing is moved.
+
+    Args:
+        organizer: Organizer to measure
+
+    Returns:
+        The memory report
+    """
+    with MemoryProfiler() as profiler:
+        with profiler.measure("scan") as scan:
+            files = organizer.get_files_to_organize()
+            scan.items = len(files)
+
+        with profiler.measure("plan") as plan:
+            compact = organizer.plan()
+            plan.items = len(compact)
+
+        with profiler.measure("preview") as preview:
+            operations = compact.group_by_directory()
+            preview.items = plan.items
+
+        with (
+            open(os.devnull, "w") as sink,
+            contextlib.redirect_stdout(sink),
+            profiler.measure("render") as render,
+        ):
+            organizer.print_preview(compact)
+            render.items = plan.items
+
+        # Keep the phase results alive until every phase has been measured
+        del files, compact, operations
+
+    return profiler.report
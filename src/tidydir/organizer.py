@@ -2,25 +2,37 @@
 
 from __future__ import annotations
 
+import contextlib
 import logging
 import os
-import shutil
+import time
 from collections import defaultdict
+from collections.abc import Iterable, Iterator, Mapping
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta
+from itertools import groupby
+from logging.handlers import QueueListener
 from pathlib import Path
+from typing import TYPE_CHECKING
 
-from tidydir.categories import CATEGORY_EXTENSIONS, FileCategory
+from tidydir._paths import join, list_files, split_ext
+from tidydir.categories import FileCategory, extension_map
+from tidydir.fs import FileEntry, FileSystem, LocalFileSystem
+from tidydir.hooks import Hook, HookEvent, HookRegistry
+from tidydir.lanes import DEFAULT_LARGE_WORKERS, LARGE_FILE_SIZE, LaneScheduler
+from tidydir.layout import DEFAULT_ARCHIVE_LAYOUT, ArchiveLayout
+from tidydir.logs import LogFormat, setup_queue_logger, stop_queue_logger
+from tidydir.plan import CompactPlan, FileOperation, PlanBucket, PlanSummary
+from tidydir.progress import ProgressReporter, create_progress, format_size
+from tidydir.sharding import ShardBy, Sharder
+from tidydir.stats import RunStats
 
+if TYPE_CHECKING:
+    from tidydir.locking import FileLock, PartitionLeases
+    from tidydir.packing import ArchiveFormat, PackResult
 
-@dataclass
-class FileOperation:
-    """Represents a file operation to be performed."""
-
-    source: Path
-    target: Path
-    category: FileCategory
-    is_old: bool
+# Moves made per acquisition of the target lock
+LOCKED_MOVE_CHUNK = 256
 
 
 @dataclass
@@ -43,6 +55,19 @@ class FileOrganizer:
         include_subdirs: bool = False,
         old_files_days: int = 365,
         enable_logging: bool = False,
+        log_format: LogFormat | str = LogFormat.TEXT,
+        log_console: bool = True,
+        show_progress: bool = True,
+        processes: int = 1,
+        lock: bool = False,
+        archive_layout: str = DEFAULT_ARCHIVE_LAYOUT,
+        archive_format: ArchiveFormat | str | None = None,
+        fs: FileSystem | None = None,
+        max_per_dir: int | None = None,
+        shard_by: ShardBy | str = ShardBy.HASH,
+        move_workers: int | None = None,
+        large_workers: int = DEFAULT_LARGE_WORKERS,
+        large_file_size: int = LARGE_FILE_SIZE,
     ) -> None:
         """
         Initialize the FileOrganizer.
@@ -53,12 +78,76 @@ class FileOrganizer:
             include_subdirs: Whether to include subdirectories
             old_files_days: Age threshold for old files in days
             enable_logging: Whether to enable logging to file
+            log_format: Format of the log lines (``text`` or ``json``)
+            log_console: Whether to echo log lines to the console
+            show_progress: Whether to show live progress on an interactive stderr
+            processes: Worker processes used to plan recursive runs, one
+                top-level subdirectory at a time
+            lock: Coordinate with concurrent instances: only plan source
+                partitions leased by this instance and move files while
+                holding the target lock
+            archive_layout: Template of the directories old files go to,
+                relative to the target (see ``ArchiveLayout``)
+            archive_format: Pack old files into one compressed archive per
+                archive directory (``tar.xz``, ``tar.gz`` or ``zip``)
+                instead of moving them
+            fs: File system the files are scanned, stat()ed and moved on
+                (defaults to the local disk)
+            max_per_dir: Entries a category directory may hold; once it is
+                full, new files go to shard subdirectories (see ``Sharder``)
+            shard_by: How files are spread over the shards (``hash`` or
+                ``date``)
+            move_workers: Move files with this many threads, scheduling
+                large files in a lane of their own (see ``LaneScheduler``);
+                by default files are moved one at a time in plan order
+            large_workers: Threads of the large-file lane
+            large_file_size: Size in bytes from which a file is moved in the
+                large-file lane
+
+        Raises:
+            ValueError: If the archive layout or format is invalid, logging,
+                locking or packing is requested on a file system that is not
+                local, ``max_per_dir`` is not positive, or the move lanes are
+                invalid or combined with locking
         """
-        self.source_dir = Path(source_dir).resolve()
-        self.target_dir = Path(target_dir).resolve() if target_dir else self.source_dir
+        self.fs = fs if fs is not None else LocalFileSystem()
+        if not self.fs.local and (enable_logging or lock or archive_format):
+            raise ValueError("Logging, locking and packing need the local file system")
+        self.source_dir = self.fs.resolve(source_dir)
+        self.target_dir = self.fs.resolve(target_dir) if target_dir else self.source_dir
         self.include_subdirs = include_subdirs
+        self.old_files_days = old_files_days
         self.old_files_cutoff = datetime.now() - timedelta(days=old_files_days)
         self.enable_logging = enable_logging
+        self.log_format = LogFormat(log_format)
+        self.log_console = log_console
+        self.show_progress = show_progress
+        self.processes = max(1, processes)
+        self.archive_layout = archive_layout
+        self._layout: ArchiveLayout | None = ArchiveLayout(archive_layout, str(self.target_dir))
+        if max_per_dir is not None and max_per_dir < 1:
+            raise ValueError(f"Entries per directory must be positive: {max_per_dir}")
+        self.max_per_dir = max_per_dir
+        self.shard_by = ShardBy(shard_by)
+        self._sharder: Sharder | None = None
+        self._lanes: LaneScheduler | None = None
+        if move_workers is not None:
+            if lock:
+                raise ValueError("Moving in lanes cannot be combined with locking")
+            self._lanes = LaneScheduler(move_workers, large_workers, large_file_size)
+        self.archive_format: ArchiveFormat | None = None
+        if archive_format:
+            from tidydir.packing import ArchiveFormat
+
+            self.archive_format = ArchiveFormat(archive_format)
+        self.lock = lock
+        self._leases: PartitionLeases | None = None
+        self._target_lock: FileLock | None = None
+        if lock:
+            from tidydir.locking import PartitionLeases, target_lock
+
+            self._leases = PartitionLeases(self.source_dir)
+            self._target_lock = target_lock(self.target_dir)
 
         # Create extension to category mapping
         self.ext_to_category = self._build_extension_map()
@@ -66,21 +155,47 @@ class FileOrganizer:
         # Track operations
         self.conflicts: list[tuple[Path, Path]] = []
         self.errors: list[tuple[Path, str]] = []
+        self.stats = RunStats()
+        self.hooks = HookRegistry()
 
         # Setup logging if enabled
+        self._log_listener: QueueListener | None = None
         self.logger: logging.Logger | None = self._setup_logging() if enable_logging else None
 
     def __del__(self) -> None:
         """Cleanup when object is deleted."""
+        self.release_locks()
         self.close_logging()
 
+    def release_locks(self) -> None:
+        """Give up the partition leases taken while planning."""
+        leases = getattr(self, "_leases", None)
+        if leases is not None:
+            leases.release_all()
+
+    def add_hook(self, event: HookEvent | str, callback: Hook) -> None:
+        """
+        Register a callback for a per-file event.
+
+        Args:
+            event: One of ``scanned``, ``classified``, ``planned``, ``moved`` or ``failed``
+            callback: Function called with the event's arguments (see ``HookEvent``)
+        """
+        self.hooks.register(event, callback)
+
+    def remove_hook(self, event: HookEvent | str, callback: Hook) -> None:
+        """
+        Remove a callback registered with ``add_hook``.
+
+        Args:
+            event: Event the callback was registered for
+            callback: The callback to remove
+        """
+        self.hooks.unregister(event, callback)
+
     def _build_extension_map(self) -> dict[str, FileCategory]:
         """Build a mapping from file extensions to categories."""
-        ext_map: dict[str, FileCategory] = {}
-        for category, extensions in CATEGORY_EXTENSIONS.items():
-            for ext in extensions:
-                ext_map[ext.lower()] = category
-        return ext_map
+        return extension_map()
 
     def _setup_logging(self) -> logging.Logger:
         """Setup logging configuration."""
@@ -90,36 +205,22 @@ class FileOrganizer:
         # Ensure target directory exists
         self.target_dir.mkdir(parents=True, exist_ok=True)
 
-        # Create a unique logger for this instance
-        logger_name = f"tidydir.{id(self)}"
-        logger = logging.getLogger(logger_name)
-        logger.setLevel(logging.INFO)
-
-        # Clear any existing handlers
-        logger.handlers.clear()
-
-        # Create formatters and handlers
-        formatter = logging.Formatter("%(asctime)s - %(levelname)s - %(message)s")
-
-        file_handler = logging.FileHandler(log_file, mode="a")
-        file_handler.setFormatter(formatter)
-        logger.addHandler(file_handler)
-
-        console_handler = logging.StreamHandler()
-        console_handler.setFormatter(formatter)
-        logger.addHandler(console_handler)
+        # Create a unique logger for this instance, written by a background thread
+        logger, self._log_listener = setup_queue_logger(
+            f"tidydir.{id(self)}", log_file, self.log_format, self.log_console
+        )
 
         # Log initial message to ensure file is created
-        logger.info(f"TidyDir logging started for {self.source_dir}")
+        logger.info("TidyDir logging started for %s", self.source_dir)
 
         return logger
 
     def close_logging(self) -> None:
-        """Close all logging handlers to release file locks."""
-        if self.logger:
-            for handler in self.logger.handlers[:]:
-                handler.close()
-                self.logger.removeHandler(handler)
+        """Flush pending log records and close all handlers to release file locks."""
+        listener = getattr(self, "_log_listener", None)
+        if listener and self.logger:
+            stop_queue_logger(self.logger, listener)
+            self._log_listener = None
 
     def get_category(self, file_path: Path) -> FileCategory:
         """
@@ -131,7 +232,7 @@ class FileOrganizer:
         Returns:
             The file category
         """
-        ext = file_path.suffix.lower()
+        ext = split_ext(file_path.name)[1].lower()
         return self.ext_to_category.get(ext, FileCategory.FILES)
 
     def is_old_file(self, file_path: Path) -> bool:
@@ -145,7 +246,7 @@ class FileOrganizer:
             True if file is older than cutoff
         """
         try:
-            mtime = datetime.fromtimestamp(file_path.stat().st_mtime)
+            mtime = datetime.fromtimestamp(self.fs.stat(str(file_path)).st_mtime)
             return mtime < self.old_files_cutoff
         except OSError:
             # If we can't read the file stats, consider it not old
@@ -177,6 +278,31 @@ class FileOrganizer:
 
         return issues
 
+    def check_space(self, plan: CompactPlan) -> list[str]:
+        """
+        Check that the target devices have room for a plan.
+
+        Moves within a device are renames and need nothing; files copied to
+        another device, packed archives and new directories need space and
+        inodes, which are compared with what ``statvfs`` reports free (see
+        ``plan_usage``). Per-user quotas are not visible this way. Only local
+        file systems are checked.
+
+        Args:
+            plan: Plan to check
+
+        Returns:
+            List of space and inode shortfalls
+        """
+        if not self.fs.local or not plan.keep_operations:
+            return []
+        from tidydir.space import plan_usage
+
+        with self.stats.timer("preflight") as preflight:
+            usages = plan_usage(plan, pack_old=self.archive_format is not None)
+            preflight.items = len(plan)
+        return [issue for usage in usages for issue in usage.issues()]
+
     def get_files_to_organize(self) -> list[Path]:
         """
         Get list of files to organize.
@@ -186,90 +312,379 @@ class FileOrganizer:
         """
         files: list[Path] = []
 
-        # Get the log filename pattern to exclude
-        log_pattern = "tidydir_*.log"
+        with self.stats.timer("scan") as scan:
+            try:
+                for _directory, entry in self.fs.scan(str(self.source_dir), self.include_subdirs):
+                    files.append(Path(entry.path))
+            except OSError as e:
+                if self.logger:
+                    self.logger.error("Error reading directory: %s", e)
 
-        try:
-            if self.include_subdirs:
-                all_files = [item for item in self.source_dir.rglob("*") if item.is_file()]
-            else:
-                all_files = [item for item in self.source_dir.iterdir() if item.is_file()]
+            scan.items = len(files)
 
-            # Filter out log files
-            for file in all_files:
-                if not file.match(log_pattern):
-                    files.append(file)
+        return files
 
-        except OSError as e:
-            if self.logger:
-                self.logger.error(f"Error reading directory: {e}")
+    def get_archive_layout(self) -> ArchiveLayout:
+        """
+        Get the archive layout of the current run.
 
-        return files
+        The layout is created on first use and again by every ``plan``, so
+        ``{today}`` is fixed for the duration of a run.
+
+        Returns:
+            The layout, rooted at the target directory
+        """
+        if self._layout is None:
+            self._layout = ArchiveLayout(self.archive_layout, str(self.target_dir))
+        return self._layout
 
-    def get_target_path(self, file_path: Path, category: FileCategory, is_old: bool) -> Path:
+    def get_sharder(self) -> Sharder | None:
         """
-        Determine the target path for a file.
+        Get the sharder of the current run.
+
+        Like the archive layout, the sharder is created on first use and
+        again by every ``plan``, so entries are counted afresh each run.
+
+        Returns:
+            The sharder, or None without ``max_per_dir``
+        """
+        if self.max_per_dir is None:
+            return None
+        if self._sharder is None:
+            self._sharder = Sharder(self.max_per_dir, self.shard_by, self.fs)
+        return self._sharder
+
+    def get_target_dir(
+        self, category: FileCategory, is_old: bool, mtime: float | None = None
+    ) -> Path:
+        """
+        Determine the directory a file of the given category belongs in.
 
         Args:
-            file_path: Source file path
             category: File category
             is_old: Whether the file is old
+            mtime: The file's modification time, for archive layouts with
+                date fields (defaults to now)
 
         Returns:
-            Target path for the file
+            Target directory for the category, not counting shards
         """
         if is_old:
-            archive_dir = f"archive_{datetime.now().strftime('%Y%m%d')}"
-            base_dir = self.target_dir / archive_dir / category.value
-        else:
-            base_dir = self.target_dir / category.value
+            layout = self.get_archive_layout()
+            return Path(layout.directory(category, time.time() if mtime is None else mtime))
+        return self.target_dir / category.value
+
+    def _resolve_name(self, directory: str, name: str, claimed: set[str] | None = None) -> str:
+        """
+        Find a free name in a target directory, appending ``_N`` on conflicts.
 
-        target_path = base_dir / file_path.name
+        Args:
+            directory: Target directory
+            name: Desired file name
+            claimed: Paths already promised to other files in this run; the
+                chosen path is added to it
 
-        # Handle conflicts
-        if target_path.exists():
-            stem = file_path.stem
-            suffix = file_path.suffix
+        Returns:
+            The desired name, or a renamed variant if it is taken
+        """
+        exists = self.fs.exists
+        path = join(directory, name)
+        if exists(path) or (claimed is not None and path in claimed):
+            stem, suffix = split_ext(name)
             counter = 1
-            while target_path.exists():
-                target_path = base_dir / f"{stem}_{counter}{suffix}"
+            while True:
+                name = f"{stem}_{counter}{suffix}"
+                path = join(directory, name)
+                if not exists(path) and (claimed is None or path not in claimed):
+                    break
                 counter += 1
+        if claimed is not None:
+            claimed.add(path)
+        return name
+
+    def get_target_path(
+        self, file_path: Path, category: FileCategory, is_old: bool, mtime: float | None = None
+    ) -> Path:
+        """
+        Determine the target path for a file.
+
+        Args:
+            file_path: Source file path
+            category: File category
+            is_old: Whether the file is old
+            mtime: The file's modification time, for archive layouts with
+                date fields (defaults to now)
+
+        Returns:
+            Target path for the file
+        """
+        base_dir = str(self.get_target_dir(category, is_old, mtime))
+        sharder = self.get_sharder()
+        if sharder is not None and not is_old:
+            when = time.time() if mtime is None else mtime
+            base_dir = sharder.directory(base_dir, file_path.name, when)
+        name = self._resolve_name(base_dir, file_path.name)
+        target_path = Path(base_dir, name)
+
+        # Handle conflicts
+        if name != file_path.name:
             self.conflicts.append((file_path, target_path))
 
         return target_path
 
-    def preview(self) -> defaultdict[str, list[FileOperation]]:
+    def _partitions(self) -> list[tuple[str, bool]]:
         """
-        Generate preview of operations without executing them.
+        Get the parts of the source tree this instance plans.
+
+        The source directory's own files form one partition and every
+        top-level subdirectory of a recursive run another. With locking, only
+        partitions whose lease could be taken are returned.
 
         Returns:
-            Dictionary mapping target directories to file operations
+            Tuples of partition directory and whether to scan it recursively,
+            in scan order
+
+        Raises:
+            OSError: If the source directory cannot be listed
+        """
+        root = str(self.source_dir)
+        subdirs = self.fs.list_subdirs(root) if self.include_subdirs else []
+        partitions = [(root, False)] + [(subdir, True) for subdir in subdirs]
+        if self._leases is not None:
+            partitions = [part for part in partitions if self._leases.acquire(part[0])]
+        return partitions
+
+    def _scan_source(self) -> Iterator[tuple[str, FileEntry]]:
+        """Yield the files to plan, limited to leased partitions when locking."""
+        if self._leases is None:
+            yield from self.fs.scan(str(self.source_dir), self.include_subdirs)
+            return
+        for directory, recursive in self._partitions():
+            try:
+                yield from self.fs.scan(directory, recursive)
+            except OSError:
+                # Unreadable subdirectories are skipped, as in a serial scan
+                continue
+
+    def plan(self, keep_operations: bool = True) -> CompactPlan:
+        """
+        Plan the operations in compact form without executing them.
+
+        Args:
+            keep_operations: Whether to store every operation; when False only
+                the plan's summary is kept, and operations are only seen by
+                ``planned`` hooks
+
+        Returns:
+            Columnar plan of every file operation
+        """
+        # Scanned/classified callbacks can't run in worker processes
+        if (
+            self.processes > 1
+            and self.include_subdirs
+            and self.fs.local
+            and self.hooks.dispatcher(HookEvent.SCANNED) is None
+            and self.hooks.dispatcher(HookEvent.CLASSIFIED) is None
+        ):
+            from tidydir.parallel import plan_parallel
+
+            return plan_parallel(self, self.processes, keep_operations)
+
+        # Files from different subdirectories may share a name; names handed
+        # out in this run are tracked so they don't overwrite each other
+        claimed: set[str] | None = set() if self.include_subdirs else None
+        return self._plan_entries(self._scan_source(), keep_operations, claimed)
+
+    def plan_paths(
+        self, paths: Iterable[str | os.PathLike[str]], keep_operations: bool = True
+    ) -> CompactPlan:
+        """
+        Plan an explicit list of files instead of scanning the source directory.
+
+        Paths are classified and planned as the iterable yields them, so a
+        list from ``find`` or another job is planned while it is still being
+        produced. Each listed file is stat()ed once, which counts as the
+        ``scan`` phase. Paths that are missing or not regular files are
+        skipped and logged; ``include_subdirs`` and locking do not apply.
+
+        Args:
+            paths: Paths of the files to organize, absolute or relative to
+                the working directory
+            keep_operations: Whether to store every operation, as in ``plan``
+
+        Returns:
+            Columnar plan of every file operation
+
+        Raises:
+            ValueError: If the organizer was created with ``lock=True``
+        """
+        if self._leases is not None:
+            raise ValueError("Locking leases parts of the source tree; it needs a scanned source")
+
+        skipped = 0
+
+        def on_skipped(path: str, reason: str) -> None:
+            nonlocal skipped
+            skipped += 1
+            if self.logger:
+                self.logger.warning(
+                    "Skipped %s: %s", path, reason, extra={"event": "skipped", "source": path}
+                )
+
+        # Listed files may come from anywhere, so names are always claimed
+        entries = list_files(paths, on_skipped, self.fs.stat)
+        plan = self._plan_entries(entries, keep_operations, set())
+        self.stats.incr("files_skipped", skipped)
+        return plan
+
+    def _plan_entries(
+        self,
+        entries: Iterable[tuple[str, FileEntry]],
+        keep_operations: bool,
+        claimed: set[str] | None,
+    ) -> CompactPlan:
+        """
+        Classify, stat and resolve a stream of files into a plan.
+
+        Args:
+            entries: Containing directory and entry of every file
+            keep_operations: Whether to store every operation
+            claimed: Target paths already handed out, or None when names
+                cannot collide within the run
+
+        Returns:
+            Columnar plan of every file operation
         """
-        files = self.get_files_to_organize()
-        operations: defaultdict[str, list[FileOperation]] = defaultdict(list)
+        stats = self.stats
+        stats.reset()
+        plan = CompactPlan(keep_operations)
 
         # Reset conflicts for new preview
         self.conflicts.clear()
 
-        for file_path in files:
-            category = self.get_category(file_path)
-            is_old = self.is_old_file(file_path)
-            target_path = self.get_target_path(file_path, category, is_old)
+        ext_map = self.ext_to_category
+        default_category = FileCategory.FILES
+        cutoff = self.old_files_cutoff.timestamp()
+        target_root = str(self.target_dir)
+        self._layout = self._sharder = None
+        archive_dir = self.get_archive_layout().directory
+        sharder = self.get_sharder()
+        shard_dir = sharder.directory if sharder is not None else None
+
+        # Each target directory string is built once per run
+        dir_cache: dict[FileCategory, str] = {}
+
+        on_scanned = self.hooks.dispatcher(HookEvent.SCANNED)
+        on_classified = self.hooks.dispatcher(HookEvent.CLASSIFIED)
+        on_planned = self.hooks.dispatcher(HookEvent.PLANNED)
+
+        # Accumulate phase timings locally; one clock read between phases
+        clock = time.perf_counter
+        scan_time = classify_time = stat_time = resolve_time = 0.0
+        count = 0
+        target_dir: str | None
+        last = clock()
 
-            operation = FileOperation(
-                source=file_path, target=target_path, category=category, is_old=is_old
-            )
+        try:
+            for directory, entry in entries:
+                start = clock()
+                scan_time += start - last
+                name = entry.name
+                if on_scanned is not None:
+                    on_scanned(Path(entry.path))
+                    start = clock()
+
+                category = ext_map.get(split_ext(name)[1].lower(), default_category)
+                classified = clock()
+                if on_classified is not None:
+                    on_classified(Path(entry.path), category)
+                    classified = clock()
+
+                try:
+                    st = entry.stat()
+                    mtime = st.st_mtime
+                    is_old = mtime < cutoff
+                    size = st.st_size
+                except OSError:
+                    # If we can't read the file stats, consider it not old
+                    mtime, is_old, size = time.time(), False, 0
+                checked = clock()
+
+                if is_old:
+                    target_dir = archive_dir(category, mtime)
+                else:
+                    target_dir = dir_cache.get(category)
+                    if target_dir is None:
+                        target_dir = dir_cache[category] = join(target_root, category.value)
+                    if shard_dir is not None:
+                        target_dir = shard_dir(target_dir, name, mtime)
+                target_name = self._resolve_name(target_dir, name, claimed)
+                if target_name != name:
+                    self.conflicts.append((Path(entry.path), Path(target_dir, target_name)))
+                resolved = clock()
+
+                classify_time += classified - start
+                stat_time += checked - classified
+                resolve_time += resolved - checked
+
+                plan.append(directory, name, target_dir, target_name, category, is_old, size)
+                count += 1
+                if on_planned is not None:
+                    on_planned(
+                        FileOperation(
+                            source=Path(entry.path),
+                            target=Path(target_dir, target_name),
+                            category=category,
+                            is_old=is_old,
+                            size=size,
+                        )
+                    )
+                last = clock()
+        except OSError as e:
+            if self.logger:
+                self.logger.error("Error reading directory: %s", e)
+
+        stats.add("scan", scan_time, count)
+        stats.add("classify", classify_time, count)
+        stats.add("stat", stat_time, count)
+        stats.add("resolve", resolve_time, count)
+        stats.incr("files_scanned", count)
+        stats.incr("files_planned", count)
+        stats.incr("conflicts", len(self.conflicts))
+
+        return plan
+
+    def organize_paths(self, paths: Iterable[str | os.PathLike[str]]) -> OrganizeResult:
+        """
+        Organize an explicit list of files without scanning the source directory.
+
+        Args:
+            paths: Paths of the files to organize, see ``plan_paths``
+
+        Returns:
+            Result of the organization
+        """
+        return self.execute(self.plan_paths(paths))
 
-            operations[str(target_path.parent)].append(operation)
+    def preview(self) -> defaultdict[str, list[FileOperation]]:
+        """
+        Generate preview of operations without executing them.
 
-        return operations
+        Returns:
+            Dictionary mapping target directories to file operations
+        """
+        return self.plan().group_by_directory()
 
-    def print_preview(self, operations: defaultdict[str, list[FileOperation]]) -> None:
+    def print_preview(self, operations: CompactPlan | Mapping[str, list[FileOperation]]) -> None:
         """
         Print preview in tree format.
 
+        A ``CompactPlan`` is rendered from the totals gathered while planning,
+        so this takes time proportional to the number of target directories.
+
         Args:
-            operations: Dictionary of operations to preview
+            operations: Plan, or dictionary of operations as returned by
+                ``preview``
         """
         print("\n=== PREVIEW ===\n")
 
@@ -277,71 +692,88 @@ class FileOrganizer:
             print("No files to organize.")
             return
 
-        # Organize by directory structure
-        tree: defaultdict[FileCategory, list[FileOperation]] = defaultdict(list)
-        archive_tree: defaultdict[FileCategory, list[FileOperation]] = defaultdict(list)
+        if isinstance(operations, CompactPlan):
+            summary = operations.summary
+        else:
+            summary = PlanSummary.from_operations(
+                op for file_ops in operations.values() for op in file_ops
+            )
 
-        for parent_dir, file_ops in operations.items():
-            parent_path = Path(parent_dir)
-            # Check if it's in an archive directory
-            if any("archive_" in part for part in parent_path.parts):
-                try:
-                    category = FileCategory(parent_path.name)
-                    archive_tree[category].extend(file_ops)
-                except ValueError:
-                    # If the directory name doesn't match a category, skip it
-                    continue
-            else:
-                try:
-                    category = FileCategory(parent_path.name)
-                    tree[category].extend(file_ops)
-                except ValueError:
-                    # If the directory name doesn't match a category, skip it
-                    continue
+        buckets = sorted(summary.buckets.values(), key=lambda b: (b.category, b.directory))
+        tree = [bucket for bucket in buckets if not bucket.is_old]
+        # Old files live in directories given by the archive layout; group
+        # them by the first directory below the target
+        archive_tree: defaultdict[str, list[tuple[str, PlanBucket]]] = defaultdict(list)
+        target_root = str(self.target_dir)
+        for bucket in buckets:
+            if bucket.is_old:
+                path = os.path.relpath(bucket.directory, target_root).replace(os.sep, "/")
+                archive_name, _, rest = path.partition("/")
+                archive_tree[archive_name].append((rest, bucket))
 
         # Print main target directory structure
         print(f"📁 {self.target_dir.name}/")
 
-        # Print regular categories
-        for category, file_ops in sorted(tree.items()):
+        # Print regular categories; shard subdirectories follow their
+        # category directory in the sort order
+        for category, group in groupby(tree, key=lambda b: b.category):
             print(f"├── 📁 {category.value}/")
-            for file_op in file_ops[:3]:  # Show first 3 files
-                print(f"│   └── 📄 {file_op.source.name}")
-            if len(file_ops) > 3:
-                print(f"│   └── ... and {len(file_ops) - 3} more files")
-
-        # Print archive directory if there are old files
-        if archive_tree:
-            archive_name = f"archive_{datetime.now().strftime('%Y%m%d')}"
-            print(f"└── 📁 {archive_name}/")
-            for category, file_ops in sorted(archive_tree.items()):
-                print(f"    ├── 📁 {category.value}/")
-                for file_op in file_ops[:3]:  # Show first 3 files
-                    print(f"    │   └── 📄 {file_op.source.name}")
-                if len(file_ops) > 3:
-                    print(f"    │   └── ... and {len(file_ops) - 3} more files")
+            category_dir = join(target_root, category.value)
+            shards = 0
+            for bucket in group:
+                if bucket.directory == category_dir:
+                    for name in bucket.samples:
+                        print(f"│   └── 📄 {name}")
+                    if bucket.count > len(bucket.samples):
+                        print(f"│   └── ... and {bucket.count - len(bucket.samples)} more files")
+                    continue
+                shards += 1
+                if shards <= 5:
+                    shard = os.path.relpath(bucket.directory, category_dir).replace(os.sep, "/")
+                    print(f"│   ├── 📁 {shard}/ ({bucket.count} files)")
+            if shards > 5:
+                print(f"│   └── ... and {shards - 5} more shard directories")
+
+        # Print archive directories if there are old files
+        suffix = self.archive_format.suffix if self.archive_format is not None else None
+        for archive_name, archive_buckets in sorted(archive_tree.items()):
+            # A layout without {category} shares a directory between categories
+            archive_buckets.sort(key=lambda item: item[0])
+            groups = groupby(archive_buckets, key=lambda item: item[0])
+            if archive_buckets[0][0] or suffix is None:
+                print(f"└── 📁 {archive_name}/")
+            else:
+                # One-level layouts such as {category} pack top-level directories
+                print(f"└── 📦 {archive_name}{suffix}")
+            for rest, members in groups:
+                indent = "    "
+                if rest:
+                    if suffix is not None:
+                        print(f"    ├── 📦 {rest}{suffix}")
+                    else:
+                        print(f"    ├── 📁 {rest}/")
+                    indent = "    │   "
+                more = 0
+                for _, bucket in members:
+                    for name in bucket.samples:
+                        print(f"{indent}└── 📄 {name}")
+                    more += bucket.count - len(bucket.samples)
+                if more:
+                    print(f"{indent}└── ... and {more} more files")
 
         # Print summary
         print("\n=== SUMMARY ===")
-        total_files = sum(len(file_ops) for file_ops in operations.values())
-        print(f"Total files to organize: {total_files}")
-
-        # Category breakdown
-        category_counts: defaultdict[FileCategory, int] = defaultdict(int)
-        old_files_count = 0
-        for file_ops in operations.values():
-            for file_op in file_ops:
-                category_counts[file_op.category] += 1
-                if file_op.is_old:
-                    old_files_count += 1
+        print(
+            f"Total files to organize: {summary.total_count} ({format_size(summary.total_bytes)})"
+        )
 
         print("\nFiles by category:")
-        for category, count in sorted(category_counts.items()):
-            print(f"  {category.value}: {count}")
+        for category, (count, size) in summary.by_category().items():
+            print(f"  {category.value}: {count} ({format_size(size)})")
 
         # Calculate days threshold from cutoff
         days_threshold = (datetime.now() - self.old_files_cutoff).days
-        print(f"\nOld files (>{days_threshold} days): {old_files_count}")
+        print(f"\nOld files (>{days_threshold} days): {summary.old_count}")
 
         if self.conflicts:
             print(f"\n⚠️  Conflicts detected: {len(self.conflicts)} files will be renamed")
@@ -350,24 +782,335 @@ class FileOrganizer:
             if len(self.conflicts) > 5:
                 print(f"  ... and {len(self.conflicts) - 5} more")
 
-    def execute(self) -> OrganizeResult:
+    def prepare_directories(self, plan: CompactPlan) -> int:
+        """
+        Create every target directory of a plan.
+
+        Args:
+            plan: Plan whose target directories are created
+
+        Returns:
+            Number of directories prepared
+        """
+        target_dirs = plan.target_directories()
+        with self.stats.timer("mkdir", len(target_dirs)):
+            makedirs = self.fs.makedirs
+            for parent_dir in target_dirs:
+                makedirs(parent_dir)
+        self.stats.incr("directories_prepared", len(target_dirs))
+        return len(target_dirs)
+
+    def move_operations(
+        self,
+        plan: CompactPlan,
+        start: int = 0,
+        stop: int | None = None,
+        progress: ProgressReporter | None = None,
+    ) -> int:
+        """
+        Move a range of a plan's files into their prepared target directories.
+
+        Failures are appended to ``errors``. Disjoint ranges of one plan may
+        be moved from several threads at once.
+
+        Args:
+            plan: Plan to execute
+            start: Index of the first operation
+            stop: Index after the last operation (defaults to the end)
+            progress: Reporter advanced after every file
+
+        Returns:
+            Number of files moved
+        """
+        lock = self._target_lock
+        if lock is None:
+            return self._move_range(plan, start, stop, progress)
+
+        # Hold the target lock per chunk so concurrent instances interleave
+        stop = len(plan) if stop is None else min(stop, len(plan))
+        moved = 0
+        for chunk_start in range(start, stop, LOCKED_MOVE_CHUNK):
+            with lock:
+                moved += self._move_range(
+                    plan,
+                    chunk_start,
+                    min(chunk_start + LOCKED_MOVE_CHUNK, stop),
+                    progress,
+                    verify=True,
+                )
+        return moved
+
+    def _move_range(
+        self,
+        plan: CompactPlan,
+        start: int,
+        stop: int | None,
+        progress: ProgressReporter | None,
+        verify: bool = False,
+    ) -> int:
+        """
+        Move a range of a plan's files.
+
+        Args:
+            plan: Plan to execute
+            start: Index of the first operation
+            stop: Index after the last operation (defaults to the end)
+            progress: Reporter advanced after every file
+            verify: Re-check that each target name is still free, renaming
+                the file if another instance took it since planning
+
+        Returns:
+            Number of files moved
+        """
+        return self._move_each(plan, plan.iter_moves(start, stop), progress, verify)
+
+    def _move_each(
+        self,
+        plan: CompactPlan,
+        moves: Iterable[tuple[int, str, str, int]],
+        progress: ProgressReporter | None,
+        verify: bool = False,
+    ) -> int:
+        """
+        Move files of a plan as yielded by ``iter_moves`` or ``iter_moves_at``.
+
+        Args:
+            plan: Plan the moves belong to
+            moves: Operation index, source, target and size of each file
+            progress: Reporter advanced after every file
+            verify: Re-check that each target name is still free, as in
+                ``_move_range``
+
+        Returns:
+            Number of files moved
+        """
+        moved = 0
+        on_moved = self.hooks.dispatcher(HookEvent.MOVED)
+        on_failed = self.hooks.dispatcher(HookEvent.FAILED)
+        move, exists = self.fs.move, self.fs.exists
+
+        for index, source, target, size in moves:
+            if verify and exists(target):
+                directory = os.path.dirname(target)
+                name = self._resolve_name(directory, os.path.basename(source))
+                plan.set_target_name(index, name)
+                target = join(directory, name)
+                self.conflicts.append((Path(source), Path(target)))
+            try:
+                move(source, target)
+            except Exception as e:
+                self.errors.append((Path(source), str(e)))
+                if self.logger:
+                    self.logger.error(
+                        "Failed to move %s: %s",
+                        source,
+                        e,
+                        extra={"event": "failed", "source": source},
+                    )
+                if on_failed is not None:
+                    on_failed(plan[index], e)
+            else:
+                moved += 1
+
+                if self.logger:
+                    self.logger.info(
+                        "Moved: %s → %s",
+                        source,
+                        target,
+                        extra={"event": "moved", "source": source, "target": target},
+                    )
+                if on_moved is not None:
+                    on_moved(plan[index])
+
+            if progress is not None:
+                progress.advance(size)
+
+        return moved
+
+    def _reserve_archive(self, directory: str) -> str:
+        """Create an empty file under a free archive name for an archive directory."""
+        assert self.archive_format is not None
+        parent, name = os.path.split(directory)
+        os.makedirs(parent, exist_ok=True)
+        while True:
+            archive = join(parent, self._resolve_name(parent, name + self.archive_format.suffix))
+            try:
+                os.close(os.open(archive, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o644))
+                return archive
+            except FileExistsError:
+                # Taken by a concurrent run since the name was resolved
+                continue
+
+    def pack_operations(self, plan: CompactPlan, progress: ProgressReporter | None = None) -> int:
+        """
+        Pack a plan's files into one archive per target directory.
+
+        Each target directory ``<dir>`` becomes an archive ``<dir>.tar.xz``
+        (or ``_N`` before the suffix if that exists) holding the files under
+        their target names. Archives are written in parallel worker
+        processes. A source file is deleted only after its archive has been
+        closed and synced to disk.
+
+        Args:
+            plan: Plan of the files to pack
+            progress: Reporter advanced after every file
+
+        Returns:
+            Number of files packed
+
+        Raises:
+            ValueError: If the organizer has no archive format
+        """
+        if self.archive_format is None:
+            raise ValueError("pack_operations needs an archive_format")
+        from tidydir.packing import pack_archive
+
+        groups: dict[str, list[tuple[int, str, str, int]]] = {}
+        for move in plan.iter_moves():
+            groups.setdefault(os.path.dirname(move[2]), []).append(move)
+
+        started = time.perf_counter()
+        jobs: list[tuple[str, list[tuple[int, str, str, int]]]] = []
+        for directory, moves in groups.items():
+            try:
+                if self._target_lock is not None:
+                    with self._target_lock:
+                        archive = self._reserve_archive(directory)
+                else:
+                    archive = self._reserve_archive(directory)
+            except OSError as e:
+                for index, source, _, size in moves:
+                    self._pack_failed(plan, index, source, str(e), progress, size)
+                continue
+            jobs.append((archive, moves))
+
+        fmt = self.archive_format.value
+        packed = 0
+        workers = min(len(jobs), os.cpu_count() or 1)
+        if workers > 1:
+            from concurrent.futures import ProcessPoolExecutor, as_completed
+
+            with ProcessPoolExecutor(workers) as pool:
+                futures = {
+                    pool.submit(
+                        pack_archive, archive, fmt, [(m[1], os.path.basename(m[2])) for m in moves]
+                    ): moves
+                    for archive, moves in jobs
+                }
+                for future in as_completed(futures):
+                    packed += self._finish_archive(plan, future.result(), futures[future], progress)
+        else:
+            for archive, moves in jobs:
+                result = pack_archive(archive, fmt, [(m[1], os.path.basename(m[2])) for m in moves])
+                packed += self._finish_archive(plan, result, moves, progress)
+
+        self.stats.add("pack", time.perf_counter() - started, len(plan))
+        self.stats.incr(
+            "archives_written", sum(1 for archive, _ in jobs if os.path.exists(archive))
+        )
+        self.stats.incr("files_packed", packed)
+        return packed
+
+    def _pack_failed(
+        self,
+        plan: CompactPlan,
+        index: int,
+        source: str,
+        error: str,
+        progress: ProgressReporter | None,
+        size: int,
+    ) -> None:
+        """Record a file that could not be packed."""
+        self.errors.append((Path(source), error))
+        if self.logger:
+            self.logger.error(
+                "Failed to pack %s: %s", source, error, extra={"event": "failed", "source": source}
+            )
+        on_failed = self.hooks.dispatcher(HookEvent.FAILED)
+        if on_failed is not None:
+            on_failed(plan[index], OSError(error))
+        if progress is not None:
+            progress.advance(size)
+
+    def _finish_archive(
+        self,
+        plan: CompactPlan,
+        result: PackResult,
+        moves: list[tuple[int, str, str, int]],
+        progress: ProgressReporter | None,
+    ) -> int:
+        """Delete the sources of a written archive and record its outcome."""
+        archive = result.archive
+        if not result.packed:
+            # Nothing made it in; drop the reserved name or empty archive
+            with contextlib.suppress(OSError):
+                os.unlink(archive)
+        for position, error in result.errors:
+            index, source, _, size = moves[position]
+            self._pack_failed(plan, index, source, error, progress, size)
+
+        on_moved = self.hooks.dispatcher(HookEvent.MOVED)
+        packed = 0
+        for position in result.packed:
+            index, source, target, size = moves[position]
+            member = os.path.basename(target)
+            try:
+                os.unlink(source)
+            except OSError as e:
+                self._pack_failed(
+                    plan, index, source, f"packed into {archive} but not removed: {e}", None, 0
+                )
+            else:
+                packed += 1
+                if self.logger:
+                    self.logger.info(
+                        "Packed: %s → %s:%s",
+                        source,
+                        archive,
+                        member,
+                        extra={"event": "packed", "source": source, "target": archive},
+                    )
+                if on_moved is not None:
+                    operation = plan[index]
+                    operation.target = Path(archive, member)
+                    on_moved(operation)
+            if progress is not None:
+                progress.advance(size)
+        return packed
+
+    def execute(self, plan: CompactPlan | None = None) -> OrganizeResult:
         """
         Execute the file organization.
 
+        Args:
+            plan: Previously computed plan to execute; planned afresh when omitted
+
         Returns:
             Result of the organization operation
+
+        Raises:
+            ValueError: If the plan only kept its summary
         """
-        operations = self.preview()
+        if plan is None:
+            plan = self.plan()
+        elif not plan.keep_operations:
+            raise ValueError("Cannot execute a plan that only kept its summary")
 
-        if not operations:
+        if not plan:
+            self.release_locks()
             return OrganizeResult(moved_count=0, total_count=0)
 
+        # Old files are packed instead of moved when an archive format is set
+        total = len(plan)
+        total_bytes = plan.total_bytes
+        old: CompactPlan | None = None
+        if self.archive_format is not None:
+            plan, old = plan.split_old()
+
         # Create directories
-        for parent_dir in operations:
-            Path(parent_dir).mkdir(parents=True, exist_ok=True)
+        self.prepare_directories(plan)
 
         # Move files
-        total = sum(len(file_ops) for file_ops in operations.values())
         moved = 0
 
         # Reset errors for new execution
@@ -375,22 +1118,28 @@ class FileOrganizer:
 
         print(f"\nMoving {total} files...")
 
-        for file_ops in operations.values():
-            for file_op in file_ops:
-                try:
-                    shutil.move(str(file_op.source), str(file_op.target))
-                    moved += 1
-
-                    if self.logger:
-                        self.logger.info(f"Moved: {file_op.source} → {file_op.target}")
-
-                    if moved % 50 == 0:
-                        print(f"Progress: {moved}/{total} files moved")
+        progress = create_progress(total, total_bytes, enabled=self.show_progress)
+        if progress is not None:
+            progress.start()
 
-                except Exception as e:
-                    self.errors.append((file_op.source, str(e)))
-                    if self.logger:
-                        self.logger.error(f"Failed to move {file_op.source}: {e}")
+        move_started = time.perf_counter()
+        try:
+            try:
+                if self._lanes is not None:
+                    moved = self._lanes.run(self, plan, progress)
+                else:
+                    moved = self.move_operations(plan, progress=progress)
+            finally:
+                self.stats.add("move", time.perf_counter() - move_started, len(plan))
+            if old:
+                moved += self.pack_operations(old, progress)
+        finally:
+            if progress is not None:
+                progress.stop()
+            self.release_locks()
+
+        self.stats.incr("files_moved", moved)
+        self.stats.incr("files_failed", len(self.errors))
 
         print(f"\n✅ Completed: {moved}/{total} files organized")
 
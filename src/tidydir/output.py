@@ -0,0 +1,151 @@
+"""Machine-readable preview output."""
+
+from __future__ import annotations
+
+import json
+import os
+import sys
+from collections.abc import Iterable
+from enum import Enum
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, TextIO
+
+from tidydir.hooks import HookEvent
+from tidydir.plan import CompactPlan, FileOperation, PlanSummary
+
+if TYPE_CHECKING:
+    from tidydir.organizer import FileOrganizer
+
+
+class OutputFormat(str, Enum):
+    """Preview output formats."""
+
+    TEXT = "text"
+    JSON = "json"
+    NDJSON = "ndjson"
+
+
+def operation_record(operation: FileOperation) -> dict[str, Any]:
+    """
+    Describe an operation as plain data.
+
+    Args:
+        operation: Operation to describe
+
+    Returns:
+        Dictionary with the source, target, category, age and size
+    """
+    return {
+        "source": str(operation.source),
+        "target": str(operation.target),
+        "category": operation.category.value,
+        "old": operation.is_old,
+        "size": operation.size,
+        "renamed": operation.source.name != operation.target.name,
+    }
+
+
+def summary_record(
+    summary: PlanSummary, target_dir: Path, conflicts: int, old_days: int
+) -> dict[str, Any]:
+    """
+    Describe a plan's totals as plain data.
+
+    Args:
+        summary: Totals of the plan
+        target_dir: Target root of the run
+        conflicts: Number of files that will be renamed
+        old_days: Age in days above which files are archived
+
+    Returns:
+        Dictionary with totals overall and per category
+    """
+    return {
+        "target": str(target_dir),
+        "total_files": summary.total_count,
+        "total_bytes": summary.total_bytes,
+        "old_files": summary.old_count,
+        "old_days": old_days,
+        "conflicts": conflicts,
+        "categories": {
+            category.value: {"files": count, "bytes": size}
+            for category, (count, size) in summary.by_category().items()
+        },
+    }
+
+
+def stream_preview(
+    organizer: FileOrganizer,
+    output_format: OutputFormat | str,
+    stream: TextIO | None = None,
+    paths: Iterable[str | os.PathLike[str]] | None = None,
+) -> CompactPlan:
+    """
+    Plan a run and write every operation as it is planned.
+
+    Operations are written from a ``planned`` hook and not kept, so memory
+    stays flat however many files there are. ``ndjson`` writes one
+    ``{"type": "operation", ...}`` object per line followed by a
+    ``{"type": "summary", ...}`` line; ``json`` writes a single document
+    ``{"operations": [...], "summary": {...}}``.
+
+    Args:
+        organizer: Organizer to plan with
+        output_format: ``json`` or ``ndjson``
+        stream: Stream to write to (defaults to stdout)
+        paths: Files to plan instead of scanning the source, see
+            ``FileOrganizer.plan_paths``
+
+    Returns:
+        The plan, holding only its summary
+
+    Raises:
+        ValueError: If the format is not a machine-readable one
+    """
+    output_format = OutputFormat(output_format)
+    if output_format is OutputFormat.TEXT:
+        raise ValueError("stream_preview writes json or ndjson")
+    out = stream if stream is not None else sys.stdout
+    write = out.write
+    dumps = json.dumps
+    count = 0
+
+    if output_format is OutputFormat.NDJSON:
+
+        def on_planned(operation: FileOperation) -> None:
+            nonlocal count
+            write(dumps({"type": "operation", **operation_record(operation)}) + "\n")
+            count += 1
+            if count == 1:
+                # Let consumers start before the first buffer fills
+                out.flush()
+
+    else:
+        write('{"operations": [')
+
+        def on_planned(operation: FileOperation) -> None:
+            nonlocal count
+            write(("\n  " if count == 0 else ",\n  ") + dumps(operation_record(operation)))
+            count += 1
+
+    organizer.add_hook(HookEvent.PLANNED, on_planned)
+    try:
+        if paths is None:
+            plan = organizer.plan(keep_operations=False)
+        else:
+            plan = organizer.plan_paths(paths, keep_operations=False)
+    finally:
+        organizer.remove_hook(HookEvent.PLANNED, on_planned)
+
+    summary = summary_record(
+        plan.summary,
+        organizer.target_dir,
+        len(organizer.conflicts),
+        organizer.old_files_days,
+    )
+    if output_format is OutputFormat.NDJSON:
+        write(dumps({"type": "summary", **summary}) + "\n")
+    else:
+        write(("\n" if count else "") + '], "summary": ' + dumps(summary) + "}\n")
+    out.flush()
+    return plan
@@ -0,0 +1,127 @@
+"""Packing old files into compressed archives instead of moving them."""
+
+from __future__ import annotations
+
+import contextlib
+import os
+import shutil
+import tarfile
+import zipfile
+from collections.abc import Callable, Iterator
+from dataclasses import dataclass, field
+from enum import Enum
+from typing import BinaryIO, Literal
+
+# Read size when copying a file into an archive
+COPY_BUFFER = 1024 * 1024
+
+
+class ArchiveFormat(str, Enum):
+    """Formats old files can be packed into."""
+
+    TAR_XZ = "tar.xz"
+    TAR_GZ = "tar.gz"
+    ZIP = "zip"
+
+    @property
+    def suffix(self) -> str:
+        """File name suffix of archives in this format."""
+        return f".{self.value}"
+
+
+@dataclass
+class PackResult:
+    """Outcome of writing one archive."""
+
+    archive: str
+    packed: list[int] = field(default_factory=list)
+    errors: list[tuple[int, str]] = field(default_factory=list)
+
+
+def _fsync(path: str) -> None:
+    """Flush a file's data to disk."""
+    fd = os.open(path, os.O_RDONLY)
+    try:
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+
+
+@contextlib.contextmanager
+def _open_archive(
+    path: str, archive_format: ArchiveFormat
+) -> Iterator[Callable[[BinaryIO, str, str], None]]:
+    """Open an archive for writing and yield a function that adds one open file."""
+    if archive_format is ArchiveFormat.ZIP:
+        with zipfile.ZipFile(path, "w", zipfile.ZIP_DEFLATED) as zf:
+
+            def add_zip(src: BinaryIO, source: str, name: str) -> None:
+                info = zipfile.ZipInfo.from_file(source, name, strict_timestamps=False)
+                info.compress_type = zipfile.ZIP_DEFLATED
+                with zf.open(info, "w", force_zip64=True) as dest:
+                    shutil.copyfileobj(src, dest, COPY_BUFFER)
+
+            yield add_zip
+    else:
+        mode: Literal["w:xz", "w:gz"] = "w:xz" if archive_format is ArchiveFormat.TAR_XZ else "w:gz"
+        with tarfile.open(path, mode) as tf:
+
+            def add_tar(src: BinaryIO, _source: str, name: str) -> None:
+                tf.addfile(tf.gettarinfo(arcname=name, fileobj=src), src)
+
+            yield add_tar
+
+
+def pack_archive(
+    archive: str, archive_format: ArchiveFormat | str, members: list[tuple[str, str]]
+) -> PackResult:
+    """
+    Write files into a new archive.
+
+    The archive is written next to its final path, closed and synced to
+    disk, and only then renamed into place, so a member listed in
+    ``packed`` is durably stored. Sources are not touched. Runs in a
+    worker process.
+
+    A source that cannot be opened is reported in ``errors`` and skipped;
+    any other failure abandons the whole archive.
+
+    Args:
+        archive: Path of the archive to write; an existing file is replaced
+        archive_format: Format of the archive
+        members: Source path and member name of every file to pack
+
+    Returns:
+        Positions in ``members`` that were packed and that failed
+    """
+    archive_format = ArchiveFormat(archive_format)
+    result = PackResult(archive)
+    partial = f"{archive}.partial"
+    try:
+        with _open_archive(partial, archive_format) as add:
+            for position, (source, name) in enumerate(members):
+                opened = False
+                try:
+                    with open(source, "rb") as src:
+                        opened = True
+                        add(src, source, name)
+                except OSError as e:
+                    if opened:
+                        raise
+                    result.errors.append((position, str(e)))
+                    continue
+                result.packed.append(position)
+        _fsync(partial)
+        os.replace(partial, archive)
+    except Exception as e:
+        with contextlib.suppress(OSError):
+            os.unlink(partial)
+        failed = {position for position, _ in result.errors}
+        result.errors += [
+            (position, f"Could not write {archive}: {e}")
+            for position in range(len(members))
+            if position not in failed
+        ]
+        result.errors.sort()
+        result.packed = []
+    return result
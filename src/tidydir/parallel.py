@@ -0,0 +1,248 @@
+"""Planning with worker processes, one shard per top-level subdirectory."""
+
+from __future__ import annotations
+
+import os
+import time
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from tidydir._paths import join, scan_files, split_ext
+from tidydir.categories import FileCategory
+from tidydir.hooks import HookEvent
+from tidydir.layout import ArchiveLayout
+from tidydir.plan import CATEGORIES, CATEGORY_IDS, CompactPlan, FileOperation
+
+if TYPE_CHECKING:
+    from tidydir.organizer import FileOrganizer
+
+# Settings shared by every shard, set once per worker process
+_ext_map: dict[str, FileCategory] = {}
+_cutoff = 0.0
+_target_root = ""
+_layout = ArchiveLayout()
+
+
+@dataclass(slots=True)
+class ShardResult:
+    """Scanned, classified and stat()ed files of one shard, in scan order."""
+
+    dirs: list[str] = field(default_factory=list)
+    dir_ids: array[int] = field(default_factory=lambda: array("I"))
+    names: list[str] = field(default_factory=list)
+    categories: array[int] = field(default_factory=lambda: array("B"))
+    old: array[int] = field(default_factory=lambda: array("B"))
+    sizes: array[int] = field(default_factory=lambda: array("Q"))
+    mtimes: array[int] = field(default_factory=lambda: array("q"))
+    # Whether the unchanged name is free in its target directory
+    free: array[int] = field(default_factory=lambda: array("B"))
+    scan_seconds: float = 0.0
+    classify_seconds: float = 0.0
+    stat_seconds: float = 0.0
+
+
+def _init_worker(
+    ext_map: dict[str, FileCategory], cutoff: float, target_root: str, layout: ArchiveLayout
+) -> None:
+    """Store the run's settings in a worker process."""
+    global _ext_map, _cutoff, _target_root, _layout
+    _ext_map, _cutoff = ext_map, cutoff
+    _target_root, _layout = target_root, layout
+
+
+def plan_shard(root: str, recursive: bool) -> ShardResult:
+    """
+    Scan, classify and stat the files of one shard.
+
+    Also checks whether each file's name is still free in its target
+    directory, so the parent only touches the disk for actual conflicts.
+
+    Args:
+        root: Directory of the shard
+        recursive: Whether to descend into subdirectories
+
+    Returns:
+        The shard's files
+    """
+    result = ShardResult()
+    dir_ids: dict[str, int] = {}
+    target_dirs: dict[FileCategory, str] = {}
+    archive_dir = _layout.directory
+    default_category = FileCategory.FILES
+
+    clock = time.perf_counter
+    target_dir: str | None
+    last = clock()
+    try:
+        for directory, entry in scan_files(root, recursive):
+            start = clock()
+            result.scan_seconds += start - last
+            name = entry.name
+            category = _ext_map.get(split_ext(name)[1].lower(), default_category)
+            classified = clock()
+            try:
+                st = entry.stat()
+                mtime = int(st.st_mtime)
+                is_old = st.st_mtime < _cutoff
+                size = st.st_size
+            except OSError:
+                mtime, is_old, size = int(time.time()), False, 0
+            last = clock()
+            result.classify_seconds += classified - start
+            result.stat_seconds += last - classified
+
+            dir_id = dir_ids.get(directory)
+            if dir_id is None:
+                dir_id = dir_ids[directory] = len(result.dirs)
+                result.dirs.append(directory)
+            if is_old:
+                target_dir = archive_dir(category, mtime)
+            else:
+                target_dir = target_dirs.get(category)
+                if target_dir is None:
+                    target_dir = target_dirs[category] = join(_target_root, category.value)
+
+            result.dir_ids.append(dir_id)
+            result.names.append(name)
+            result.categories.append(CATEGORY_IDS[category])
+            result.old.append(is_old)
+            result.sizes.append(size)
+            result.mtimes.append(mtime)
+            result.free.append(not os.path.lexists(join(target_dir, name)))
+    except OSError:
+        # An unreadable shard is skipped like an unreadable subdirectory
+        pass
+    return result
+
+
+def plan_parallel(
+    organizer: FileOrganizer, processes: int, keep_operations: bool = True
+) -> CompactPlan:
+    """
+    Plan a recursive run with a pool of worker processes.
+
+    The files directly in the source directory form one shard and every
+    top-level subdirectory another; with locking, only leased shards are
+    planned. Workers scan, classify and stat their
+    shard; the parent merges the shards in the order a serial scan would
+    visit them and resolves name conflicts centrally, so the plan is the
+    same as ``FileOrganizer.plan`` would produce.
+
+    Args:
+        organizer: Organizer to plan for
+        processes: Number of worker processes
+        keep_operations: Whether to store every operation in the plan
+
+    Returns:
+        The merged plan
+    """
+    stats = organizer.stats
+    stats.reset()
+    plan = CompactPlan(keep_operations)
+    organizer.conflicts.clear()
+
+    target_root = str(organizer.target_dir)
+    organizer._layout = None
+    layout = organizer.get_archive_layout()
+    archive_dir = layout.directory
+    organizer._sharder = None
+    sharder = organizer.get_sharder()
+    shard_dir = sharder.directory if sharder is not None else None
+    try:
+        partitions = organizer._partitions()
+    except OSError as e:
+        if organizer.logger:
+            organizer.logger.error("Error reading directory: %s", e)
+        return plan
+
+    on_planned = organizer.hooks.dispatcher(HookEvent.PLANNED)
+    claimed: set[str] = set()
+    dir_cache: dict[int, str] = {}
+    resolve_name = organizer._resolve_name
+    count = 0
+    resolve_time = 0.0
+    clock = time.perf_counter
+    target_dir: str | None
+
+    with ProcessPoolExecutor(
+        max_workers=processes,
+        initializer=_init_worker,
+        initargs=(
+            organizer.ext_to_category,
+            organizer.old_files_cutoff.timestamp(),
+            target_root,
+            layout,
+        ),
+    ) as pool:
+        results = pool.map(
+            plan_shard,
+            [directory for directory, _ in partitions],
+            [recursive for _, recursive in partitions],
+            chunksize=1,
+        )
+        for shard in results:
+            started = clock()
+            dirs = shard.dirs
+            for dir_id, name, category_id, is_old, size, mtime, free in zip(
+                shard.dir_ids,
+                shard.names,
+                shard.categories,
+                shard.old,
+                shard.sizes,
+                shard.mtimes,
+                shard.free,
+                strict=True,
+            ):
+                if is_old:
+                    target_dir = archive_dir(CATEGORIES[category_id], mtime)
+                else:
+                    target_dir = dir_cache.get(category_id)
+                    if target_dir is None:
+                        target_dir = join(target_root, CATEGORIES[category_id].value)
+                        dir_cache[category_id] = target_dir
+                    if shard_dir is not None:
+                        base_dir = target_dir
+                        target_dir = shard_dir(base_dir, name, mtime)
+                        # Workers only checked the name in the category directory
+                        free = free and target_dir == base_dir
+
+                path = join(target_dir, name)
+                if free and path not in claimed:
+                    claimed.add(path)
+                    target_name = name
+                else:
+                    target_name = resolve_name(target_dir, name, claimed)
+                    if target_name != name:
+                        organizer.conflicts.append(
+                            (Path(dirs[dir_id], name), Path(target_dir, target_name))
+                        )
+
+                category = CATEGORIES[category_id]
+                plan.append(
+                    dirs[dir_id], name, target_dir, target_name, category, bool(is_old), size
+                )
+                if on_planned is not None:
+                    on_planned(
+                        FileOperation(
+                            source=Path(dirs[dir_id], name),
+                            target=Path(target_dir, target_name),
+                            category=category,
+                            is_old=bool(is_old),
+                            size=size,
+                        )
+                    )
+            resolve_time += clock() - started
+            count += len(shard.names)
+            # Worker time is summed over processes, like CPU time
+            stats.add("scan", shard.scan_seconds, len(shard.names))
+            stats.add("classify", shard.classify_seconds, len(shard.names))
+            stats.add("stat", shard.stat_seconds, len(shard.names))
+
+    stats.add("resolve", resolve_time, count)
+    stats.incr("files_scanned", count)
+    stats.incr("files_planned", count)
+    stats.incr("conflicts", len(organizer.conflicts))
+    return plan
@@ -0,0 +1,494 @@
+"""Compact, columnar storage for planned file operations."""
+
+from __future__ import annotations
+
+import sys
+from array import array
+from collections import defaultdict
+from collections.abc import Iterable, Iterator
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import overload
+
+from tidydir._paths import join
+from tidydir.categories import FileCategory
+
+# File names are stored as bytes; surrogateescape round-trips undecodable names
+_ENCODING = "utf-8"
+_ERRORS = "surrogateescape"
+
+# Category ids are indexes into this tuple
+CATEGORIES: tuple[FileCategory, ...] = tuple(FileCategory)
+CATEGORY_IDS: dict[FileCategory, int] = {category: i for i, category in enumerate(CATEGORIES)}
+
+# Example file names kept per target directory for the preview
+SAMPLE_SIZE = 3
+
+
+@dataclass(slots=True)
+class FileOperation:
+    """Represents a file operation to be performed."""
+
+    source: Path
+    target: Path
+    category: FileCategory
+    is_old: bool
+    size: int = 0
+
+
+@dataclass(slots=True)
+class PlanBucket:
+    """Running totals for the files of one category in one target directory."""
+
+    directory: str
+    category: FileCategory
+    is_old: bool
+    count: int = 0
+    size: int = 0
+    samples: list[str] = field(default_factory=list)
+
+
+class PlanSummary:
+    """
+    Aggregates of a plan, kept up to date while operations are added.
+
+    Only one bucket per target directory and category is touched per file,
+    so totals per category and for old files can be reported in time
+    proportional to the number of target directories rather than the
+    number of files. Layouts without ``{category}`` put several categories
+    into one directory, which then has a bucket for each.
+    """
+
+    def __init__(self, sample_size: int = SAMPLE_SIZE) -> None:
+        """
+        Initialize an empty summary.
+
+        Args:
+            sample_size: Number of example file names kept per bucket
+        """
+        self.sample_size = sample_size
+        self.buckets: dict[tuple[str, FileCategory], PlanBucket] = {}
+
+    @classmethod
+    def from_operations(
+        cls, operations: Iterable[FileOperation], sample_size: int = SAMPLE_SIZE
+    ) -> PlanSummary:
+        """
+        Build a summary from existing operations.
+
+        Args:
+            operations: Operations to summarize
+            sample_size: Number of example file names kept per bucket
+
+        Returns:
+            The summary
+        """
+        summary = cls(sample_size)
+        for op in operations:
+            summary.add(str(op.target.parent), op.source.name, op.category, op.is_old, op.size)
+        return summary
+
+    def add(
+        self, target_dir: str, name: str, category: FileCategory, is_old: bool, size: int
+    ) -> None:
+        """
+        Count one operation.
+
+        Args:
+            target_dir: Directory the file is moved to
+            name: Source file name
+            category: File category
+            is_old: Whether the file is old
+            size: File size in bytes
+        """
+        key = (target_dir, category)
+        bucket = self.buckets.get(key)
+        if bucket is None:
+            bucket = self.buckets[key] = PlanBucket(target_dir, category, is_old)
+        bucket.count += 1
+        bucket.size += size
+        if len(bucket.samples) < self.sample_size:
+            bucket.samples.append(name)
+
+    @property
+    def total_count(self) -> int:
+        """Number of operations."""
+        return sum(bucket.count for bucket in self.buckets.values())
+
+    @property
+    def total_bytes(self) -> int:
+        """Combined size of all files."""
+        return sum(bucket.size for bucket in self.buckets.values())
+
+    @property
+    def old_count(self) -> int:
+        """Number of old files."""
+        return sum(bucket.count for bucket in self.buckets.values() if bucket.is_old)
+
+    def by_category(self) -> dict[FileCategory, tuple[int, int]]:
+        """
+        Get totals per category.
+
+        Returns:
+            Dictionary mapping categories, in sorted order, to their file
+            count and combined size
+        """
+        totals: dict[FileCategory, tuple[int, int]] = {}
+        for bucket in self.buckets.values():
+            count, size = totals.get(bucket.category, (0, 0))
+            totals[bucket.category] = (count + bucket.count, size + bucket.size)
+        return dict(sorted(totals.items()))
+
+
+class NameStore:
+    """Append-only store of strings packed into a single buffer."""
+
+    __slots__ = ("_data", "_offsets")
+
+    def __init__(self) -> None:
+        """Initialize an empty store."""
+        self._data = bytearray()
+        self._offsets = array("Q", [0])
+
+    def append(self, name: str) -> int:
+        """
+        Store a name.
+
+        Args:
+            name: Name to store
+
+        Returns:
+            Index of the stored name
+        """
+        self._data += name.encode(_ENCODING, _ERRORS)
+        self._offsets.append(len(self._data))
+        return len(self._offsets) - 2
+
+    def __getitem__(self, index: int) -> str:
+        """Get a stored name."""
+        start, end = self._offsets[index], self._offsets[index + 1]
+        return self._data[start:end].decode(_ENCODING, _ERRORS)
+
+    def __len__(self) -> int:
+        """Number of stored names."""
+        return len(self._offsets) - 1
+
+    @property
+    def nbytes(self) -> int:
+        """Approximate memory used by the store."""
+        return len(self._data) + self._offsets.itemsize * len(self._offsets)
+
+
+class CompactPlan:
+    """
+    Planned operations stored as parallel arrays.
+
+    Directories are interned into a table and referenced by integer id,
+    categories are stored as small integers and file names are packed into
+    one buffer. A target name is only stored separately when conflict
+    resolution renamed the file. Indexing or iterating the plan yields
+    ordinary ``FileOperation`` objects, built on demand. A ``PlanSummary``
+    is maintained alongside the columns.
+
+    With ``keep_operations=False`` only the summary is kept, for callers that
+    consume each operation as it is planned and just need the totals.
+    """
+
+    def __init__(self, keep_operations: bool = True) -> None:
+        """
+        Initialize an empty plan.
+
+        Args:
+            keep_operations: Whether to store the operations themselves
+        """
+        self.keep_operations = keep_operations
+        self.summary = PlanSummary()
+        self._dirs: list[str] = []
+        self._dir_ids: dict[str, int] = {}
+        self._source_dirs = array("I")
+        self._target_dirs = array("I")
+        self._categories = array("B")
+        self._old = array("B")
+        self._sizes = array("Q")
+        self._names = NameStore()
+        self._renamed: dict[int, str] = {}
+
+    def intern_dir(self, directory: str) -> int:
+        """
+        Get the id of a directory, adding it to the table if needed.
+
+        Args:
+            directory: Directory path
+
+        Returns:
+            Directory id
+        """
+        dir_id = self._dir_ids.get(directory)
+        if dir_id is None:
+            dir_id = len(self._dirs)
+            self._dirs.append(directory)
+            self._dir_ids[directory] = dir_id
+        return dir_id
+
+    def append(
+        self,
+        source_dir: str,
+        name: str,
+        target_dir: str,
+        target_name: str,
+        category: FileCategory,
+        is_old: bool,
+        size: int = 0,
+    ) -> int:
+        """
+        Add an operation.
+
+        Args:
+            source_dir: Directory containing the source file
+            name: Source file name
+            target_dir: Directory the file is moved to
+            target_name: File name in the target directory
+            category: File category
+            is_old: Whether the file is old
+            size: File size in bytes
+
+        Returns:
+            Index of the operation
+        """
+        if not self.keep_operations:
+            self.summary.add(target_dir, name, category, is_old, size)
+            return -1
+        index = len(self._source_dirs)
+        self._source_dirs.append(self.intern_dir(source_dir))
+        self._target_dirs.append(self.intern_dir(target_dir))
+        self._categories.append(CATEGORY_IDS[category])
+        self._old.append(is_old)
+        self._sizes.append(size)
+        self._names.append(name)
+        if target_name != name:
+            self._renamed[index] = target_name
+        self.summary.add(target_dir, name, category, is_old, size)
+        return index
+
+    def add(self, operation: FileOperation) -> int:
+        """
+        Add a ``FileOperation``.
+
+        Args:
+            operation: Operation to add
+
+        Returns:
+            Index of the operation
+        """
+        return self.append(
+            str(operation.source.parent),
+            operation.source.name,
+            str(operation.target.parent),
+            operation.target.name,
+            operation.category,
+            operation.is_old,
+            operation.size,
+        )
+
+    def set_target_name(self, index: int, target_name: str) -> None:
+        """
+        Change the target file name of an operation.
+
+        Args:
+            index: Index of the operation
+            target_name: New file name in the same target directory
+        """
+        if target_name == self._names[index]:
+            self._renamed.pop(index, None)
+        else:
+            self._renamed[index] = target_name
+
+    def __len__(self) -> int:
+        """Number of planned operations."""
+        if not self.keep_operations:
+            return self.summary.total_count
+        return len(self._source_dirs)
+
+    def __bool__(self) -> bool:
+        """Whether the plan has any operations."""
+        return len(self) > 0
+
+    @overload
+    def __getitem__(self, index: int) -> FileOperation: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> list[FileOperation]: ...
+
+    def __getitem__(self, index: int | slice) -> FileOperation | list[FileOperation]:
+        """Build the ``FileOperation`` at an index."""
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+        if index < 0:
+            index += len(self)
+        name = self._names[index]
+        target_name = self._renamed.get(index, name)
+        return FileOperation(
+            source=Path(self._dirs[self._source_dirs[index]], name),
+            target=Path(self._dirs[self._target_dirs[index]], target_name),
+            category=CATEGORIES[self._categories[index]],
+            is_old=bool(self._old[index]),
+            size=self._sizes[index],
+        )
+
+    def __iter__(self) -> Iterator[FileOperation]:
+        """Iterate over the operations in planning order."""
+        for index in range(len(self._source_dirs)):
+            yield self[index]
+
+    def iter_moves(
+        self, start: int = 0, stop: int | None = None
+    ) -> Iterator[tuple[int, str, str, int]]:
+        """
+        Iterate over the operations as plain strings.
+
+        Args:
+            start: Index of the first operation
+            stop: Index after the last operation (defaults to the end)
+
+        Yields:
+            Tuples of operation index, source path, target path and size
+        """
+        yield from self.iter_moves_at(range(*slice(start, stop).indices(len(self._source_dirs))))
+
+    def iter_moves_at(self, indices: Iterable[int]) -> Iterator[tuple[int, str, str, int]]:
+        """
+        Iterate over chosen operations as plain strings.
+
+        Args:
+            indices: Indexes of the operations, in the order to yield them
+
+        Yields:
+            Tuples of operation index, source path, target path and size
+        """
+        dirs = self._dirs
+        names = self._names
+        renamed = self._renamed
+        source_dirs = self._source_dirs
+        target_dirs = self._target_dirs
+        sizes = self._sizes
+        for index in indices:
+            name = names[index]
+            yield (
+                index,
+                join(dirs[source_dirs[index]], name),
+                join(dirs[target_dirs[index]], renamed.get(index, name)),
+                sizes[index],
+            )
+
+    def bytes_at(self, indices: Iterable[int]) -> int:
+        """
+        Get the combined size of chosen operations.
+
+        Args:
+            indices: Indexes of the operations
+
+        Returns:
+            Sum of their sizes in bytes
+        """
+        sizes = self._sizes
+        return sum(sizes[index] for index in indices)
+
+    def split_by_size(self, threshold: int) -> tuple[array[int], array[int]]:
+        """
+        Split the operations into files below a size and files of at least that size.
+
+        Args:
+            threshold: Size in bytes from which a file counts as large
+
+        Returns:
+            Indexes of the small and of the large files, each in planning order
+        """
+        small, large = array("I"), array("I")
+        for index, size in enumerate(self._sizes):
+            (small if size < threshold else large).append(index)
+        return small, large
+
+    @property
+    def total_bytes(self) -> int:
+        """Combined size of all planned files."""
+        return self.summary.total_bytes
+
+    def split_old(self) -> tuple[CompactPlan, CompactPlan]:
+        """
+        Split the plan into its recent and its old files.
+
+        Returns:
+            A plan of the files that are not old and a plan of the old files,
+            each in planning order
+        """
+        recent, old = CompactPlan(), CompactPlan()
+        dirs = self._dirs
+        for index in range(len(self._source_dirs)):
+            name = self._names[index]
+            is_old = bool(self._old[index])
+            (old if is_old else recent).append(
+                dirs[self._source_dirs[index]],
+                name,
+                dirs[self._target_dirs[index]],
+                self._renamed.get(index, name),
+                CATEGORIES[self._categories[index]],
+                is_old,
+                self._sizes[index],
+            )
+        return recent, old
+
+    def totals_by_dirs(self) -> dict[tuple[str, str, bool], tuple[int, int]]:
+        """
+        Total the operations per source directory, target directory and age.
+
+        Returns:
+            Dictionary mapping ``(source_dir, target_dir, is_old)`` to the
+            number of files and their combined size
+        """
+        totals: dict[tuple[int, int, int], list[int]] = {}
+        for source, target, old, size in zip(
+            self._source_dirs, self._target_dirs, self._old, self._sizes, strict=True
+        ):
+            key = (source, target, old)
+            total = totals.get(key)
+            if total is None:
+                totals[key] = [1, size]
+            else:
+                total[0] += 1
+                total[1] += size
+        dirs = self._dirs
+        return {
+            (dirs[source], dirs[target], bool(old)): (count, size)
+            for (source, target, old), (count, size) in totals.items()
+        }
+
+    def target_directories(self) -> list[str]:
+        """Get every distinct target directory, in first-use order."""
+        seen = dict.fromkeys(self._target_dirs)
+        return [self._dirs[dir_id] for dir_id in seen]
+
+    def group_by_directory(self) -> defaultdict[str, list[FileOperation]]:
+        """
+        Group the operations by target directory.
+
+        Returns:
+            Dictionary mapping target directories to file operations, as
+            returned by ``FileOrganizer.preview``
+        """
+        grouped: defaultdict[str, list[FileOperation]] = defaultdict(list)
+        for operation_index, dir_id in enumerate(self._target_dirs):
+            grouped[self._dirs[dir_id]].append(self[operation_index])
+        return grouped
+
+    @property
+    def nbytes(self) -> int:
+        """Approximate memory used by the plan."""
+        arrays = (self._source_dirs, self._target_dirs, self._categories, self._old, self._sizes)
+        return (
+            sum(column.itemsize * len(column) for column in arrays)
+            + self._names.nbytes
+            + sum(sys.getsizeof(directory) for directory in self._dirs)
+            + sys.getsizeof(self._dir_ids)
+            + sys.getsizeof(self._renamed)
+            + sum(sys.getsizeof(name) for name in self._renamed.values())
+        )
@@ -0,0 +1,208 @@
+"""Timer-driven progress reporting with throughput and ETA."""
+
+from __future__ import annotations
+
+import sys
+import threading
+import time
+from types import TracebackType
+from typing import TextIO
+
+# Seconds between progress updates
+DEFAULT_INTERVAL = 0.5
+
+
+def format_size(num_bytes: float) -> str:
+    """
+    Format a byte count for humans.
+
+    Args:
+        num_bytes: Number of bytes
+
+    Returns:
+        Size with a binary unit suffix, e.g. ``"1.5 MiB"``
+    """
+    for unit in ("B", "KiB", "MiB", "GiB", "TiB"):
+        if abs(num_bytes) < 1024 or unit == "TiB":
+            return f"{num_bytes:.0f} {unit}" if unit == "B" else f"{num_bytes:.1f} {unit}"
+        num_bytes /= 1024
+    raise AssertionError("unreachable")
+
+
+def format_duration(seconds: float) -> str:
+    """
+    Format a duration for humans.
+
+    Args:
+        seconds: Duration in seconds
+
+    Returns:
+        Duration such as ``"45s"``, ``"2m05s"`` or ``"1h02m"``
+    """
+    seconds = max(0, int(seconds))
+    if seconds < 60:
+        return f"{seconds}s"
+    minutes, seconds = divmod(seconds, 60)
+    if minutes < 60:
+        return f"{minutes}m{seconds:02d}s"
+    hours, minutes = divmod(minutes, 60)
+    return f"{hours}h{minutes:02d}m"
+
+
+class ProgressReporter:
+    """
+    Report progress of a run from a background timer.
+
+    The hot loop only calls ``advance``, which bumps two counters; formatting
+    and writing happen on a separate thread every ``interval`` seconds.
+    """
+
+    def __init__(
+        self,
+        total_files: int,
+        total_bytes: int,
+        stream: TextIO | None = None,
+        interval: float = DEFAULT_INTERVAL,
+    ) -> None:
+        """
+        Initialize the ProgressReporter.
+
+        Args:
+            total_files: Number of files the run will process
+            total_bytes: Combined size of those files
+            stream: Stream to write to (defaults to stderr)
+            interval: Seconds between updates
+        """
+        self.total_files = total_files
+        self.total_bytes = total_bytes
+        self.stream = stream if stream is not None else sys.stderr
+        self.interval = interval
+        self.files_done = 0
+        self.bytes_done = 0
+        self._started = 0.0
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+        self._last_width = 0
+
+    def advance(self, num_bytes: int, files: int = 1) -> None:
+        """
+        Record processed files.
+
+        Args:
+            num_bytes: Combined size of the files
+            files: Number of files
+        """
+        self.files_done += files
+        self.bytes_done += num_bytes
+
+    def start(self) -> None:
+        """Start the update timer."""
+        self._started = time.monotonic()
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="tidydir-progress", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Stop the update timer and write the final line."""
+        if self._thread is None:
+            return
+        self._stop.set()
+        self._thread.join()
+        self._thread = None
+        self._write(self.render(), final=True)
+
+    def __enter__(self) -> ProgressReporter:
+        """Start reporting when entering a ``with`` block."""
+        self.start()
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        """Stop reporting when leaving a ``with`` block."""
+        self.stop()
+
+    def _run(self) -> None:
+        """Write an update every interval until stopped."""
+        while not self._stop.wait(self.interval):
+            self._write(self.render())
+
+    def _write(self, line: str, final: bool = False) -> None:
+        """Overwrite the current terminal line."""
+        padding = " " * max(0, self._last_width - len(line))
+        self._last_width = len(line)
+        self.stream.write(f"\r{line}{padding}" + ("\n" if final else ""))
+        self.stream.flush()
+
+    def eta(self, elapsed: float) -> float | None:
+        """
+        Estimate the remaining time.
+
+        Both the file rate and the byte rate are extrapolated and the slower
+        estimate wins, so runs dominated by either many small files or a few
+        large copies are both covered.
+
+        Args:
+            elapsed: Seconds since the run started
+
+        Returns:
+            Remaining seconds, or None before anything has been processed
+        """
+        if elapsed <= 0 or self.files_done == 0:
+            return None
+        remaining = (self.total_files - self.files_done) * elapsed / self.files_done
+        if self.bytes_done > 0:
+            remaining_bytes = self.total_bytes - self.bytes_done
+            remaining = max(remaining, remaining_bytes * elapsed / self.bytes_done)
+        return remaining
+
+    def render(self) -> str:
+        """Return the current progress line."""
+        files_done = self.files_done
+        bytes_done = self.bytes_done
+        elapsed = time.monotonic() - self._started
+        percent = 100 * files_done / self.total_files if self.total_files else 100.0
+
+        line = (
+            f"Progress: {files_done}/{self.total_files} files ({percent:.1f}%)"
+            f" | {format_size(bytes_done)}/{format_size(self.total_bytes)}"
+        )
+        if elapsed > 0:
+            file_rate = files_done / elapsed
+            line += f" | {file_rate:.0f} files/s, {format_size(bytes_done / elapsed)}/s"
+        eta = self.eta(elapsed)
+        if eta is not None and files_done < self.total_files:
+            line += f" | ETA {format_duration(eta)}"
+        return line
+
+
+def create_progress(
+    total_files: int,
+    total_bytes: int,
+    enabled: bool = True,
+    stream: TextIO | None = None,
+    interval: float = DEFAULT_INTERVAL,
+) -> ProgressReporter | None:
+    """
+    Create a progress reporter if progress should be shown.
+
+    Progress is only shown on an interactive terminal, so logs and pipes
+    are never filled with carriage-return updates.
+
+    Args:
+        total_files: Number of files the run will process
+        total_bytes: Combined size of those files
+        enabled: Whether progress was requested at all
+        stream: Stream to write to (defaults to stderr)
+        interval: Seconds between updates
+
+    Returns:
+        A reporter, or None when progress is disabled
+    """
+    stream = stream if stream is not None else sys.stderr
+    if not enabled or not stream.isatty():
+        return None
+    return ProgressReporter(total_files, total_bytes, stream, interval)
@@ -0,0 +1,261 @@
+"""Capping the entries of category directories with shard subdirectories."""
+
+from __future__ import annotations
+
+import os
+import time
+import zlib
+from collections import Counter
+from collections.abc import Iterator
+from enum import Enum
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from tidydir._paths import join
+from tidydir.categories import FileCategory
+from tidydir.hooks import HookEvent
+from tidydir.layout import SLOT_SECONDS
+from tidydir.plan import CompactPlan, FileOperation
+
+if TYPE_CHECKING:
+    from tidydir.fs import FileEntry, FileSystem
+    from tidydir.organizer import FileOrganizer
+
+
+class ShardBy(str, Enum):
+    """How files are spread over the shards of a full directory."""
+
+    # Two hex digits of a hash of the file name, e.g. ``Images/3f/``
+    HASH = "hash"
+    # Year and month of the file's mtime, e.g. ``Images/2026-10/``
+    DATE = "date"
+
+
+def hash_shard(name: str) -> str:
+    """
+    Get the hash shard of a file name.
+
+    The shard only depends on the name, so a file can be found again
+    without listing the directory. There are 256 shards.
+
+    Args:
+        name: File name without directory
+
+    Returns:
+        Two lowercase hex digits
+    """
+    return f"{zlib.crc32(name.encode('utf-8', 'surrogateescape')) & 0xFF:02x}"
+
+
+class Sharder:
+    """
+    Route files into shard subdirectories once a directory is full.
+
+    A directory is full once it holds ``max_entries`` entries, counting
+    what is already on disk plus the files routed to it in this run.
+    Existing entries are counted once per directory, and at most
+    ``max_entries`` of them are listed, so even a huge directory costs
+    a bounded amount of listing. Shard subdirectories are not capped
+    themselves.
+    """
+
+    def __init__(
+        self, max_entries: int, shard_by: ShardBy | str = ShardBy.HASH, fs: FileSystem | None = None
+    ) -> None:
+        """
+        Initialize the Sharder.
+
+        Args:
+            max_entries: Entries a directory may hold before files go to shards
+            shard_by: How files are spread over the shards
+            fs: File system the directories are counted on (defaults to the
+                local disk)
+
+        Raises:
+            ValueError: If ``max_entries`` is not positive or ``shard_by`` is
+                unknown
+        """
+        if max_entries < 1:
+            raise ValueError(f"Entries per directory must be positive: {max_entries}")
+        if fs is None:
+            from tidydir.fs import LocalFileSystem
+
+            fs = LocalFileSystem()
+        self.max_entries = max_entries
+        self.shard_by = ShardBy(shard_by)
+        self.fs = fs
+        self._counts: dict[str, int] = {}
+        self._months: dict[int, str] = {}
+        self._dirs: dict[tuple[str, str], str] = {}
+
+    def shard(self, name: str, mtime: float) -> str:
+        """
+        Get the shard subdirectory name of a file.
+
+        Args:
+            name: File name without directory
+            mtime: Modification time in seconds since the epoch
+
+        Returns:
+            Name of the shard subdirectory
+        """
+        if self.shard_by is ShardBy.HASH:
+            return hash_shard(name)
+        slot = int(mtime) // SLOT_SECONDS
+        month = self._months.get(slot)
+        if month is None:
+            t = time.localtime(slot * SLOT_SECONDS)
+            month = self._months[slot] = f"{t.tm_year:04d}-{t.tm_mon:02d}"
+        return month
+
+    def count(self, directory: str) -> int:
+        """
+        Get the entries counted for a directory so far, capped at ``max_entries``.
+
+        Args:
+            directory: Directory path
+
+        Returns:
+            Number of entries
+        """
+        count = self._counts.get(directory)
+        if count is None:
+            try:
+                count = self.fs.count_entries(directory, self.max_entries)
+            except OSError:
+                # Unreadable directories fail later, when files are moved
+                count = 0
+            self._counts[directory] = count
+        return count
+
+    def directory(self, directory: str, name: str, mtime: float) -> str:
+        """
+        Get the directory a file goes to and count it there.
+
+        Args:
+            directory: Category directory
+            name: File name without directory
+            mtime: Modification time in seconds since the epoch
+
+        Returns:
+            The category directory while it has room, else one of its shards
+        """
+        count = self.count(directory)
+        if count < self.max_entries:
+            self._counts[directory] = count + 1
+            return directory
+        key = (directory, self.shard(name, mtime))
+        shard_dir = self._dirs.get(key)
+        if shard_dir is None:
+            shard_dir = self._dirs[key] = join(*key)
+        return shard_dir
+
+
+def _shard_files(
+    organizer: FileOrganizer, sharder: Sharder, directory: str
+) -> Iterator[tuple[FileEntry, str, int]]:
+    """Yield the files of a directory with their shard and size."""
+    for _, entry in organizer.fs.scan(directory, False):
+        try:
+            st = entry.stat()
+        except OSError:
+            continue
+        yield entry, sharder.shard(entry.name, st.st_mtime), st.st_size
+
+
+def _drain_quotas(counts: Counter[str], existing: set[str], excess: int) -> dict[str, int]:
+    """
+    Choose how many files to move into each shard to remove ``excess`` entries.
+
+    A new shard adds an entry of its own, so shards that would take the
+    most files are drained first, and shards that would gain nothing are
+    never created.
+    """
+    quotas: dict[str, int] = {}
+    gains = sorted(((count - (shard not in existing), shard) for shard, count in counts.items()))
+    while excess > 0 and gains:
+        gain, shard = gains.pop()
+        if gain <= 0:
+            break
+        cost = counts[shard] - gain
+        quotas[shard] = min(counts[shard], excess + cost)
+        excess -= quotas[shard] - cost
+    return quotas
+
+
+def plan_reshard(organizer: FileOrganizer) -> CompactPlan:
+    """
+    Plan moving files out of oversized category directories into shards.
+
+    Every category directory of the organizer's target with more than
+    ``max_per_dir`` entries gives up files to the shards ``Sharder`` would
+    pick, counting the shard subdirectories it gains, until it is back at
+    the cap. The fullest shards are filled first; if every remaining file
+    would need a shard of its own, the directory stays above the cap. Each
+    oversized directory is listed twice, once to count its files per
+    shard and once to move them. Later runs find the directory full and
+    send new files to the shards as well. Old-file archive directories are
+    left alone.
+
+    Args:
+        organizer: Organizer providing the target, ``max_per_dir``,
+            ``shard_by``, file system and naming rules
+
+    Returns:
+        Plan of the moves
+
+    Raises:
+        ValueError: If the organizer has no ``max_per_dir``
+    """
+    sharder = organizer.get_sharder()
+    if sharder is None:
+        raise ValueError("Resharding needs a maximum number of entries per directory")
+    fs = organizer.fs
+    stats = organizer.stats
+    stats.reset()
+    organizer.conflicts.clear()
+    plan = CompactPlan()
+    claimed: set[str] = set()
+    on_planned = organizer.hooks.dispatcher(HookEvent.PLANNED)
+    target_root = str(organizer.target_dir)
+
+    with stats.timer("scan") as scan:
+        for category in FileCategory:
+            directory = join(target_root, category.value)
+            try:
+                excess = fs.count_entries(directory) - sharder.max_entries
+                if excess <= 0:
+                    continue
+                existing = {os.path.basename(path) for path in fs.list_subdirs(directory)}
+                counts = Counter(
+                    shard for _, shard, _ in _shard_files(organizer, sharder, directory)
+                )
+                quotas = _drain_quotas(counts, existing, excess)
+                for entry, shard, size in _shard_files(organizer, sharder, directory):
+                    if not quotas.get(shard):
+                        continue
+                    quotas[shard] -= 1
+                    name = entry.name
+                    shard_dir = join(directory, shard)
+                    target_name = organizer._resolve_name(shard_dir, name, claimed)
+                    if target_name != name:
+                        organizer.conflicts.append((Path(entry.path), Path(shard_dir, target_name)))
+                    plan.append(directory, name, shard_dir, target_name, category, False, size)
+                    if on_planned is not None:
+                        on_planned(
+                            FileOperation(
+                                source=Path(entry.path),
+                                target=Path(shard_dir, target_name),
+                                category=category,
+                                is_old=False,
+                                size=size,
+                            )
+                        )
+            except OSError as e:
+                if organizer.logger:
+                    organizer.logger.error("Error reading directory: %s", e)
+        scan.items = len(plan)
+
+    stats.incr("files_planned", len(plan))
+    stats.incr("conflicts", len(organizer.conflicts))
+    return plan
@@ -0,0 +1,171 @@
+"""Checking that the target has room for a plan before anything is moved."""
+
+from __future__ import annotations
+
+import os
+import shutil
+from dataclasses import dataclass
+
+from tidydir.plan import CompactPlan
+from tidydir.progress import format_size
+
+
+@dataclass
+class DeviceUsage:
+    """What a plan writes to one device, and what the device has free."""
+
+    # An existing directory on the device
+    path: str
+    files: int = 0
+    bytes: int = 0
+    inodes: int = 0
+    free_bytes: int = 0
+    # None when the file system reports no inode limit
+    free_inodes: int | None = None
+
+    def issues(self) -> list[str]:
+        """
+        Describe what the device is short of.
+
+        Returns:
+            One line for missing space and one for missing inodes, if any
+        """
+        issues = []
+        if self.bytes > self.free_bytes:
+            issues.append(
+                f"Not enough space on {self.path}: {format_size(self.bytes)} needed for "
+                f"{self.files} files, {format_size(self.free_bytes)} free"
+            )
+        if self.free_inodes is not None and self.inodes > self.free_inodes:
+            issues.append(
+                f"Not enough inodes on {self.path}: {self.inodes} needed, "
+                f"{self.free_inodes} free"
+            )
+        return issues
+
+
+def _st_dev(path: str) -> int:
+    """Get the device id of an existing path."""
+    return os.stat(path).st_dev
+
+
+def _device(path: str, missing: set[str]) -> tuple[int, str]:
+    """
+    Get the device a path is or would be created on.
+
+    Args:
+        path: Directory path, which may not exist yet
+        missing: Set the path and its missing parents are added to
+
+    Returns:
+        Device id and the nearest existing directory
+
+    Raises:
+        OSError: If no parent of the path can be stat()ed
+    """
+    while True:
+        try:
+            return _st_dev(path), path
+        except FileNotFoundError:
+            parent = os.path.dirname(path)
+            if parent == path:
+                raise
+            missing.add(path)
+            path = parent
+
+
+def _free(usage: DeviceUsage) -> None:
+    """Fill in the free space and inodes of a device."""
+    if hasattr(os, "statvfs"):
+        st = os.statvfs(usage.path)
+        usage.free_bytes = st.f_bavail * st.f_frsize
+        usage.free_inodes = st.f_favail if st.f_files else None
+    else:
+        usage.free_bytes = shutil.disk_usage(usage.path).free
+
+
+def _block_size(path: str) -> int:
+    """Get the allocation unit of the file system holding a path."""
+    if hasattr(os, "statvfs"):
+        return os.statvfs(path).f_frsize or 4096
+    return 4096
+
+
+def plan_usage(plan: CompactPlan, pack_old: bool = False) -> list[DeviceUsage]:
+    """
+    Work out what a plan writes to each target device.
+
+    A move within one device is a rename and writes nothing. A move to
+    another device copies the file, which takes one inode and its size
+    plus one block of slack; the plan only keeps totals per directory, so
+    this bounds rounding each file up to whole blocks from above. With
+    ``pack_old``, old files are packed into one archive per target
+    directory, counted at their uncompressed size since the sources are
+    only deleted once the archive is written. Every target directory that
+    does not exist yet takes an inode. Sources that are not directories
+    that can be stat()ed, such as members of an archive source, which are
+    listed under the archive file, count as being on another device.
+    Devices are looked up once per directory of the plan, never per file.
+
+    Args:
+        plan: Plan to check; a plan that only kept its summary needs nothing
+        pack_old: Whether old files are packed into archives
+
+    Returns:
+        Usage of every device the plan writes to, with its free space and
+        inodes filled in
+    """
+    usages: dict[int, DeviceUsage] = {}
+    missing: set[str] = set()
+    source_devices: dict[str, int | None] = {}
+    target_devices: dict[str, int] = {}
+    blocks: dict[int, int] = {}
+
+    def target_device(path: str) -> int:
+        dev = target_devices.get(path)
+        if dev is None:
+            dev, existing = _device(path, missing)
+            target_devices[path] = dev
+            if dev not in usages:
+                usages[dev] = DeviceUsage(existing)
+        return dev
+
+    def source_device(path: str) -> int | None:
+        if path not in source_devices:
+            try:
+                # Archive members are written out, even next to the archive
+                source_devices[path] = _st_dev(path) if os.path.isdir(path) else None
+            except OSError:
+                source_devices[path] = None
+        return source_devices[path]
+
+    archives: set[str] = set()
+    for (source_dir, target_dir, is_old), (count, size) in plan.totals_by_dirs().items():
+        if pack_old and is_old:
+            # Archives are written next to the directory they are named after
+            usage = usages[target_device(os.path.dirname(target_dir))]
+            usage.files += count
+            usage.bytes += size
+            if target_dir not in archives:
+                archives.add(target_dir)
+                usage.inodes += 1
+            continue
+        dev = target_device(target_dir)
+        if source_device(source_dir) == dev:
+            continue
+        usage = usages[dev]
+        block = blocks.get(dev)
+        if block is None:
+            block = blocks[dev] = _block_size(usage.path)
+        usage.files += count
+        # One block per file covers each file's last, partly used block
+        usage.bytes += size + count * block
+        usage.inodes += count
+
+    # Each directory created takes an inode on the device of its parent
+    for path in list(missing):
+        usages[target_device(os.path.dirname(path))].inodes += 1
+
+    for usage in usages.values():
+        _free(usage)
+    return [usage for usage in usages.values() if usage.bytes or usage.inodes]
@@ -0,0 +1,238 @@
+"""Per-phase timing and counters for organization runs."""
+
+from __future__ import annotations
+
+import json
+import os
+import tempfile
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass
+from enum import Enum
+from pathlib import Path
+from typing import Any
+
+# Phases in the order a run goes through them
+PHASES = ("scan", "classify", "stat", "resolve", "mkdir", "move")
+
+# Counters reported for every run, even when they stay at zero
+COUNTERS = (
+    "files_scanned",
+    "files_planned",
+    "conflicts",
+    "directories_prepared",
+    "files_moved",
+    "files_failed",
+)
+
+
+class StatsFormat(str, Enum):
+    """Supported stats report formats."""
+
+    TEXT = "text"
+    JSON = "json"
+
+
+@dataclass
+class PhaseStats:
+    """Accumulated time and item count for one phase."""
+
+    seconds: float = 0.0
+    items: int = 0
+
+    @property
+    def rate(self) -> float:
+        """Items per second, or 0 when the phase took no measurable time."""
+        return self.items / self.seconds if self.seconds > 0 else 0.0
+
+
+class RunStats:
+    """Collect monotonic timings and counters for a single run."""
+
+    def __init__(self) -> None:
+        """Initialize empty statistics."""
+        self.phases: dict[str, PhaseStats] = {}
+        self.counters: dict[str, int] = {}
+        self.reset()
+
+    def reset(self, *phases: str) -> None:
+        """
+        Clear statistics.
+
+        Args:
+            phases: Phases to clear; clears everything when omitted
+        """
+        if not phases:
+            self.phases = {phase: PhaseStats() for phase in PHASES}
+            self.counters = dict.fromkeys(COUNTERS, 0)
+            return
+        for phase in phases:
+            self.phases[phase] = PhaseStats()
+
+    def add(self, phase: str, seconds: float, items: int = 1) -> None:
+        """
+        Add time spent in a phase.
+
+        Args:
+            phase: Phase name
+            seconds: Elapsed time in seconds
+            items: Number of items processed in that time
+        """
+        stats = self.phases.setdefault(phase, PhaseStats())
+        stats.seconds += seconds
+        stats.items += items
+
+    def incr(self, counter: str, amount: int = 1) -> None:
+        """
+        Increment a counter.
+
+        Args:
+            counter: Counter name
+            amount: Amount to add
+        """
+        self.counters[counter] = self.counters.get(counter, 0) + amount
+
+    def merge(self, other: RunStats) -> None:
+        """
+        Add another run's timings and counters to these.
+
+        Args:
+            other: Statistics to add
+        """
+        for phase, stats in other.phases.items():
+            self.add(phase, stats.seconds, stats.items)
+        for counter, value in other.counters.items():
+            self.incr(counter, value)
+
+    @contextmanager
+    def timer(self, phase: str, items: int = 0) -> Iterator[PhaseStats]:
+        """
+        Time a block of code as part of a phase.
+
+        The yielded ``PhaseStats`` may have ``items`` bumped inside the block.
+
+        Args:
+            phase: Phase name
+            items: Number of items processed, if known up front
+        """
+        block = PhaseStats(items=items)
+        start = time.perf_counter()
+        try:
+            yield block
+        finally:
+            self.add(phase, time.perf_counter() - start, block.items)
+
+    @property
+    def total_seconds(self) -> float:
+        """Total time across all phases."""
+        return sum(stats.seconds for stats in self.phases.values())
+
+    def to_dict(self) -> dict[str, Any]:
+        """Return the statistics as plain data."""
+        return {
+            "phases": {
+                phase: {
+                    "seconds": round(stats.seconds, 6),
+                    "items": stats.items,
+                    "items_per_second": round(stats.rate, 1),
+                }
+                for phase, stats in self.phases.items()
+            },
+            "counters": dict(self.counters),
+            "total_seconds": round(self.total_seconds, 6),
+        }
+
+    def to_json(self) -> str:
+        """Return the statistics as a JSON document."""
+        return json.dumps(self.to_dict(), indent=2)
+
+    def to_text(self) -> str:
+        """Return the statistics as a human-readable table."""
+        lines = ["=== STATS ===", f"{'Phase':<10} {'Seconds':>10} {'Items':>10} {'Items/s':>12}"]
+        for phase, stats in self.phases.items():
+            lines.append(
+                f"{phase:<10} {stats.seconds:>10.3f} {stats.items:>10} {stats.rate:>12.1f}"
+            )
+        lines.append("")
+        lines.extend(f"{counter}: {value}" for counter, value in self.counters.items())
+        return "\n".join(lines)
+
+    def render(self, fmt: StatsFormat | str) -> str:
+        """
+        Render the statistics.
+
+        Args:
+            fmt: Output format
+
+        Returns:
+            The formatted report
+        """
+        if StatsFormat(fmt) is StatsFormat.JSON:
+            return self.to_json()
+        return self.to_text()
+
+    def to_prometheus(self, labels: dict[str, str] | None = None) -> str:
+        """
+        Return the statistics in the Prometheus text exposition format.
+
+        Args:
+            labels: Extra labels attached to every sample, e.g. the source directory
+
+        Returns:
+            Metrics suitable for the node-exporter textfile collector
+        """
+        extra = "".join(f',{key}="{_escape_label(value)}"' for key, value in (labels or {}).items())
+        base = "{" + extra.lstrip(",") + "}" if extra else ""
+
+        lines = [
+            "# HELP tidydir_phase_seconds Time spent in each phase of the last run.",
+            "# TYPE tidydir_phase_seconds gauge",
+        ]
+        lines.extend(
+            f'tidydir_phase_seconds{{phase="{phase}"{extra}}} {stats.seconds:.6f}'
+            for phase, stats in self.phases.items()
+        )
+        lines += [
+            "# HELP tidydir_phase_items Items processed in each phase of the last run.",
+            "# TYPE tidydir_phase_items gauge",
+        ]
+        lines.extend(
+            f'tidydir_phase_items{{phase="{phase}"{extra}}} {stats.items}'
+            for phase, stats in self.phases.items()
+        )
+        for counter, value in self.counters.items():
+            lines += [
+                f"# HELP tidydir_{counter} Number of {counter.replace('_', ' ')} in the last run.",
+                f"# TYPE tidydir_{counter} gauge",
+                f"tidydir_{counter}{base} {value}",
+            ]
+        lines += [
+            "# HELP tidydir_last_run_timestamp_seconds Unix time the last run finished.",
+            "# TYPE tidydir_last_run_timestamp_seconds gauge",
+            f"tidydir_last_run_timestamp_seconds{base} {time.time():.3f}",
+        ]
+        return "\n".join(lines) + "\n"
+
+    def write_textfile(self, path: str | Path, labels: dict[str, str] | None = None) -> None:
+        """
+        Atomically write Prometheus metrics for the node-exporter textfile collector.
+
+        Args:
+            path: Destination ``.prom`` file
+            labels: Extra labels attached to every sample
+        """
+        path = Path(path)
+        fd, tmp_name = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as tmp:
+                tmp.write(self.to_prometheus(labels))
+            os.replace(tmp_name, path)
+        except BaseException:
+            Path(tmp_name).unlink(missing_ok=True)
+            raise
+
+
+def _escape_label(value: str) -> str:
+    """Escape a Prometheus label value."""
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
@@ -0,0 +1,271 @@
+"""Categorized link views that organize files without moving data."""
+
+from __future__ import annotations
+
+import os
+from dataclasses import dataclass, field
+from enum import Enum
+from pathlib import Path
+
+from tidydir.categories import FileCategory
+from tidydir.organizer import FileOrganizer
+
+
+class LinkMode(str, Enum):
+    """How view entries point back at the original files."""
+
+    SYMLINK = "symlink"
+    HARDLINK = "hardlink"
+
+
+@dataclass
+class ViewDiff:
+    """Difference between the current scan and an existing view."""
+
+    keep: list[Path] = field(default_factory=list)
+    create: list[tuple[Path, FileCategory, bool]] = field(default_factory=list)
+    remove: list[Path] = field(default_factory=list)
+
+
+@dataclass
+class ViewResult:
+    """Result of synchronizing a view."""
+
+    created_count: int
+    kept_count: int
+    removed_count: int
+    errors: list[tuple[Path, str]] = field(default_factory=list)
+
+
+class ViewBuilder:
+    """Build and incrementally update a categorized view of a directory."""
+
+    def __init__(self, organizer: FileOrganizer, mode: LinkMode = LinkMode.SYMLINK) -> None:
+        """
+        Initialize the ViewBuilder.
+
+        Args:
+            organizer: Organizer providing the scan, categories and naming rules.
+                Its target directory is used as the view root.
+            mode: Whether to fill the view with symlinks or hardlinks
+
+        Raises:
+            ValueError: If the view root is the source directory itself, the
+                organizer is not on the local file system, or it caps
+                directories with ``max_per_dir``
+        """
+        if organizer.target_dir == organizer.source_dir:
+            raise ValueError("A view needs a target directory separate from the source")
+        if not organizer.fs.local:
+            raise ValueError("A view needs the local file system")
+        if organizer.max_per_dir is not None:
+            # Entries in shard directories would not be found again
+            raise ValueError("A view cannot cap directories with max_per_dir")
+
+        self.organizer = organizer
+        self.mode = LinkMode(mode)
+        self.view_dir = organizer.target_dir
+        self._source_prefix = os.path.join(str(organizer.source_dir), "")
+        self._category_names = {category.value for category in FileCategory}
+
+    def _link_key(self, path: Path) -> str | tuple[int, int] | None:
+        """Return the identity of the file a view entry points at."""
+        try:
+            if self.mode is LinkMode.SYMLINK:
+                if not path.is_symlink():
+                    return None
+                target = os.path.abspath(os.path.join(path.parent, os.readlink(path)))
+                # Links to files outside the source tree are not the view's
+                return target if target.startswith(self._source_prefix) else None
+            st = path.stat(follow_symlinks=False)
+            if path.is_symlink():
+                return None
+            return (st.st_dev, st.st_ino)
+        except OSError:
+            return None
+
+    def _source_key(self, path: Path) -> str | tuple[int, int] | None:
+        """Return the identity of a source file, comparable with ``_link_key``."""
+        if self.mode is LinkMode.SYMLINK:
+            return str(path)
+        try:
+            st = path.stat()
+        except OSError:
+            return None
+        return (st.st_dev, st.st_ino)
+
+    def _is_category_dir(self, directory: Path) -> bool:
+        """Check whether a directory is one of the view's category or archive folders."""
+        if not directory.is_relative_to(self.view_dir):
+            return False
+        parts = directory.relative_to(self.view_dir).parts
+        if len(parts) == 1 and parts[0] in self._category_names:
+            return True
+        return bool(parts) and self.organizer.get_archive_layout().matches(parts)
+
+    @staticmethod
+    def _mtime(path: Path) -> float | None:
+        """Get a file's modification time, or None if it cannot be read."""
+        try:
+            return path.stat().st_mtime
+        except OSError:
+            return None
+
+    def scan_view(self) -> dict[Path, str | tuple[int, int]]:
+        """
+        Collect the entries currently present in the view.
+
+        Only entries inside category folders are considered, so unrelated
+        files placed next to the view are never touched. In hardlink mode
+        every regular file there is returned; ``diff`` narrows them down to
+        the ones sharing an inode with a current source. In symlink mode only
+        links pointing into the source tree are returned.
+
+        Returns:
+            Dictionary mapping view entries to the identity of their source
+        """
+        entries: dict[Path, str | tuple[int, int]] = {}
+        if not self.view_dir.is_dir():
+            return entries
+
+        for root, _dirs, names in os.walk(self.view_dir):
+            directory = Path(root)
+            if not self._is_category_dir(directory):
+                continue
+            for name in names:
+                link = directory / name
+                key = self._link_key(link)
+                if key is not None:
+                    entries[link] = key
+        return entries
+
+    def _get_sources(self) -> list[Path]:
+        """Get the files to expose, excluding anything inside the view itself."""
+        return [
+            path
+            for path in self.organizer.get_files_to_organize()
+            if not path.is_relative_to(self.view_dir)
+        ]
+
+    def diff(self) -> ViewDiff:
+        """
+        Compare the current scan against the existing view.
+
+        A hardlink only counts as a view entry while it shares its inode with
+        a current source, so removing it never drops the last copy of a
+        file. Regular files the view did not create, and hardlinks whose
+        source was deleted or replaced, are left in place; a replaced source
+        gets a new link under a ``_N`` name beside the old one.
+
+        Returns:
+            Entries to keep, sources that need a new entry and entries to remove
+        """
+        organizer = self.organizer
+        sources = [(source, self._source_key(source)) for source in self._get_sources()]
+        existing = self.scan_view()
+        if self.mode is LinkMode.HARDLINK:
+            known = {key for _, key in sources if key is not None}
+            existing = {link: key for link, key in existing.items() if key in known}
+        by_key: dict[str | tuple[int, int], list[Path]] = {}
+        for link, key in existing.items():
+            by_key.setdefault(key, []).append(link)
+
+        result = ViewDiff()
+        kept: set[Path] = set()
+
+        for source, source_key in sources:
+            category = organizer.get_category(source)
+            is_old = organizer.is_old_file(source)
+            mtime = self._mtime(source) if is_old else None
+            expected_dir = organizer.get_target_dir(category, is_old, mtime)
+
+            candidates = by_key.get(source_key, []) if source_key is not None else []
+            match = next(
+                (link for link in candidates if link.parent == expected_dir and link not in kept),
+                None,
+            )
+
+            if match is not None:
+                kept.add(match)
+                result.keep.append(match)
+            else:
+                result.create.append((source, category, is_old))
+
+        result.remove = [link for link in existing if link not in kept]
+        return result
+
+    def _create_link(self, source: Path, link: Path) -> None:
+        """Create a single view entry."""
+        if self.mode is LinkMode.SYMLINK:
+            os.symlink(source, link)
+        else:
+            os.link(source, link)
+
+    def _prune(self, directory: Path) -> None:
+        """Remove category folders emptied by a sync, up to the view root."""
+        while directory != self.view_dir and directory.is_relative_to(self.view_dir):
+            try:
+                directory.rmdir()
+            except OSError:
+                return
+            directory = directory.parent
+
+    def sync(self) -> ViewResult:
+        """
+        Bring the view in line with the current scan.
+
+        Stale entries are removed first, so their names become available again,
+        then missing entries are created using the organizer's naming rules.
+
+        Returns:
+            Result of the synchronization
+        """
+        organizer = self.organizer
+        logger = organizer.logger
+        plan = self.diff()
+        errors: list[tuple[Path, str]] = []
+        removed = 0
+        created = 0
+
+        for link in plan.remove:
+            try:
+                link.unlink()
+                removed += 1
+                if logger:
+                    logger.info("Unlinked: %s", link, extra={"event": "unlinked", "target": link})
+            except OSError as e:
+                errors.append((link, str(e)))
+                continue
+            self._prune(link.parent)
+
+        organizer.conflicts.clear()
+        for source, category, is_old in plan.create:
+            try:
+                mtime = self._mtime(source) if is_old else None
+                link = organizer.get_target_path(source, category, is_old, mtime)
+                link.parent.mkdir(parents=True, exist_ok=True)
+                self._create_link(source, link)
+                created += 1
+                if logger:
+                    logger.info(
+                        "Linked: %s → %s",
+                        source,
+                        link,
+                        extra={"event": "linked", "source": source, "target": link},
+                    )
+            except OSError as e:
+                errors.append((source, str(e)))
+                if logger:
+                    logger.error(
+                        "Failed to link %s: %s",
+                        source,
+                        e,
+                        extra={"event": "failed", "source": source},
+                    )
+
+        return ViewResult(
+            created_count=created,
+            kept_count=len(plan.keep),
+            removed_count=removed,
+            errors=errors,
+        )
@@ -1,8 +1,17 @@
 """Pytest configuration and shared fixtures."""
 
+import os
 import sys
 from pathlib import Path
 
+import pytest
+
 # Add src directory to Python path for testing
 src_path = Path(__file__).parent.parent / "src"
 sys.path.insert(0, str(src_path))
+
+
+@pytest.fixture(autouse=True, scope="session")
+def cache_dir(tmp_path_factory):
+    """Keep the on-disk extension table out of the user's cache."""
+    os.environ["TIDYDIR_CACHE_DIR"] = str(tmp_path_factory.mktemp("cache"))
@@ -0,0 +1,258 @@
+"""Tests for organizing tar and zip archives directly."""
+
+import io
+import os
+import tarfile
+import time
+import zipfile
+from unittest.mock import ANY, patch
+
+import pytest
+
+from tidydir.archive_source import ArchiveSource, default_target, is_archive, iter_members
+from tidydir.cli import main
+from tidydir.hooks import HookEvent
+from tidydir.organizer import FileOrganizer
+
+NOW = time.time()
+OLD = NOW - 400 * 86400
+
+
+def make_archive(path, members):
+    """Write a tar or zip archive of ``(name, mtime)`` members."""
+    if path.suffix == ".zip":
+        with zipfile.ZipFile(path, "w") as zf:
+            for name, mtime in members:
+                info = zipfile.ZipInfo(name, time.localtime(mtime)[:6])
+                zf.writestr(info, f"content of {name}")
+        return path
+    with tarfile.open(path, "w:gz") as tf:
+        for name, mtime in members:
+            data = f"content of {name}".encode()
+            info = tarfile.TarInfo(name)
+            info.size = len(data)
+            info.mtime = int(mtime)
+            tf.addfile(info, io.BytesIO(data))
+    return path
+
+
+class TestHelpers:
+    """Test suite for the archive helpers."""
+
+    def test_is_archive(self, tmp_path):
+        """Test recognizing tar and zip archives."""
+        make_archive(tmp_path / "a.zip", [("x.txt", NOW)])
+        make_archive(tmp_path / "b.tar.gz", [("x.txt", NOW)])
+        (tmp_path / "c.txt").write_text("plain")
+
+        assert is_archive(tmp_path / "a.zip")
+        assert is_archive(tmp_path / "b.tar.gz")
+        assert not is_archive(tmp_path / "c.txt")
+        assert not is_archive(tmp_path)
+        assert not is_archive(tmp_path / "missing.zip")
+
+    @pytest.mark.parametrize(
+        ("name", "expected"),
+        [
+            ("bundle.tar.gz", "bundle"),
+            ("bundle.TGZ", "bundle"),
+            ("photos.zip", "photos"),
+            ("backup", "backup.d"),
+            (".zip", ".zip.d"),
+        ],
+    )
+    def test_default_target(self, tmp_path, name, expected):
+        """Test that the default target is the archive's name without its suffix."""
+        assert default_target(tmp_path / name) == tmp_path / expected
+
+    @pytest.mark.parametrize("suffix", [".zip", ".tar.gz"])
+    def test_iter_members(self, tmp_path, suffix):
+        """Test listing regular files with their directory inside the archive."""
+        archive = make_archive(tmp_path / f"a{suffix}", [("top.txt", NOW), ("sub/deep.jpg", NOW)])
+
+        members = [(d, n, s) for d, n, s, _, _ in iter_members(archive)]
+
+        assert members == [("", "top.txt", 18), ("sub", "deep.jpg", 23)]
+
+    def test_tar_skips_special_members(self, tmp_path):
+        """Test that directories and links in a tar archive are skipped."""
+        archive = tmp_path / "a.tar"
+        with tarfile.open(archive, "w") as tf:
+            directory = tarfile.TarInfo("./docs")
+            directory.type = tarfile.DIRTYPE
+            tf.addfile(directory)
+            link = tarfile.TarInfo("./docs/link.txt")
+            link.type = tarfile.SYMTYPE
+            link.linkname = "/etc/passwd"
+            tf.addfile(link)
+            info = tarfile.TarInfo("./docs/file.txt")
+            tf.addfile(info, io.BytesIO())
+
+        assert [(d, n) for d, n, _, _, _ in iter_members(archive)] == [("docs", "file.txt")]
+
+
+class TestArchiveSource:
+    """Test suite for ArchiveSource."""
+
+    @pytest.mark.parametrize("suffix", [".zip", ".tar.gz"])
+    def test_execute(self, tmp_path, suffix):
+        """Test that members are written into category directories with their mtime."""
+        archive = make_archive(
+            tmp_path / f"in{suffix}", [("photo.jpg", NOW), ("report.pdf", NOW), ("old.txt", OLD)]
+        )
+        target = tmp_path / "out"
+        organizer = FileOrganizer(archive, target, archive_layout="archive/{category}")
+
+        result = ArchiveSource(organizer).execute()
+
+        assert result.moved_count == result.total_count == 3
+        assert (target / "Images" / "photo.jpg").read_text() == "content of photo.jpg"
+        assert (target / "Documents" / "report.pdf").exists()
+        old = target / "archive" / "Text" / "old.txt"
+        assert old.exists()
+        assert abs(old.stat().st_mtime - OLD) < 2
+        assert archive.exists()
+        assert organizer.stats.counters["files_moved"] == 3
+
+    def test_plan_writes_nothing(self, tmp_path):
+        """Test that planning matches execution without creating the target."""
+        archive = make_archive(tmp_path / "in.zip", [("a.jpg", NOW), ("b.mp3", OLD)])
+        target = tmp_path / "out"
+        organizer = FileOrganizer(archive, target, archive_layout="archive/{category}")
+        planned = []
+        organizer.add_hook(HookEvent.PLANNED, planned.append)
+
+        plan = ArchiveSource(organizer).plan()
+
+        assert not target.exists()
+        assert [(op.target, op.is_old) for op in plan] == [
+            (target / "Images" / "a.jpg", False),
+            (target / "archive" / "Audio" / "b.mp3", True),
+        ]
+        assert [op.source for op in planned] == [archive / "a.jpg", archive / "b.mp3"]
+
+    def test_conflicts_renamed(self, tmp_path):
+        """Test that existing files and duplicate members are not overwritten."""
+        archive = make_archive(
+            tmp_path / "in.tar.gz", [("a.txt", NOW), ("sub/a.txt", NOW), ("b.txt", NOW)]
+        )
+        target = tmp_path / "out"
+        (target / "Text").mkdir(parents=True)
+        (target / "Text" / "a.txt").write_text("existing")
+        organizer = FileOrganizer(archive, target, include_subdirs=True)
+
+        result = ArchiveSource(organizer).execute()
+
+        assert result.moved_count == 3
+        assert (target / "Text" / "a.txt").read_text() == "existing"
+        assert (target / "Text" / "a_1.txt").read_text() == "content of a.txt"
+        assert (target / "Text" / "a_2.txt").read_text() == "content of sub/a.txt"
+        assert len(result.conflicts) == 2
+
+    def test_execute_plan(self, tmp_path):
+        """Test that a plan is carried out as previewed, renaming only new conflicts."""
+        archive = make_archive(
+            tmp_path / "in.tar.gz", [("a.txt", NOW), ("sub/a.txt", NOW), ("b.txt", NOW)]
+        )
+        target = tmp_path / "out"
+        organizer = FileOrganizer(archive, target)
+        source = ArchiveSource(organizer)
+        plan = source.plan()
+        (target / "Text").mkdir(parents=True)
+        (target / "Text" / "b.txt").write_text("created after planning")
+
+        result = source.execute(plan)
+
+        assert result.moved_count == result.total_count == 2
+        assert (target / "Text" / "a.txt").read_text() == "content of a.txt"
+        assert (target / "Text" / "b_1.txt").read_text() == "content of b.txt"
+        assert not (target / "Text" / "a_1.txt").exists()
+        assert len(result.conflicts) == 1
+        assert "scan" in organizer.stats.phases
+
+    def test_subdirs_excluded_by_default(self, tmp_path):
+        """Test that members in subdirectories need include_subdirs."""
+        archive = make_archive(tmp_path / "in.zip", [("top.txt", NOW), ("sub/deep.txt", NOW)])
+        organizer = FileOrganizer(archive, tmp_path / "out")
+
+        result = ArchiveSource(organizer).execute()
+
+        assert result.total_count == 1
+        assert os.listdir(tmp_path / "out" / "Text") == ["top.txt"]
+
+    def test_write_failure_reported(self, tmp_path):
+        """Test that a member that cannot be written is reported and the rest continue."""
+        archive = make_archive(tmp_path / "in.zip", [("a.jpg", NOW), ("b.txt", NOW)])
+        target = tmp_path / "out"
+        target.mkdir()
+        (target / "Images").write_text("a file where a directory should be")
+        organizer = FileOrganizer(archive, target)
+        failed = []
+        organizer.add_hook(HookEvent.FAILED, lambda op, _error: failed.append(op.source))
+
+        result = ArchiveSource(organizer).execute()
+
+        assert result.moved_count == 1
+        assert failed == [archive / "a.jpg"]
+        assert (target / "Text" / "b.txt").exists()
+
+    def test_rejects_non_archive(self, tmp_path):
+        """Test that a directory source is refused."""
+        with pytest.raises(ValueError, match="Not a tar or zip archive"):
+            ArchiveSource(FileOrganizer(tmp_path))
+
+
+class TestArchiveCLI:
+    """Test suite for archive sources on the command line."""
+
+    @patch("tidydir.cli.confirm_action", return_value=True)
+    def test_main_archive(self, _mock_confirm, tmp_path, capsys):
+        """Test organizing an archive into its default target."""
+        archive = make_archive(tmp_path / "bundle.tar.gz", [("a.jpg", NOW)])
+
+        with patch("sys.argv", ["tidydir", str(archive)]):
+            assert main() == 0
+
+        assert (tmp_path / "bundle" / "Images" / "a.jpg").exists()
+        assert "Completed: 1/1" in capsys.readouterr().out
+
+    def test_main_archive_executes_preview(self, tmp_path):
+        """Test that the previewed plan of an archive is the one executed."""
+        archive = make_archive(tmp_path / "bundle.zip", [("a.jpg", NOW)])
+        plans = []
+        real_plan, real_execute = ArchiveSource.plan, ArchiveSource.execute
+
+        def plan(source):
+            plans.append(real_plan(source))
+            return plans[-1]
+
+        with (
+            patch.object(ArchiveSource, "plan", autospec=True, side_effect=plan),
+            patch.object(
+                ArchiveSource, "execute", autospec=True, side_effect=real_execute
+            ) as execute,
+            patch("sys.argv", ["tidydir", str(archive), "--yes"]),
+        ):
+            assert main() == 0
+
+        execute.assert_called_once_with(ANY, plans[0])
+        assert (tmp_path / "bundle" / "Images" / "a.jpg").exists()
+
+    def test_main_archive_preview(self, tmp_path, capsys):
+        """Test that a preview of an archive writes nothing."""
+        archive = make_archive(tmp_path / "bundle.zip", [("a.jpg", NOW)])
+
+        with patch("sys.argv", ["tidydir", str(archive), "--preview"]):
+            assert main() == 0
+
+        assert "Images" in capsys.readouterr().out
+        assert not (tmp_path / "bundle").exists()
+
+    def test_main_archive_unsupported_option(self, tmp_path, capsys):
+        """Test that options that need a source directory are refused."""
+        archive = make_archive(tmp_path / "bundle.zip", [("a.jpg", NOW)])
+
+        with patch("sys.argv", ["tidydir", str(archive), "--archive-format", "zip"]):
+            assert main() == 1
+
+        assert "--archive-format" in capsys.readouterr().out
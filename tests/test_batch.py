@@ -0,0 +1,125 @@
+"""Tests for batch mode."""
+
+import json
+
+import pytest
+
+from tidydir.batch import BatchEntry, BatchRunner, load_manifest
+
+
+def make_root(path, count):
+    """Create a source directory with some images and documents."""
+    path.mkdir()
+    for i in range(count):
+        (path / f"photo{i}.jpg").write_text("x")
+        (path / f"doc{i}.pdf").write_text("x")
+    return path
+
+
+class TestManifest:
+    """Test suite for manifest loading."""
+
+    def test_list_of_roots(self, tmp_path):
+        """Test a plain list with relative paths and per-entry options."""
+        manifest = tmp_path / "roots.json"
+        manifest.write_text(json.dumps(["a", {"source": "b", "target": "out", "days": 30}]))
+
+        entries = load_manifest(manifest)
+
+        assert entries[0] == BatchEntry(source=tmp_path / "a")
+        assert entries[1].target == tmp_path / "out"
+        assert entries[1].days == 30
+
+    def test_defaults(self, tmp_path):
+        """Test that defaults apply unless an entry overrides them."""
+        manifest = tmp_path / "roots.json"
+        manifest.write_text(
+            json.dumps(
+                {
+                    "defaults": {"subdirs": True},
+                    "roots": ["/a", {"source": "/b", "subdirs": False}],
+                }
+            )
+        )
+
+        entries = load_manifest(manifest)
+
+        assert [e.subdirs for e in entries] == [True, False]
+
+    def test_sharding_options(self, tmp_path):
+        """Test that max_per_dir and shard_by reach the organizer."""
+        manifest = tmp_path / "roots.json"
+        manifest.write_text(json.dumps([{"source": "a", "max_per_dir": 10, "shard_by": "date"}]))
+
+        organizer = load_manifest(manifest)[0].create_organizer()
+
+        assert organizer.max_per_dir == 10
+        assert organizer.shard_by == "date"
+
+    @pytest.mark.parametrize(
+        "content",
+        ["{not json", '{"defaults": {}}', '[{"target": "x"}]', '[{"source": "a", "bogus": 1}]'],
+    )
+    def test_invalid(self, tmp_path, content):
+        """Test that malformed manifests are rejected."""
+        manifest = tmp_path / "roots.json"
+        manifest.write_text(content)
+
+        with pytest.raises(ValueError):
+            load_manifest(manifest)
+
+
+class TestBatchRunner:
+    """Test suite for BatchRunner."""
+
+    def test_organizes_every_root(self, tmp_path):
+        """Test that chunks of several roots are moved on one pool."""
+        small = make_root(tmp_path / "small", 2)
+        large = make_root(tmp_path / "large", 50)
+        entries = [BatchEntry(source=small), BatchEntry(source=large, target=tmp_path / "out")]
+
+        results = BatchRunner(entries, workers=3, chunk_size=7).run()
+
+        assert [(r.result.moved_count, r.result.total_count) for r in results] == [
+            (4, 4),
+            (100, 100),
+        ]
+        assert all(r.error is None for r in results)
+        assert len(list((tmp_path / "out" / "Images").iterdir())) == 50
+        assert (small / "Documents" / "doc0.pdf").exists()
+        assert results[1].stats.counters["files_moved"] == 100
+
+    def test_failed_root_does_not_stop_others(self, tmp_path):
+        """Test that a missing root is reported while the others run."""
+        good = make_root(tmp_path / "good", 1)
+        entries = [BatchEntry(source=tmp_path / "missing"), BatchEntry(source=good)]
+
+        results = BatchRunner(entries, workers=2).run()
+
+        assert results[0].error is not None
+        assert results[1].error is None
+        assert results[1].result.moved_count == 2
+
+    def test_preview(self, tmp_path):
+        """Test that preview only plans."""
+        root = make_root(tmp_path / "root", 3)
+
+        results = BatchRunner([BatchEntry(source=root)], preview=True).run()
+
+        assert results[0].result.total_count == 6
+        assert results[0].result.moved_count == 0
+        assert (root / "photo0.jpg").exists()
+
+    def test_shared_target(self, tmp_path):
+        """Test that roots sharing a target never overwrite each other's files."""
+        for name in ("a", "b"):
+            (tmp_path / name).mkdir()
+            (tmp_path / name / "x.jpg").write_text(name)
+        out = tmp_path / "out"
+        entries = [BatchEntry(source=tmp_path / name, target=out) for name in ("a", "b")]
+
+        results = BatchRunner(entries, workers=4).run()
+
+        assert [r.result.moved_count for r in results] == [1, 1]
+        assert sorted(p.read_text() for p in (out / "Images").iterdir()) == ["a", "b"]
+        assert (out / "Images" / "x_1.jpg").exists()
@@ -0,0 +1,59 @@
+"""Tests for the benchmark suite."""
+
+from dataclasses import replace
+
+from benchmarks.generate import SCENARIOS, TreeSpec, generate_tree
+from benchmarks.importtime import DEFAULT_BUDGET_MS, measure_imports
+from benchmarks.run import PHASES, compare_results, run_benchmark
+
+
+class TestBenchmarks:
+    """Test suite for the benchmark generator and runner."""
+
+    def test_generate_is_deterministic(self, tmp_path):
+        """Test that the same spec produces the same tree."""
+        spec = TreeSpec(files=60, depth=2, fanout=3, conflict_rate=0.3, seed=7)
+
+        first = generate_tree(tmp_path / "a", spec)
+        second = generate_tree(tmp_path / "b", spec)
+
+        def listing(root):
+            return sorted(str(p.relative_to(root)) for p in root.rglob("*"))
+
+        assert first.files == 60
+        assert first.preexisting == second.preexisting > 0
+        assert listing(first.source) == listing(second.source)
+        assert listing(first.target) == listing(second.target)
+
+    def test_run_smoke_scenario(self, tmp_path):
+        """Test timing every phase on a small tree."""
+        spec = replace(SCENARIOS["smoke"], files=50)
+        result = run_benchmark(spec, workdir=tmp_path, repeat=1)
+
+        assert list(result["phases"]) == list(PHASES)
+        assert list(tmp_path.iterdir()) == []
+
+    def test_run_in_memory(self, tmp_path):
+        """Test timing every phase on an in-memory tree without touching the disk."""
+        spec = replace(SCENARIOS["smoke"], files=50)
+        result = run_benchmark(spec, workdir=tmp_path, repeat=1, memory_fs=True)
+
+        assert result["memory_fs"] is True
+        assert list(result["phases"]) == list(PHASES)
+        assert list(tmp_path.iterdir()) == []
+
+    def test_compare_results(self):
+        """Test regression detection against a baseline."""
+        baseline = {"phases": {"preview": 1.0, "execute": 2.0, "print_preview": 0.001}}
+        result = {"phases": {"preview": 1.1, "execute": 3.0, "print_preview": 0.004}}
+
+        regressions = compare_results(result, baseline, threshold=0.25)
+
+        assert len(regressions) == 1
+        assert regressions[0].startswith("execute:")
+
+    def test_cli_import_budget(self):
+        """Test that importing the CLI stays within its budget."""
+        timings = measure_imports("tidydir.cli", repeat=3)
+
+        assert timings["tidydir.cli"] < DEFAULT_BUDGET_MS
@@ -0,0 +1,115 @@
+"""Tests for the cached extension table."""
+
+import os
+import sys
+
+import pytest
+
+from tidydir import categories
+from tidydir.categories import FileCategory, build_extension_map, extension_map
+
+
+@pytest.fixture
+def table_env(tmp_path, monkeypatch):
+    """Use a private cache directory and extension source, with nothing loaded yet."""
+    source = tmp_path / "_extensions.py"
+    with open(categories.EXTENSIONS_SOURCE, "rb") as f:
+        source.write_bytes(f.read())
+    monkeypatch.setenv("TIDYDIR_CACHE_DIR", str(tmp_path / "cache"))
+    monkeypatch.setattr(categories, "EXTENSIONS_SOURCE", str(source))
+    monkeypatch.setattr(categories, "_extension_map", None)
+    return source
+
+
+class TestExtensionTable:
+    """Test suite for the extension-to-category table."""
+
+    @pytest.mark.usefixtures("table_env")
+    def test_built_and_cached_tables_match(self, tmp_path, monkeypatch):
+        """Test that a table loaded from the cache equals a freshly built one."""
+        built = extension_map()
+        cached_files = os.listdir(tmp_path / "cache")
+        monkeypatch.setattr(categories, "_extension_map", None)
+
+        def fail():
+            raise AssertionError("table rebuilt despite a valid cache")
+
+        monkeypatch.setattr(categories, "build_extension_map", fail)
+
+        loaded = extension_map()
+
+        assert len(cached_files) == 1
+        assert loaded == built
+        assert loaded[".jpg"] is FileCategory.IMAGES
+        assert all(ext == ext.lower() for ext in loaded)
+
+    def test_source_change_invalidates_cache(self, table_env, tmp_path, monkeypatch):
+        """Test that editing the extension lists rebuilds and replaces the cache."""
+        extension_map()
+        first = os.listdir(tmp_path / "cache")
+        table_env.write_bytes(table_env.read_bytes() + b"\n# edited\n")
+        monkeypatch.setattr(categories, "_extension_map", None)
+
+        extension_map()
+
+        second = os.listdir(tmp_path / "cache")
+        assert len(second) == 1
+        assert second != first
+
+    @pytest.mark.usefixtures("table_env")
+    def test_other_interpreters_tables_kept(self, tmp_path):
+        """Test that tables of other interpreters and table versions survive a rebuild."""
+        cache = tmp_path / "cache"
+        cache.mkdir()
+        foreign = [
+            f"categories-{categories.TABLE_VERSION}-other-311-1-00000000.marshal",
+            f"categories-{categories.TABLE_VERSION + 1}-"
+            f"{sys.implementation.cache_tag}-1-00000000.marshal",
+        ]
+        for name in foreign:
+            (cache / name).write_bytes(b"")
+        stale = f"categories-{categories.TABLE_VERSION}-{sys.implementation.cache_tag}-1-0.marshal"
+        (cache / stale).write_bytes(b"")
+
+        extension_map()
+
+        names = os.listdir(cache)
+        assert len(names) == 3
+        assert set(foreign) < set(names)
+        assert stale not in names
+
+    @pytest.mark.usefixtures("table_env")
+    def test_corrupt_cache_is_rebuilt(self, tmp_path, monkeypatch):
+        """Test that an unreadable cache file falls back to building the table."""
+        extension_map()
+        (path,) = (tmp_path / "cache").iterdir()
+        path.write_bytes(b"not marshal")
+        monkeypatch.setattr(categories, "_extension_map", None)
+
+        assert extension_map()[".pdf"] is FileCategory.DOCUMENTS
+
+    @pytest.mark.usefixtures("table_env")
+    def test_unwritable_cache_dir(self, tmp_path, monkeypatch):
+        """Test that the table works when the cache cannot be written."""
+        blocker = tmp_path / "file"
+        blocker.write_text("")
+        monkeypatch.setenv("TIDYDIR_CACHE_DIR", str(blocker / "cache"))
+
+        assert extension_map()[".mp3"] is FileCategory.AUDIO
+
+    def test_matches_category_extensions(self):
+        """Test that every listed extension maps to a category that lists it."""
+        ext_map = build_extension_map()
+
+        for extensions in categories.CATEGORY_EXTENSIONS.values():
+            for ext in extensions:
+                assert ext in categories.CATEGORY_EXTENSIONS[ext_map[ext.lower()]]
+        assert ext_map[".jpg"] is FileCategory.IMAGES
+
+    @pytest.mark.usefixtures("table_env")
+    def test_returns_copies(self):
+        """Test that callers can change their table without affecting others."""
+        first = extension_map()
+        first[".jpg"] = FileCategory.FILES
+
+        assert extension_map()[".jpg"] is FileCategory.IMAGES
@@ -1,10 +1,28 @@
 """Tests for the CLI module."""
 
+import io
+import json
+import os
+import subprocess
+import sys
+from pathlib import Path
 from unittest.mock import MagicMock, patch
 
 import pytest
 
-from tidydir.cli import confirm_action, create_parser, main
+import tidydir
+from tidydir.cli import (
+    ARCHIVE_FORMATS,
+    ARCHIVE_LAYOUT,
+    LINK_MODES,
+    LOG_FORMATS,
+    OUTPUT_FORMATS,
+    SHARD_MODES,
+    STATS_FORMATS,
+    confirm_action,
+    create_parser,
+    main,
+)
 
 
 class TestCLI:
@@ -56,6 +74,55 @@ class TestCLI:
         with pytest.raises(SystemExit):
             parser.parse_args(["--version"])
 
+    def test_main_version_fast_path(self, capsys):
+        """Test that --version is answered without building the parser."""
+        with (
+            patch("sys.argv", ["tidydir", "--version"]),
+            patch("tidydir.cli.create_parser") as mock_parser,
+        ):
+            assert main() == 0
+
+        mock_parser.assert_not_called()
+        assert capsys.readouterr().out.startswith("tidydir ")
+
+    def test_choices_match_enums(self):
+        """Test that the option choices match the enums they are parsed into."""
+        from tidydir.layout import DEFAULT_ARCHIVE_LAYOUT
+        from tidydir.logs import LogFormat
+        from tidydir.output import OutputFormat
+        from tidydir.packing import ArchiveFormat
+        from tidydir.sharding import ShardBy
+        from tidydir.stats import StatsFormat
+        from tidydir.view import LinkMode
+
+        assert tuple(f.value for f in LogFormat) == LOG_FORMATS
+        assert tuple(f.value for f in StatsFormat) == STATS_FORMATS
+        assert tuple(f.value for f in OutputFormat) == OUTPUT_FORMATS
+        assert tuple(m.value for m in LinkMode) == LINK_MODES
+        assert DEFAULT_ARCHIVE_LAYOUT == ARCHIVE_LAYOUT
+        assert tuple(m.value for m in ShardBy) == SHARD_MODES
+        assert tuple(f.value for f in ArchiveFormat) == ARCHIVE_FORMATS
+
+    def test_import_is_lazy(self):
+        """Test that importing the CLI does not load the organizer."""
+        code = (
+            "import sys, tidydir, tidydir.cli\n"
+            "heavy = {'argparse', 'logging', 'shutil', 'tidydir.organizer'}\n"
+            "print(sorted(heavy & set(sys.modules)))\n"
+            "tidydir.FileOrganizer\n"
+            "print('tidydir.organizer' in sys.modules)\n"
+        )
+        src_dir = str(Path(tidydir.__file__).parent.parent)
+        completed = subprocess.run(
+            [sys.executable, "-c", code],
+            capture_output=True,
+            text=True,
+            check=True,
+            env={**os.environ, "PYTHONPATH": src_dir},
+        )
+
+        assert completed.stdout.split("\n")[:2] == ["[]", "True"]
+
     @patch("builtins.input")
     def test_confirm_action_yes(self, mock_input):
         """Test confirm action with yes response."""
@@ -81,36 +148,39 @@ class TestCLI:
         assert confirm_action() is True
         assert mock_input.call_count == 2
 
-    @patch("tidydir.cli.Path")
-    def test_main_source_not_exist(self, mock_path):
+    @patch("tidydir.cli.os.path.exists")
+    def test_main_source_not_exist(self, mock_exists):
         """Test main with non-existent source."""
-        mock_path.return_value.exists.return_value = False
+        mock_exists.return_value = False
 
         with patch("sys.argv", ["tidydir", "nonexistent"]):
             result = main()
             assert result == 1
 
-    @patch("tidydir.cli.Path")
-    def test_main_source_not_directory(self, mock_path):
+    @patch("tidydir.cli.os.path.isdir")
+    @patch("tidydir.cli.os.path.exists")
+    def test_main_source_not_directory(self, mock_exists, mock_isdir):
         """Test main with source that's not a directory."""
-        mock_path.return_value.exists.return_value = True
-        mock_path.return_value.is_dir.return_value = False
+        mock_exists.return_value = True
+        mock_isdir.return_value = False
 
         with patch("sys.argv", ["tidydir", "file.txt"]):
             result = main()
             assert result == 1
 
-    @patch("tidydir.cli.FileOrganizer")
-    @patch("tidydir.cli.Path")
-    def test_main_preview_mode(self, mock_path, mock_organizer):
+    @patch("tidydir.organizer.FileOrganizer")
+    @patch("tidydir.cli.os.path.isdir")
+    @patch("tidydir.cli.os.path.exists")
+    def test_main_preview_mode(self, mock_exists, mock_isdir, mock_organizer):
         """Test main in preview mode."""
         # Setup mocks
-        mock_path.return_value.exists.return_value = True
-        mock_path.return_value.is_dir.return_value = True
+        mock_exists.return_value = True
+        mock_isdir.return_value = True
 
         mock_org_instance = MagicMock()
         mock_org_instance.check_permissions.return_value = []
-        mock_org_instance.preview.return_value = {"test": []}
+        mock_org_instance.check_space.return_value = []
+        mock_org_instance.plan.return_value = {"test": []}
         mock_organizer.return_value = mock_org_instance
 
         with patch("sys.argv", ["tidydir", "test_dir", "--preview"]):
@@ -119,17 +189,19 @@ class TestCLI:
             mock_org_instance.execute.assert_not_called()
 
     @patch("tidydir.cli.confirm_action")
-    @patch("tidydir.cli.FileOrganizer")
-    @patch("tidydir.cli.Path")
-    def test_main_cancelled(self, mock_path, mock_organizer, mock_confirm):
+    @patch("tidydir.organizer.FileOrganizer")
+    @patch("tidydir.cli.os.path.isdir")
+    @patch("tidydir.cli.os.path.exists")
+    def test_main_cancelled(self, mock_exists, mock_isdir, mock_organizer, mock_confirm):
         """Test main when user cancels."""
         # Setup mocks
-        mock_path.return_value.exists.return_value = True
-        mock_path.return_value.is_dir.return_value = True
+        mock_exists.return_value = True
+        mock_isdir.return_value = True
 
         mock_org_instance = MagicMock()
         mock_org_instance.check_permissions.return_value = []
-        mock_org_instance.preview.return_value = {"test": [{"source": "file.txt"}]}
+        mock_org_instance.check_space.return_value = []
+        mock_org_instance.plan.return_value = {"test": [{"source": "file.txt"}]}
         mock_organizer.return_value = mock_org_instance
 
         mock_confirm.return_value = False
@@ -140,13 +212,14 @@ class TestCLI:
             mock_org_instance.execute.assert_not_called()
 
     @patch("tidydir.cli.confirm_action")
-    @patch("tidydir.cli.FileOrganizer")
-    @patch("tidydir.cli.Path")
-    def test_main_execute_success(self, mock_path, mock_organizer, mock_confirm):
+    @patch("tidydir.organizer.FileOrganizer")
+    @patch("tidydir.cli.os.path.isdir")
+    @patch("tidydir.cli.os.path.exists")
+    def test_main_execute_success(self, mock_exists, mock_isdir, mock_organizer, mock_confirm):
         """Test successful execution."""
         # Setup mocks
-        mock_path.return_value.exists.return_value = True
-        mock_path.return_value.is_dir.return_value = True
+        mock_exists.return_value = True
+        mock_isdir.return_value = True
 
         mock_result = MagicMock()
         mock_result.moved_count = 5
@@ -154,7 +227,8 @@ class TestCLI:
 
         mock_org_instance = MagicMock()
         mock_org_instance.check_permissions.return_value = []
-        mock_org_instance.preview.return_value = {"test": [{"source": "file.txt"}]}
+        mock_org_instance.check_space.return_value = []
+        mock_org_instance.plan.return_value = {"test": [{"source": "file.txt"}]}
         mock_org_instance.execute.return_value = mock_result
         mock_organizer.return_value = mock_org_instance
 
@@ -166,13 +240,14 @@ class TestCLI:
             mock_org_instance.execute.assert_called_once()
 
     @patch("tidydir.cli.confirm_action")
-    @patch("tidydir.cli.FileOrganizer")
-    @patch("tidydir.cli.Path")
-    def test_main_execute_with_errors(self, mock_path, mock_organizer, mock_confirm):
+    @patch("tidydir.organizer.FileOrganizer")
+    @patch("tidydir.cli.os.path.isdir")
+    @patch("tidydir.cli.os.path.exists")
+    def test_main_execute_with_errors(self, mock_exists, mock_isdir, mock_organizer, mock_confirm):
         """Test execution with some errors."""
         # Setup mocks
-        mock_path.return_value.exists.return_value = True
-        mock_path.return_value.is_dir.return_value = True
+        mock_exists.return_value = True
+        mock_isdir.return_value = True
 
         mock_result = MagicMock()
         mock_result.moved_count = 3
@@ -180,7 +255,8 @@ class TestCLI:
 
         mock_org_instance = MagicMock()
         mock_org_instance.check_permissions.return_value = []
-        mock_org_instance.preview.return_value = {"test": [{"source": "file.txt"}]}
+        mock_org_instance.check_space.return_value = []
+        mock_org_instance.plan.return_value = {"test": [{"source": "file.txt"}]}
         mock_org_instance.execute.return_value = mock_result
         mock_organizer.return_value = mock_org_instance
 
@@ -190,13 +266,14 @@ class TestCLI:
             result = main()
             assert result == 1  # Exit code 1 for errors
 
-    @patch("tidydir.cli.FileOrganizer")
-    @patch("tidydir.cli.Path")
-    def test_main_permission_issues(self, mock_path, mock_organizer):
+    @patch("tidydir.organizer.FileOrganizer")
+    @patch("tidydir.cli.os.path.isdir")
+    @patch("tidydir.cli.os.path.exists")
+    def test_main_permission_issues(self, mock_exists, mock_isdir, mock_organizer):
         """Test main with permission issues."""
         # Setup mocks
-        mock_path.return_value.exists.return_value = True
-        mock_path.return_value.is_dir.return_value = True
+        mock_exists.return_value = True
+        mock_isdir.return_value = True
 
         mock_org_instance = MagicMock()
         mock_org_instance.check_permissions.return_value = ["No write permission"]
@@ -205,4 +282,119 @@ class TestCLI:
         with patch("sys.argv", ["tidydir", "test_dir"]):
             result = main()
             assert result == 1
-            mock_org_instance.preview.assert_not_called()
+            mock_org_instance.plan.assert_not_called()
+
+    def test_main_format_ndjson(self, tmp_path, capsys):
+        """Test that --format ndjson only previews and writes JSON lines."""
+        (tmp_path / "photo.jpg").write_text("data")
+
+        with patch("sys.argv", ["tidydir", str(tmp_path), "--format", "ndjson"]):
+            result = main()
+
+        assert result == 0
+        lines = capsys.readouterr().out.splitlines()
+        assert [json.loads(line)["type"] for line in lines] == ["operation", "summary"]
+        assert (tmp_path / "photo.jpg").exists()
+
+    def test_main_estimate(self, tmp_path, capsys):
+        """Test that --estimate reports without moving files."""
+        (tmp_path / "photo.jpg").write_text("data")
+
+        argv = ["tidydir", str(tmp_path), "--estimate", "--format", "json"]
+        with patch("sys.argv", argv):
+            result = main()
+
+        assert result == 0
+        report = json.loads(capsys.readouterr().out)
+        assert report["files"]["value"] == 1
+        assert (tmp_path / "photo.jpg").exists()
+
+    def test_main_batch(self, tmp_path, capsys):
+        """Test that --batch organizes every root in the manifest."""
+        for name in ("a", "b"):
+            (tmp_path / name).mkdir()
+            (tmp_path / name / "photo.jpg").write_text("data")
+        manifest = tmp_path / "roots.json"
+        manifest.write_text(json.dumps(["a", "b"]))
+
+        with patch("sys.argv", ["tidydir", "--batch", str(manifest), "--workers", "2"]):
+            result = main()
+
+        assert result == 0
+        assert "2 roots, 2/2 files organized" in capsys.readouterr().out
+        assert (tmp_path / "b" / "Images" / "photo.jpg").exists()
+
+    def test_main_requires_source_or_batch(self):
+        """Test that exactly one of SOURCE and --batch is required."""
+        with patch("sys.argv", ["tidydir"]), pytest.raises(SystemExit):
+            main()
+
+    def test_main_profile(self, tmp_path):
+        """Test that --profile writes a pstats file."""
+        import pstats
+
+        output = tmp_path / "run.pstats"
+        argv = ["tidydir", str(tmp_path), "--preview", "--profile", "--profile-output", str(output)]
+        with patch("sys.argv", argv):
+            assert main() == 0
+
+        assert pstats.Stats(str(output)).total_calls > 0
+
+    def test_main_files_from(self, tmp_path, monkeypatch, capsys):
+        """Test organizing a NUL-separated list read from stdin."""
+        for name in ("a.jpg", "b.pdf", "c.txt"):
+            (tmp_path / name).write_text("data")
+        listed = f"{tmp_path / 'a.jpg'}\0{tmp_path / 'b.pdf'}\0".encode()
+        monkeypatch.setattr("sys.stdin", MagicMock(buffer=io.BytesIO(listed)))
+        argv = ["tidydir", str(tmp_path), "--files-from", "-", "--null", "--yes"]
+
+        with patch("sys.argv", argv):
+            assert main() == 0
+
+        assert "Completed: 2/2" in capsys.readouterr().out
+        assert (tmp_path / "Images" / "a.jpg").exists()
+        assert (tmp_path / "c.txt").exists()
+
+    def test_main_files_from_ndjson(self, tmp_path, capsys):
+        """Test streaming the plan of a newline-separated list file."""
+        (tmp_path / "a.jpg").write_text("data")
+        file_list = tmp_path / "list.txt"
+        file_list.write_text(f"{tmp_path / 'a.jpg'}\n")
+        argv = ["tidydir", str(tmp_path), "--files-from", str(file_list), "--format", "ndjson"]
+
+        with patch("sys.argv", argv):
+            assert main() == 0
+
+        records = [json.loads(line) for line in capsys.readouterr().out.splitlines()]
+        assert records[-1]["total_files"] == 1
+
+    @pytest.mark.parametrize(
+        "extra",
+        [["--null"], ["--files-from", "-", "--lock"], ["--files-from", "-", "--view", "symlink"]],
+    )
+    def test_main_files_from_invalid(self, tmp_path, extra):
+        """Test option combinations that --files-from refuses."""
+        with patch("sys.argv", ["tidydir", str(tmp_path), *extra]), pytest.raises(SystemExit):
+            main()
+
+    @pytest.mark.parametrize(
+        "extra",
+        [
+            ["--archive-format", "zip"],
+            ["--processes", "2"],
+            ["--move-workers", "4"],
+            ["--max-per-dir", "10"],
+        ],
+    )
+    def test_main_view_invalid(self, tmp_path, capsys, extra):
+        """Test options that --view would ignore."""
+        argv = ["tidydir", str(tmp_path), "--view", "symlink", *extra]
+        with patch("sys.argv", argv), pytest.raises(SystemExit):
+            main()
+
+        assert f"--view cannot be used with {extra[0]}" in capsys.readouterr().err
+
+    @patch("builtins.input", side_effect=EOFError)
+    def test_confirm_action_eof(self, _mock_input):
+        """Test that an exhausted stdin declines."""
+        assert confirm_action() is False
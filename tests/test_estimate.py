@@ -0,0 +1,60 @@
+"""Tests for sampling-based estimates."""
+
+import os
+import time
+
+from tidydir.estimate import Estimate, estimate, measure_move_cost
+from tidydir.organizer import FileOrganizer
+
+
+class TestEstimate:
+    """Test suite for the estimate mode."""
+
+    def test_from_samples(self):
+        """Test the mean and interval of per-walk samples."""
+        e = Estimate.from_samples([10.0, 12.0, 14.0])
+
+        assert e.value == 12.0
+        assert e.low < 12.0 < e.high
+        assert Estimate.from_samples([5.0]) == Estimate(5.0, 5.0, 5.0)
+
+    def test_flat_directory_counts_are_exact(self, tmp_path):
+        """Test that a flat directory's count and categories need no sampling."""
+        for i in range(40):
+            (tmp_path / f"photo{i}.jpg").write_bytes(b"x" * 10)
+        for i in range(10):
+            path = tmp_path / f"doc{i}.pdf"
+            path.write_bytes(b"x" * 10)
+            old_time = time.time() - 400 * 86400
+            os.utime(path, (old_time, old_time))
+
+        report = estimate(FileOrganizer(source_dir=tmp_path), max_entries=1000, seed=1)
+
+        assert report.files == Estimate(50.0, 50.0, 50.0)
+        assert report.categories["Images"].value == 40
+        assert report.categories["Documents"].value == 10
+        assert report.bytes.value == 500
+        assert report.old_files.low <= 10 <= report.old_files.high
+
+    def test_uniform_tree_is_unbiased(self, tmp_path):
+        """Test that walks over a balanced tree recover its file count."""
+        for a in range(3):
+            for b in range(3):
+                leaf = tmp_path / f"d{a}" / f"e{b}"
+                leaf.mkdir(parents=True)
+                for i in range(5):
+                    (leaf / f"f{i}.txt").write_text("x")
+
+        organizer = FileOrganizer(source_dir=tmp_path, include_subdirs=True)
+        report = estimate(organizer, max_entries=10_000, seed=2)
+
+        assert report.files.value == 45
+        assert report.categories["Text"].value == 45
+        assert report.probes >= 2
+
+    def test_measure_move_cost(self, tmp_path):
+        """Test that rename timing cleans up after itself."""
+        cost = measure_move_cost(tmp_path / "not" / "yet")
+
+        assert cost is not None and cost > 0
+        assert list(tmp_path.iterdir()) == []
@@ -0,0 +1,161 @@
+"""Tests for the file system backends."""
+
+import os
+import time
+from pathlib import Path
+
+import pytest
+
+from tidydir.fs import FileSystem, LocalFileSystem, MemoryFileSystem
+from tidydir.hooks import HookEvent
+from tidydir.organizer import FileOrganizer
+
+OLD = time.time() - 400 * 86400
+
+
+@pytest.fixture
+def fs(tmp_path):
+    """Create an in-memory tree below a path that does not exist on disk."""
+    fs = MemoryFileSystem()
+    root = tmp_path / "memory"
+    fs.add_file(root / "photo.jpg", 10)
+    fs.add_file(root / "notes.txt", 5, OLD)
+    fs.add_file(root / "sub" / "song.mp3", 7)
+    fs.add_file(root / "tidydir_20240101_000000.log")
+    fs.add_file(tmp_path / "out" / "Images" / "photo.jpg", 3)
+    return fs
+
+
+class TestMemoryFileSystem:
+    """Test suite for MemoryFileSystem."""
+
+    def test_scan(self, fs, tmp_path):
+        """Test scanning in creation order, skipping log files."""
+        root = str(tmp_path / "memory")
+
+        flat = [entry.name for _dir, entry in fs.scan(root, False)]
+        deep = [(os.path.basename(d), entry.name) for d, entry in fs.scan(root, True)]
+
+        assert flat == ["photo.jpg", "notes.txt"]
+        assert deep == [
+            ("memory", "photo.jpg"),
+            ("memory", "notes.txt"),
+            ("sub", "song.mp3"),
+        ]
+        assert fs.list_subdirs(root) == [os.path.join(root, "sub")]
+        with pytest.raises(FileNotFoundError):
+            list(fs.scan(os.path.join(root, "missing"), False))
+
+    def test_stat_and_exists(self, fs, tmp_path):
+        """Test file status and existence checks."""
+        notes = str(tmp_path / "memory" / "notes.txt")
+
+        assert fs.stat(notes).st_size == 5
+        assert fs.stat(notes).st_mtime == OLD
+        assert fs.exists(notes)
+        assert fs.exists(str(tmp_path / "memory" / "sub"))
+        assert not fs.exists(str(tmp_path / "memory" / "gone.txt"))
+        assert not (tmp_path / "memory").exists()
+        with pytest.raises(FileNotFoundError):
+            fs.stat(str(tmp_path / "memory" / "gone.txt"))
+
+    def test_move(self, fs, tmp_path):
+        """Test moving, and failing like os.rename except that nothing is replaced."""
+        root = tmp_path / "memory"
+        fs.makedirs(str(root / "Text"))
+
+        fs.move(str(root / "notes.txt"), str(root / "Text" / "notes.txt"))
+
+        assert fs.listdir(root / "Text") == ["notes.txt"]
+        assert "notes.txt" not in fs.listdir(root)
+        assert fs.stat(str(root / "Text" / "notes.txt")).st_size == 5
+        with pytest.raises(FileNotFoundError):
+            fs.move(str(root / "notes.txt"), str(root / "Text" / "again.txt"))
+        with pytest.raises(FileNotFoundError):
+            fs.move(str(root / "photo.jpg"), str(root / "Missing" / "photo.jpg"))
+        with pytest.raises(FileExistsError):
+            fs.move(str(root / "photo.jpg"), str(root / "Text" / "notes.txt"))
+        assert fs.exists(str(root / "photo.jpg"))
+
+    def test_makedirs_over_file(self, fs, tmp_path):
+        """Test that a file in the way of a directory is an error."""
+        with pytest.raises(FileExistsError):
+            fs.makedirs(str(tmp_path / "memory" / "photo.jpg" / "sub"))
+
+
+class TestOrganizerBackends:
+    """Test suite for FileOrganizer on different backends."""
+
+    def test_default_is_local(self, tmp_path):
+        """Test that the local disk is used by default."""
+        assert isinstance(FileOrganizer(tmp_path).fs, LocalFileSystem)
+
+    def test_incomplete_backend_refused(self):
+        """Test that a backend missing an operation cannot be created."""
+
+        class NoMoves(FileSystem):
+            def resolve(self, path):
+                return Path(path)
+
+        with pytest.raises(TypeError, match="move"):
+            NoMoves()
+
+    def test_plan_and_execute_in_memory(self, fs, tmp_path):
+        """Test a whole run without touching the disk."""
+        out = tmp_path / "out"
+        organizer = FileOrganizer(
+            tmp_path / "memory",
+            out,
+            include_subdirs=True,
+            archive_layout="archive/{category}",
+            fs=fs,
+        )
+        moved = []
+        organizer.add_hook(HookEvent.MOVED, lambda op: moved.append(op.target.name))
+
+        result = organizer.execute()
+
+        assert result.moved_count == result.total_count == 3
+        assert fs.listdir(out / "Images") == ["photo.jpg", "photo_1.jpg"]
+        assert fs.listdir(out / "archive" / "Text") == ["notes.txt"]
+        assert fs.listdir(out / "Audio") == ["song.mp3"]
+        assert sorted(moved) == ["notes.txt", "photo_1.jpg", "song.mp3"]
+        assert fs.listdir(tmp_path / "memory" / "sub") == []
+        assert not out.exists()
+
+    def test_plan_paths_in_memory(self, fs, tmp_path):
+        """Test that listed files are stat()ed through the backend."""
+        root = tmp_path / "memory"
+        organizer = FileOrganizer(root, fs=fs)
+
+        plan = organizer.plan_paths([root / "notes.txt", root / "gone.txt"])
+
+        assert [(op.source.name, op.is_old) for op in plan] == [("notes.txt", True)]
+        assert organizer.stats.counters["files_skipped"] == 1
+
+    def test_matches_local_plan(self, tmp_path):
+        """Test that both backends plan the same tree identically."""
+        disk = tmp_path / "disk"
+        fs = MemoryFileSystem()
+        root = tmp_path / "memory"
+        for name in ("a.jpg", "b.pdf", "sub/a.jpg", "sub/deep/c.txt"):
+            (disk / name).parent.mkdir(parents=True, exist_ok=True)
+            (disk / name).write_text("data")
+            fs.add_file(root / name, 4)
+
+        def relative(organizer, base):
+            organizer.old_files_cutoff = organizer.old_files_cutoff.replace(year=1970)
+            return sorted(
+                (str(op.source.relative_to(base)), str(op.target.relative_to(base)))
+                for op in organizer.plan()
+            )
+
+        local = relative(FileOrganizer(disk, include_subdirs=True), disk.resolve())
+        memory = relative(FileOrganizer(root, include_subdirs=True, fs=fs), root)
+        assert local == memory
+
+    def test_local_only_features_refused(self, fs, tmp_path):
+        """Test that logging, locking and packing need the local disk."""
+        for option in ({"lock": True}, {"archive_format": "zip"}, {"enable_logging": True}):
+            with pytest.raises(ValueError, match="local file system"):
+                FileOrganizer(tmp_path / "memory", fs=fs, **option)
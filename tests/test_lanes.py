@@ -0,0 +1,132 @@
+"""Tests for moving small and large files in separate lanes."""
+
+import threading
+from unittest.mock import patch
+
+import pytest
+
+from tidydir.cli import main
+from tidydir.fs import MemoryFileSystem
+from tidydir.hooks import HookEvent
+from tidydir.lanes import LaneScheduler
+from tidydir.organizer import FileOrganizer
+
+LARGE = 1000
+
+
+@pytest.fixture
+def fs(tmp_path):
+    """Create a source of twenty small files and two large ones."""
+    fs = MemoryFileSystem()
+    for i in range(20):
+        fs.add_file(tmp_path / "src" / f"doc{i}.pdf", 10)
+    fs.add_file(tmp_path / "src" / "movie.mp4", LARGE)
+    fs.add_file(tmp_path / "src" / "clip.mkv", 5 * LARGE)
+    return fs
+
+
+class TestLaneScheduler:
+    """Test suite for LaneScheduler."""
+
+    def test_moves_everything(self, fs, tmp_path):
+        """Test that both lanes move their files and time them separately."""
+        organizer = FileOrganizer(
+            tmp_path / "src", move_workers=4, large_file_size=LARGE, show_progress=False, fs=fs
+        )
+        moved = []
+        organizer.add_hook(HookEvent.MOVED, lambda op: moved.append(op.target.name))
+
+        result = organizer.execute()
+
+        assert result.moved_count == result.total_count == 22
+        assert len(fs.listdir(tmp_path / "src" / "Documents")) == 20
+        assert sorted(fs.listdir(tmp_path / "src" / "Videos")) == ["clip.mkv", "movie.mp4"]
+        assert len(moved) == 22
+        assert organizer.stats.phases["move_small"].items == 20
+        assert organizer.stats.phases["move_large"].items == 2
+
+    def test_small_files_not_blocked(self, fs, tmp_path):
+        """Test that small files are moved while a large copy is still running."""
+        small_done = threading.Event()
+        small_left = [20]
+        lock = threading.Lock()
+        real_move = fs.move
+
+        def move(source, target):
+            if source.endswith((".mp4", ".mkv")):
+                # In a single queue this would wait for itself
+                assert small_done.wait(5), "small files waited for a large copy"
+            real_move(source, target)
+            if source.endswith(".pdf"):
+                with lock:
+                    small_left[0] -= 1
+                    if not small_left[0]:
+                        small_done.set()
+
+        fs.move = move
+        organizer = FileOrganizer(
+            tmp_path / "src", move_workers=2, large_workers=1, large_file_size=LARGE, fs=fs
+        )
+
+        result = organizer.execute()
+
+        assert result.moved_count == 22
+        assert not organizer.errors
+
+    def test_failures_recorded(self, fs, tmp_path):
+        """Test that a failed move is reported and the lanes carry on."""
+        organizer = FileOrganizer(tmp_path / "src", move_workers=2, large_file_size=LARGE, fs=fs)
+        plan = organizer.plan()
+        fs.move(str(tmp_path / "src" / "movie.mp4"), str(tmp_path / "src" / "gone.mp4"))
+
+        result = organizer.execute(plan)
+
+        assert result.moved_count == 21
+        assert [path.name for path, _ in result.errors] == ["movie.mp4"]
+
+    def test_progress(self, fs, tmp_path):
+        """Test that progress counts every file and byte once."""
+        organizer = FileOrganizer(tmp_path / "src", large_file_size=LARGE, fs=fs)
+        plan = organizer.plan()
+        organizer.prepare_directories(plan)
+
+        class Progress:
+            files = size = 0
+
+            def advance(self, num_bytes, files=1):
+                self.files += files
+                self.size += num_bytes
+
+        progress = Progress()
+        LaneScheduler(3, 1, LARGE, chunk_size=4).run(organizer, plan, progress)
+
+        assert progress.files == 22
+        assert progress.size == 200 + 6 * LARGE
+
+    def test_invalid(self, tmp_path):
+        """Test that empty lanes, bad sizes and locking are refused."""
+        with pytest.raises(ValueError, match="worker"):
+            LaneScheduler(0)
+        with pytest.raises(ValueError, match="worker"):
+            LaneScheduler(1, 0)
+        with pytest.raises(ValueError, match="positive"):
+            LaneScheduler(1, 1, 0)
+        with pytest.raises(ValueError, match="locking"):
+            FileOrganizer(tmp_path, move_workers=2, lock=True)
+
+
+class TestLanesCLI:
+    """Test suite for the move lane options."""
+
+    def test_move_workers(self, tmp_path):
+        """Test organizing with move lanes from the command line."""
+        for i in range(5):
+            (tmp_path / f"{i}.txt").write_text("data")
+        (tmp_path / "big.mp4").write_bytes(b"x" * 2 * 1024 * 1024)
+
+        argv = ["tidydir", str(tmp_path), "--move-workers", "4", "--large-file-mb", "1"]
+        with patch("sys.argv", [*argv, "--yes"]):
+            assert main() == 0
+
+        assert len(list((tmp_path / "Text").iterdir())) == 5
+        assert (tmp_path / "Videos" / "big.mp4").exists()
@@ -0,0 +1,101 @@
+"""Tests for archive layouts."""
+
+import os
+import time
+from datetime import datetime
+
+import pytest
+
+from tidydir.categories import FileCategory
+from tidydir.layout import DEFAULT_ARCHIVE_LAYOUT, ArchiveLayout
+from tidydir.organizer import FileOrganizer
+
+
+def local_timestamp(year, month, day, hour=12):
+    """Get the timestamp of a local date and hour."""
+    return time.mktime((year, month, day, hour, 0, 0, 0, 0, -1))
+
+
+class TestArchiveLayout:
+    """Test suite for ArchiveLayout."""
+
+    def test_default_layout(self):
+        """Test that the default layout archives by the date of the run."""
+        layout = ArchiveLayout(DEFAULT_ARCHIVE_LAYOUT, "/dst", today=datetime(2024, 3, 9))
+
+        directory = layout.directory(FileCategory.IMAGES, local_timestamp(2020, 1, 1))
+
+        assert directory == os.path.join("/dst", "archive_20240309", "Images")
+        assert not layout.uses_mtime
+
+    def test_date_fields_use_mtime(self):
+        """Test that year, month and day come from each file's local mtime."""
+        layout = ArchiveLayout("archive/{year}/{month}/{day}/{category}", "/dst")
+
+        first = layout.directory(FileCategory.TEXT, local_timestamp(2021, 7, 4, hour=0))
+        last = layout.directory(FileCategory.TEXT, local_timestamp(2021, 7, 4, hour=23))
+        next_day = layout.directory(FileCategory.TEXT, local_timestamp(2021, 7, 5, hour=0))
+
+        assert first == last == os.path.join("/dst", "archive", "2021", "07", "04", "Text")
+        assert next_day == os.path.join("/dst", "archive", "2021", "07", "05", "Text")
+
+    @pytest.mark.parametrize(
+        "template", ["", "/abs/{category}", "archive/../{category}", "a//b", "{week}", "{year:x}"]
+    )
+    def test_invalid_templates(self, template):
+        """Test that bad templates are rejected."""
+        with pytest.raises(ValueError):
+            ArchiveLayout(template)
+
+    def test_matches(self):
+        """Test recognizing directories a layout creates."""
+        layout = ArchiveLayout("archive/{year}/{category}")
+
+        assert layout.matches(("archive", "2019", "Images"))
+        assert not layout.matches(("archive", "2019"))
+        assert not layout.matches(("archive", "19", "Images"))
+        assert not layout.matches(("archive", "2019", "Holidays"))
+
+    def test_organizer_plan(self, tmp_path):
+        """Test that planning spreads old files over their mtime buckets."""
+        for name, year in (("a.jpg", 2019), ("b.jpg", 2019), ("c.pdf", 2020)):
+            path = tmp_path / name
+            path.write_text(name)
+            mtime = local_timestamp(year, 6, 1)
+            os.utime(path, (mtime, mtime))
+        (tmp_path / "new.txt").write_text("new")
+        organizer = FileOrganizer(tmp_path, archive_layout="archive/{year}/{category}")
+
+        targets = {
+            os.path.basename(source): os.path.dirname(target)
+            for _, source, target, _ in organizer.plan().iter_moves()
+        }
+
+        assert targets["a.jpg"] == targets["b.jpg"] == str(tmp_path / "archive" / "2019" / "Images")
+        assert targets["c.pdf"] == str(tmp_path / "archive" / "2020" / "Documents")
+        assert targets["new.txt"] == str(tmp_path / "Text")
+
+    def test_layout_without_category(self, tmp_path, capsys):
+        """Test that files sharing an archive directory are summed per category."""
+        mtime = local_timestamp(2019, 6, 1)
+        for name in ("a.jpg", "b.pdf", "c.pdf"):
+            (tmp_path / name).write_text(name)
+            os.utime(tmp_path / name, (mtime, mtime))
+        organizer = FileOrganizer(tmp_path, archive_layout="archive/{year}")
+
+        plan = organizer.plan()
+        organizer.print_preview(plan)
+
+        assert plan.summary.by_category() == {
+            FileCategory.IMAGES: (1, 5),
+            FileCategory.DOCUMENTS: (2, 10),
+        }
+        output = capsys.readouterr().out
+        assert output.count("📁 2019/") == 1
+        assert "Images: 1" in output
+        assert "Documents: 2" in output
+
+    def test_organizer_rejects_invalid_layout(self, tmp_path):
+        """Test that an invalid layout fails when the organizer is created."""
+        with pytest.raises(ValueError):
+            FileOrganizer(tmp_path, archive_layout="{nope}")
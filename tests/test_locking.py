@@ -0,0 +1,103 @@
+"""Tests for coordination between concurrent instances."""
+
+import contextlib
+import io
+import multiprocessing
+import os
+
+import pytest
+
+from tidydir.locking import FileLock, PartitionLeases
+from tidydir.organizer import FileOrganizer
+
+posix_only = pytest.mark.skipif(os.name == "nt", reason="locking is a no-op on Windows")
+
+SHARDS = 8
+FILES_PER_SHARD = 40
+
+
+def make_tree(root):
+    """Create shards whose files all share names but not contents."""
+    for shard in range(SHARDS):
+        directory = root / f"shard{shard}"
+        directory.mkdir(parents=True)
+        for i in range(FILES_PER_SHARD):
+            (directory / f"file{i}.txt").write_text(f"{shard}-{i}")
+
+
+def run_instance(source, target, start, results):
+    """Organize a tree once all instances are ready."""
+    organizer = FileOrganizer(source, target, include_subdirs=True, lock=True, show_progress=False)
+    start.wait()
+    with contextlib.redirect_stdout(io.StringIO()):
+        result = organizer.execute()
+    results.put((result.moved_count, len(result.errors)))
+
+
+class TestFileLock:
+    """Test suite for FileLock."""
+
+    @posix_only
+    def test_exclusive(self, tmp_path):
+        """Test that a held lock can't be taken by another holder."""
+        first, second = FileLock(tmp_path / "x.lock"), FileLock(tmp_path / "x.lock")
+
+        assert first.acquire()
+        assert not second.acquire(blocking=False)
+        first.release()
+        assert second.acquire(blocking=False)
+        second.release()
+
+    @posix_only
+    def test_leases_split_partitions(self, tmp_path):
+        """Test that a partition leased by one instance is skipped by another."""
+        make_tree(tmp_path)
+        first = FileOrganizer(tmp_path, include_subdirs=True, lock=True)
+        first._leases.acquire(str(tmp_path / "shard0"))
+        second = FileOrganizer(tmp_path, include_subdirs=True, lock=True)
+
+        plan = second.plan()
+
+        assert len(plan) == (SHARDS - 1) * FILES_PER_SHARD
+        assert all("shard0" not in str(op.source) for op in plan)
+        assert not any(".tidydir-locks" in str(op.source) for op in plan)
+
+    def test_partition_lease_is_reentrant(self, tmp_path):
+        """Test that an instance keeps a lease it already holds."""
+        leases = PartitionLeases(tmp_path)
+
+        assert leases.acquire("a")
+        assert leases.acquire("a")
+        assert leases.held == ["a"]
+        leases.release_all()
+        assert leases.held == []
+
+
+@posix_only
+class TestConcurrentInstances:
+    """Stress test with several processes organizing one tree at once."""
+
+    def test_no_file_lost_or_overwritten(self, tmp_path):
+        """Test that concurrent instances move every file exactly once."""
+        source, target = tmp_path / "source", tmp_path / "target"
+        make_tree(source)
+        context = multiprocessing.get_context("fork")
+        start = context.Event()
+        results = context.Queue()
+        processes = [
+            context.Process(target=run_instance, args=(source, target, start, results))
+            for _ in range(4)
+        ]
+        for process in processes:
+            process.start()
+        start.set()
+        outcomes = [results.get(timeout=60) for _ in processes]
+        for process in processes:
+            process.join(timeout=60)
+
+        total = SHARDS * FILES_PER_SHARD
+        assert sum(moved for moved, _ in outcomes) == total
+        assert sum(errors for _, errors in outcomes) == 0
+        contents = {path.read_text() for path in (target / "Text").iterdir()}
+        assert len(contents) == total
+        assert not any(path.is_file() for path in source.rglob("*.txt"))
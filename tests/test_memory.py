@@ -0,0 +1,30 @@
+"""Tests for memory profiling."""
+
+from tidydir.memory import MemoryProfiler, profile_memory
+from tidydir.organizer import FileOrganizer
+
+
+class TestMemory:
+    """Test suite for memory profiling."""
+
+    def test_measure_retained(self):
+        """Test that retained allocations are attributed to the phase."""
+        with MemoryProfiler() as profiler, profiler.measure("alloc") as phase:
+            data = [bytearray(1000) for _ in range(100)]
+            phase.items = len(data)
+
+        record = profiler.report.phases[0]
+        assert record.retained_bytes >= 100_000
+        assert record.retained_per_item >= 1000
+
+    def test_profile_memory(self, tmp_path):
+        """Test profiling an organizer leaves its files in place."""
+        for i in range(20):
+            (tmp_path / f"photo{i}.jpg").touch()
+
+        report = profile_memory(FileOrganizer(source_dir=tmp_path))
+
+        assert [p.phase for p in report.phases] == ["scan", "plan", "preview", "render"]
+        assert all(p.items == 20 for p in report.phases)
+        assert 0 < report.phases[1].retained_per_item < report.phases[2].retained_per_item
+        assert len(list(tmp_path.glob("*.jpg"))) == 20
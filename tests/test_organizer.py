@@ -5,10 +5,12 @@ import shutil
 import tempfile
 from datetime import datetime, timedelta
 from pathlib import Path
+from unittest.mock import patch
 
 import pytest
 
 from tidydir.categories import CATEGORY_EXTENSIONS
+from tidydir.hooks import HookEvent
 from tidydir.organizer import FileCategory, FileOrganizer, OrganizeResult
 
 
@@ -156,6 +158,51 @@ class TestFileOrganizer:
         total_files = sum(len(ops) for ops in operations.values())
         assert total_files == 3
 
+    def test_print_preview(self, temp_dir, organizer, capsys):
+        """Test that a plan and the preview dictionary print the same tree."""
+        for i in range(5):
+            self.create_test_file(temp_dir, f"image{i}.jpg")
+        self.create_test_file(temp_dir, "old_file.txt", old=True)
+
+        organizer.print_preview(organizer.plan())
+        from_plan = capsys.readouterr().out
+        organizer.print_preview(organizer.preview())
+        from_dict = capsys.readouterr().out
+
+        assert from_plan == from_dict
+        assert "... and 2 more files" in from_plan
+        assert f"archive_{datetime.now():%Y%m%d}/" in from_plan
+        assert "Total files to organize: 6" in from_plan
+        assert "Old files (>365 days): 1" in from_plan
+
+    def test_print_preview_archive_layout(self, temp_dir, capsys):
+        """Test that the preview groups archived files by their layout directory."""
+        organizer = FileOrganizer(temp_dir, archive_layout="archive/{year}/{category}")
+        old_file = self.create_test_file(temp_dir, "old_file.txt", old=True)
+        year = datetime.fromtimestamp(old_file.stat().st_mtime).year
+
+        organizer.print_preview(organizer.plan())
+
+        assert f"└── 📁 archive/\n    ├── 📁 {year}/Text/" in capsys.readouterr().out
+
+    @pytest.mark.parametrize(
+        ("layout", "expected"),
+        [
+            ("archive", "└── 📁 archive/\n    └── 📄 old_file.txt"),
+            ("{category}", "└── 📁 Text/\n    └── 📄 old_file.txt"),
+        ],
+    )
+    def test_print_preview_one_level_layout(self, temp_dir, capsys, layout, expected):
+        """Test that one-level archive layouts are named in the preview tree."""
+        organizer = FileOrganizer(temp_dir, archive_layout=layout)
+        self.create_test_file(temp_dir, "old_file.txt", old=True)
+
+        organizer.print_preview(organizer.plan())
+
+        output = capsys.readouterr().out
+        assert expected in output
+        assert "📁 ./" not in output
+
     def test_execute(self, temp_dir, organizer):
         """Test file organization execution."""
         # Create test files
@@ -220,3 +267,120 @@ class TestFileOrganizer:
 
         # Close logging to release file locks
         organizer.close_logging()
+
+    def test_logging_json_lines(self, temp_dir):
+        """Test structured JSON-lines logging without console echo."""
+        import json
+
+        self.create_test_file(temp_dir, "image.jpg")
+        organizer = FileOrganizer(
+            source_dir=temp_dir, enable_logging=True, log_format="json", log_console=False
+        )
+        organizer.execute()
+        organizer.close_logging()
+
+        log_file = next(temp_dir.glob("tidydir_*.log"))
+        records = [json.loads(line) for line in log_file.read_text().splitlines()]
+        moved = [record for record in records if record.get("event") == "moved"]
+        assert len(moved) == 1
+        assert moved[0]["target"] == str(temp_dir.resolve() / "Images" / "image.jpg")
+        assert organizer.logger is not None
+        assert not organizer.logger.handlers
+
+    def test_hooks(self, temp_dir, organizer):
+        """Test per-file event callbacks."""
+        self.create_test_file(temp_dir, "image.jpg")
+        events = []
+
+        organizer.add_hook("scanned", lambda path: events.append(("scanned", path.name)))
+        organizer.add_hook("classified", lambda _path, cat: events.append(("classified", cat)))
+        organizer.add_hook("planned", lambda op: events.append(("planned", op.target.name)))
+        organizer.add_hook("moved", lambda op: events.append(("moved", op.source.name)))
+
+        organizer.execute()
+
+        # execute() plans once, so scan/classify/plan fire once per file
+        assert events == [
+            ("scanned", "image.jpg"),
+            ("classified", FileCategory.IMAGES),
+            ("planned", "image.jpg"),
+            ("moved", "image.jpg"),
+        ]
+
+    def test_failed_hook(self, temp_dir, organizer):
+        """Test that failures are reported to hooks and can be unregistered."""
+        self.create_test_file(temp_dir, "image.jpg")
+        failures = []
+
+        def on_failed(op, error):
+            failures.append((op.source.name, type(error)))
+
+        def remove_source(op):
+            op.source.unlink()
+
+        organizer.add_hook("planned", remove_source)
+        organizer.add_hook("failed", on_failed)
+        organizer.execute()
+        assert failures == [("image.jpg", FileNotFoundError)]
+
+        organizer.remove_hook("failed", on_failed)
+        assert organizer.hooks.dispatcher(HookEvent.FAILED) is None
+
+    def test_duplicate_names_in_subdirs(self, temp_dir):
+        """Test that same-named files from different subdirectories stay distinct."""
+        for sub in ("a", "b"):
+            (temp_dir / sub).mkdir()
+            (temp_dir / sub / "photo.jpg").write_text(sub)
+
+        organizer = FileOrganizer(source_dir=temp_dir, include_subdirs=True)
+        result = organizer.execute()
+
+        assert result.moved_count == 2
+        contents = {p.read_text() for p in (temp_dir / "Images").iterdir()}
+        assert contents == {"a", "b"}
+        assert len(result.conflicts) == 1
+
+    def test_plan_paths(self, temp_dir):
+        """Test planning a list of files without scanning the source."""
+        (temp_dir / "sub").mkdir()
+        listed = [
+            self.create_test_file(temp_dir, "photo.jpg"),
+            self.create_test_file(temp_dir / "sub", "photo.jpg"),
+            self.create_test_file(temp_dir, "old.pdf", old=True),
+        ]
+        self.create_test_file(temp_dir, "unlisted.txt")
+        organizer = FileOrganizer(source_dir=temp_dir)
+
+        with patch.object(organizer, "_scan_source", side_effect=AssertionError("scanned")):
+            plan = organizer.plan_paths(iter([*listed, temp_dir / "gone.txt"]))
+
+        targets = [(op.source, op.target.relative_to(temp_dir)) for op in plan]
+        assert len(targets) == 3
+        assert targets[:2] == [
+            (listed[0], Path("Images", "photo.jpg")),
+            (listed[1], Path("Images", "photo_1.jpg")),
+        ]
+        assert targets[2][1].parts[0].startswith("archive_")
+        assert organizer.stats.counters["files_planned"] == 3
+        assert organizer.stats.counters["files_skipped"] == 1
+
+    def test_organize_paths(self, temp_dir):
+        """Test that only the listed files are moved."""
+        listed = self.create_test_file(temp_dir, "report.pdf")
+        unlisted = self.create_test_file(temp_dir, "image.jpg")
+        organizer = FileOrganizer(source_dir=temp_dir)
+
+        result = organizer.organize_paths([str(listed)])
+
+        assert result.moved_count == result.total_count == 1
+        assert (temp_dir / "Documents" / "report.pdf").exists()
+        assert unlisted.exists()
+
+    def test_plan_paths_refuses_locking(self, temp_dir):
+        """Test that listed files cannot be combined with partition leases."""
+        organizer = FileOrganizer(source_dir=temp_dir, lock=True)
+        try:
+            with pytest.raises(ValueError, match="Locking"):
+                organizer.plan_paths([])
+        finally:
+            organizer.release_locks()
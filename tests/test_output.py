@@ -0,0 +1,80 @@
+"""Tests for machine-readable preview output."""
+
+import io
+import json
+import os
+import time
+from pathlib import Path
+
+import pytest
+
+from tidydir.organizer import FileOrganizer
+from tidydir.output import stream_preview
+
+
+class TestStreamPreview:
+    """Test suite for stream_preview."""
+
+    @pytest.fixture
+    def organizer(self, tmp_path):
+        """Create an organizer over a few files, one of them old."""
+        for name in ("a.jpg", "b.jpg", "c.pdf"):
+            (tmp_path / name).write_text("data")
+        old = tmp_path / "old.txt"
+        old.write_text("x")
+        old_time = time.time() - 400 * 86400
+        os.utime(old, (old_time, old_time))
+        return FileOrganizer(source_dir=tmp_path)
+
+    def test_ndjson(self, organizer):
+        """Test one record per operation followed by a summary record."""
+        out = io.StringIO()
+        plan = stream_preview(organizer, "ndjson", out)
+
+        records = [json.loads(line) for line in out.getvalue().splitlines()]
+        assert [r["type"] for r in records] == ["operation"] * 4 + ["summary"]
+        by_name = {Path(r["source"]).name: r for r in records[:-1]}
+        assert by_name["old.txt"]["old"] is True
+        assert by_name["a.jpg"]["category"] == "Images"
+        assert by_name["a.jpg"]["size"] == 4
+
+        summary = records[-1]
+        assert summary["total_files"] == 4
+        assert summary["old_files"] == 1
+        assert summary["categories"]["Images"] == {"files": 2, "bytes": 8}
+        # Operations were streamed, not kept
+        assert len(plan) == 4
+        assert list(plan) == []
+
+    def test_json(self, organizer):
+        """Test that the json format is a single valid document."""
+        out = io.StringIO()
+        stream_preview(organizer, "json", out)
+
+        document = json.loads(out.getvalue())
+        assert len(document["operations"]) == 4
+        assert document["summary"]["total_bytes"] == 13
+        assert not organizer.hooks
+
+    def test_ndjson_paths(self, organizer):
+        """Test streaming the plan of an explicit file list."""
+        out = io.StringIO()
+        stream_preview(organizer, "ndjson", out, paths=[organizer.source_dir / "c.pdf"])
+
+        records = [json.loads(line) for line in out.getvalue().splitlines()]
+        assert [Path(r["source"]).name for r in records[:-1]] == ["c.pdf"]
+        assert records[-1]["total_files"] == 1
+
+    def test_json_empty(self, tmp_path):
+        """Test the json document for a directory without files."""
+        out = io.StringIO()
+        stream_preview(FileOrganizer(source_dir=tmp_path), "json", out)
+
+        document = json.loads(out.getvalue())
+        assert document["operations"] == []
+        assert document["summary"]["total_files"] == 0
+
+    def test_text_rejected(self, organizer):
+        """Test that the text format is not streamed."""
+        with pytest.raises(ValueError):
+            stream_preview(organizer, "text", io.StringIO())
@@ -0,0 +1,144 @@
+"""Tests for packing old files into archives."""
+
+import os
+import tarfile
+import time
+import zipfile
+
+import pytest
+
+from tidydir.hooks import HookEvent
+from tidydir.organizer import FileOrganizer
+from tidydir.packing import ArchiveFormat, pack_archive
+
+OLD = time.time() - 400 * 86400
+
+
+def make_files(root, names, old=False):
+    """Create files, optionally dated more than a year back."""
+    for name in names:
+        path = root / name
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(f"content of {name}")
+        if old:
+            os.utime(path, (OLD, OLD))
+
+
+def archive_names(path):
+    """List the member names of a tar or zip archive."""
+    if path.suffix == ".zip":
+        with zipfile.ZipFile(path) as zf:
+            return sorted(zf.namelist())
+    with tarfile.open(path) as tf:
+        return sorted(tf.getnames())
+
+
+class TestPackArchive:
+    """Test suite for pack_archive."""
+
+    @pytest.mark.parametrize("archive_format", list(ArchiveFormat))
+    def test_formats(self, tmp_path, archive_format):
+        """Test writing every format and keeping the sources."""
+        make_files(tmp_path, ["a.txt", "b.txt"])
+        archive = tmp_path / f"out{archive_format.suffix}"
+
+        result = pack_archive(
+            str(archive),
+            archive_format,
+            [(str(tmp_path / "a.txt"), "a.txt"), (str(tmp_path / "b.txt"), "renamed.txt")],
+        )
+
+        assert result.packed == [0, 1]
+        assert result.errors == []
+        assert archive_names(archive) == ["a.txt", "renamed.txt"]
+        assert (tmp_path / "a.txt").exists()
+        assert not (tmp_path / f"out{archive_format.suffix}.partial").exists()
+
+    def test_missing_source_skipped(self, tmp_path):
+        """Test that an unreadable source is reported without losing the others."""
+        make_files(tmp_path, ["a.txt"])
+        archive = tmp_path / "out.zip"
+
+        result = pack_archive(
+            str(archive),
+            "zip",
+            [(str(tmp_path / "gone.txt"), "gone.txt"), (str(tmp_path / "a.txt"), "a.txt")],
+        )
+
+        assert result.packed == [1]
+        assert [position for position, _ in result.errors] == [0]
+        assert archive_names(archive) == ["a.txt"]
+
+    def test_unwritable_archive(self, tmp_path):
+        """Test that every member fails when the archive cannot be written."""
+        make_files(tmp_path, ["a.txt"])
+
+        result = pack_archive(
+            str(tmp_path / "missing" / "out.tar.gz"), "tar.gz", [(str(tmp_path / "a.txt"), "a.txt")]
+        )
+
+        assert result.packed == []
+        assert [position for position, _ in result.errors] == [0]
+
+
+class TestOrganizerPacking:
+    """Test suite for FileOrganizer with an archive format."""
+
+    def test_execute_packs_old_files(self, tmp_path):
+        """Test that old files end up in per-category archives and new ones are moved."""
+        make_files(tmp_path, ["old1.jpg", "old2.png", "old.pdf"], old=True)
+        make_files(tmp_path, ["new.jpg"])
+        organizer = FileOrganizer(
+            tmp_path, archive_layout="archive/{category}", archive_format="tar.gz"
+        )
+        moved = []
+        organizer.add_hook(HookEvent.MOVED, moved.append)
+
+        result = organizer.execute()
+
+        assert result.moved_count == result.total_count == 4
+        assert archive_names(tmp_path / "archive" / "Images.tar.gz") == ["old1.jpg", "old2.png"]
+        assert archive_names(tmp_path / "archive" / "Documents.tar.gz") == ["old.pdf"]
+        assert (tmp_path / "Images" / "new.jpg").exists()
+        assert not (tmp_path / "old1.jpg").exists()
+        assert not (tmp_path / "archive" / "Images").exists()
+        assert str(tmp_path / "archive" / "Documents.tar.gz" / "old.pdf") in {
+            str(op.target) for op in moved
+        }
+        assert organizer.stats.counters["files_packed"] == 3
+        assert organizer.stats.counters["archives_written"] == 2
+
+    def test_existing_archive_not_overwritten(self, tmp_path):
+        """Test that a second run writes a new archive next to the first."""
+        (tmp_path / "archive").mkdir()
+        (tmp_path / "archive" / "Text.zip").write_text("earlier run")
+        make_files(tmp_path, ["notes.txt"], old=True)
+        organizer = FileOrganizer(
+            tmp_path, archive_layout="archive/{category}", archive_format="zip"
+        )
+
+        organizer.execute()
+
+        assert (tmp_path / "archive" / "Text.zip").read_text() == "earlier run"
+        assert archive_names(tmp_path / "archive" / "Text_1.zip") == ["notes.txt"]
+
+    def test_worker_processes(self, tmp_path, monkeypatch):
+        """Test packing several archives in a process pool."""
+        monkeypatch.setattr(os, "cpu_count", lambda: 2)
+        make_files(tmp_path, ["a.jpg", "b.pdf", "c.mp3"], old=True)
+        organizer = FileOrganizer(tmp_path, archive_format="tar.xz")
+
+        result = organizer.execute()
+
+        archives = sorted(p.name for p in tmp_path.glob("archive_*/*"))
+        assert result.moved_count == 3
+        assert archives == ["Audio.tar.xz", "Documents.tar.xz", "Images.tar.xz"]
+
+    def test_preview_shows_archives(self, tmp_path, capsys):
+        """Test that the preview names the archive files."""
+        make_files(tmp_path, ["old.jpg"], old=True)
+        organizer = FileOrganizer(tmp_path, archive_format="zip")
+
+        organizer.print_preview(organizer.plan())
+
+        assert "📦 Images.zip" in capsys.readouterr().out
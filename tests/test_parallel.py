@@ -0,0 +1,74 @@
+"""Tests for planning with worker processes."""
+
+import os
+
+from tidydir.hooks import HookEvent
+from tidydir.organizer import FileOrganizer
+
+
+def make_tree(root):
+    """Create a tree whose shards share file names and a pre-existing target."""
+    (root / "top.jpg").write_text("x")
+    for shard in ("a", "b", "c"):
+        (root / shard / "nested").mkdir(parents=True)
+        (root / shard / "top.jpg").write_text("x")
+        (root / shard / "nested" / f"{shard}.pdf").write_text("x")
+        (root / shard / "nested" / "notes.txt").write_text("x")
+    (root / "Text").mkdir()
+    (root / "Text" / "notes.txt").write_text("already here")
+
+
+class TestParallelPlanning:
+    """Test suite for --processes planning."""
+
+    def test_same_plan_as_serial(self, tmp_path):
+        """Test that sharded planning resolves conflicts like a serial scan."""
+        make_tree(tmp_path)
+        serial = FileOrganizer(tmp_path, include_subdirs=True)
+        parallel = FileOrganizer(tmp_path, include_subdirs=True, processes=2)
+
+        expected = list(serial.plan().iter_moves())
+        plan = parallel.plan()
+
+        assert list(plan.iter_moves()) == expected
+        assert parallel.conflicts == serial.conflicts
+        targets = [target for _, _, target, _ in expected]
+        assert len(set(targets)) == len(targets)
+        assert parallel.stats.counters["files_planned"] == len(expected)
+
+    def test_archive_layout(self, tmp_path):
+        """Test that workers place old files like a serial run."""
+        make_tree(tmp_path)
+        for i, path in enumerate(sorted(tmp_path.rglob("*.*"))):
+            os.utime(path, (1_000_000_000 + i * 40_000_000,) * 2)
+        layout = "archive/{year}/{month}/{category}"
+        serial = FileOrganizer(tmp_path, include_subdirs=True, archive_layout=layout)
+        parallel = FileOrganizer(tmp_path, include_subdirs=True, processes=2, archive_layout=layout)
+
+        expected = list(serial.plan().iter_moves())
+
+        assert list(parallel.plan().iter_moves()) == expected
+        assert len({os.path.dirname(target) for _, _, target, _ in expected}) > 3
+
+    def test_hooks_fall_back_to_serial(self, tmp_path):
+        """Test that scanned hooks still see every file."""
+        make_tree(tmp_path)
+        organizer = FileOrganizer(tmp_path, include_subdirs=True, processes=2)
+        scanned = []
+        organizer.add_hook(HookEvent.SCANNED, scanned.append)
+
+        plan = organizer.plan()
+
+        assert len(scanned) == len(plan)
+
+    def test_execute(self, tmp_path):
+        """Test that a sharded plan executes."""
+        make_tree(tmp_path)
+        organizer = FileOrganizer(
+            tmp_path, target_dir=tmp_path / "out", include_subdirs=True, processes=2
+        )
+
+        result = organizer.execute()
+
+        assert result.moved_count == result.total_count == 11
+        assert len(list((tmp_path / "out" / "Images").iterdir())) == 4
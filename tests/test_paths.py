@@ -0,0 +1,82 @@
+"""Tests for the string-based path helpers."""
+
+import io
+import os
+from pathlib import Path
+
+import pytest
+
+from tidydir._paths import list_files, move_file, read_path_list, scan_files, split_ext
+
+
+class TestPaths:
+    """Test suite for the internal path layer."""
+
+    @pytest.mark.parametrize(
+        "name", ["photo.jpg", "archive.tar.gz", ".bashrc", "file.", "noext", "..a", "a.b."]
+    )
+    def test_split_ext_matches_pathlib(self, name):
+        """Test that splitting agrees with Path.stem and Path.suffix."""
+        path = Path(name)
+        assert split_ext(name) == (path.stem, path.suffix)
+
+    def test_scan_files(self, tmp_path):
+        """Test scanning with and without subdirectories, skipping log files."""
+        (tmp_path / "a.txt").touch()
+        (tmp_path / "tidydir_20240101_000000.log").touch()
+        (tmp_path / "sub").mkdir()
+        (tmp_path / "sub" / "b.txt").touch()
+
+        flat = [entry.name for _dir, entry in scan_files(str(tmp_path), False)]
+        deep = sorted(entry.name for _dir, entry in scan_files(str(tmp_path), True))
+
+        assert flat == ["a.txt"]
+        assert deep == ["a.txt", "b.txt"]
+
+    def test_scan_missing_root(self, tmp_path):
+        """Test that an unreadable root is reported."""
+        with pytest.raises(OSError):
+            list(scan_files(str(tmp_path / "missing"), False))
+
+    def test_list_files(self, tmp_path, monkeypatch):
+        """Test listing explicit paths, skipping duplicates and non-files."""
+        monkeypatch.chdir(tmp_path)
+        (tmp_path / "a.txt").write_text("data")
+        (tmp_path / "tidydir_20240101_000000.log").touch()
+        (tmp_path / "sub").mkdir()
+        skipped = []
+
+        listed = list(
+            list_files(
+                ["a.txt", tmp_path / "a.txt", "missing.txt", "sub", "tidydir_20240101_000000.log"],
+                lambda path, _reason: skipped.append(os.path.basename(path)),
+            )
+        )
+
+        assert [(d, e.path, e.name) for d, e in listed] == [
+            (str(tmp_path), str(tmp_path / "a.txt"), "a.txt")
+        ]
+        assert listed[0][1].stat().st_size == 4
+        assert skipped == ["missing.txt", "sub"]
+
+    def test_read_path_list_lines(self):
+        """Test reading a newline-separated list, skipping empty lines."""
+        stream = io.BytesIO(b"a.txt\n\nsub/b c.txt\nlast")
+        assert list(read_path_list(stream)) == ["a.txt", "sub/b c.txt", "last"]
+
+    def test_read_path_list_null(self, monkeypatch):
+        """Test reading a NUL-separated list across buffer boundaries."""
+        monkeypatch.setattr("tidydir._paths.LIST_BUFFER", 3)
+        stream = io.BytesIO(b"a.txt\0with\nnewline\0\0b.txt\0")
+        assert list(read_path_list(stream, null=True)) == ["a.txt", "with\nnewline", "b.txt"]
+
+    def test_move_file_never_replaces(self, tmp_path):
+        """Test that moving onto an existing file fails and keeps both files."""
+        (tmp_path / "a.txt").write_text("a")
+        (tmp_path / "b.txt").write_text("b")
+
+        with pytest.raises(FileExistsError):
+            move_file(str(tmp_path / "a.txt"), str(tmp_path / "b.txt"))
+
+        assert (tmp_path / "a.txt").read_text() == "a"
+        assert (tmp_path / "b.txt").read_text() == "b"
@@ -0,0 +1,147 @@
+"""Tests for the compact plan representation."""
+
+from pathlib import Path
+
+from tidydir.categories import FileCategory
+from tidydir.plan import CompactPlan, FileOperation, NameStore, PlanSummary
+
+
+class TestCompactPlan:
+    """Test suite for CompactPlan."""
+
+    def test_name_store(self):
+        """Test packing names, including undecodable ones."""
+        store = NameStore()
+        names = ["a.txt", "", "фото.jpg", "bad\udcff.bin"]
+        indexes = [store.append(name) for name in names]
+
+        assert indexes == [0, 1, 2, 3]
+        assert [store[i] for i in indexes] == names
+        assert len(store) == 4
+
+    def test_round_trip(self):
+        """Test that stored operations come back as equal FileOperations."""
+        plan = CompactPlan()
+        op = FileOperation(
+            source=Path("/src/photo.jpg"),
+            target=Path("/dst/Images/photo_1.jpg"),
+            category=FileCategory.IMAGES,
+            is_old=True,
+            size=123,
+        )
+        plan.add(op)
+        plan.append("/src", "a.pdf", "/dst/Documents", "a.pdf", FileCategory.DOCUMENTS, False)
+
+        assert len(plan) == 2
+        assert plan[0] == op
+        assert plan[-1].target == Path("/dst/Documents/a.pdf")
+        assert [o.source.name for o in plan] == ["photo.jpg", "a.pdf"]
+        assert plan.total_bytes == 123
+
+    def test_directories_are_interned(self):
+        """Test that directories are stored once and grouped like preview()."""
+        plan = CompactPlan()
+        for i in range(3):
+            plan.append("/src", f"{i}.jpg", "/dst/Images", f"{i}.jpg", FileCategory.IMAGES, False)
+        plan.append("/src", "x.txt", "/dst/Text", "x.txt", FileCategory.TEXT, False)
+
+        assert plan.target_directories() == ["/dst/Images", "/dst/Text"]
+        grouped = plan.group_by_directory()
+        assert [len(ops) for ops in grouped.values()] == [3, 1]
+
+    def test_split_old(self):
+        """Test splitting a plan by age, keeping order and renamed targets."""
+        plan = CompactPlan()
+        plan.append("/src", "a.jpg", "/dst/Images", "a.jpg", FileCategory.IMAGES, False, 1)
+        plan.append("/src", "b.jpg", "/dst/old/Images", "b_1.jpg", FileCategory.IMAGES, True, 2)
+        plan.append("/src", "c.txt", "/dst/Text", "c.txt", FileCategory.TEXT, False, 3)
+
+        recent, old = plan.split_old()
+
+        assert [op.source.name for op in recent] == ["a.jpg", "c.txt"]
+        assert list(old) == [plan[1]]
+        assert old.total_bytes == 2
+
+    def test_totals_by_dirs(self):
+        """Test totalling files and bytes per directory pair and age."""
+        plan = CompactPlan()
+        plan.append("/src", "a.jpg", "/dst/Images", "a.jpg", FileCategory.IMAGES, False, 3)
+        plan.append("/src", "b.jpg", "/dst/Images", "b_1.jpg", FileCategory.IMAGES, False, 4)
+        plan.append("/src/sub", "c.jpg", "/dst/Images", "c.jpg", FileCategory.IMAGES, False, 5)
+        plan.append("/src", "d.jpg", "/dst/archive", "d.jpg", FileCategory.IMAGES, True, 6)
+
+        assert plan.totals_by_dirs() == {
+            ("/src", "/dst/Images", False): (2, 7),
+            ("/src/sub", "/dst/Images", False): (1, 5),
+            ("/src", "/dst/archive", True): (1, 6),
+        }
+
+    def test_split_by_size(self):
+        """Test routing operations by size and reading chosen ones back."""
+        plan = CompactPlan()
+        for i, size in enumerate([5, 100, 99, 0, 300]):
+            plan.append(
+                "/src", f"{i}.mp4", "/dst/Videos", f"{i}.mp4", FileCategory.VIDEOS, False, size
+            )
+
+        small, large = plan.split_by_size(100)
+
+        assert list(small) == [0, 2, 3]
+        assert list(large) == [1, 4]
+        assert plan.bytes_at(large) == 400
+        assert [move[1] for move in plan.iter_moves_at(large)] == ["/src/1.mp4", "/src/4.mp4"]
+
+    def test_smaller_than_operations(self):
+        """Test that the plan is much smaller than the equivalent objects."""
+        import sys
+
+        plan = CompactPlan()
+        for i in range(1000):
+            plan.append(
+                "/data/src/sub",
+                f"file_{i:06d}.jpg",
+                "/data/Images",
+                f"file_{i:06d}.jpg",
+                FileCategory.IMAGES,
+                False,
+                1000,
+            )
+
+        op = plan[0]
+        per_op = sys.getsizeof(op) + sys.getsizeof(op.source) + sys.getsizeof(op.target)
+        assert plan.nbytes / len(plan) * 5 < per_op
+
+
+class TestPlanSummary:
+    """Test suite for PlanSummary."""
+
+    def test_maintained_while_planning(self):
+        """Test that the plan keeps per-directory totals and samples."""
+        plan = CompactPlan()
+        for i in range(5):
+            plan.append(
+                "/src", f"{i}.jpg", "/dst/Images", f"{i}.jpg", FileCategory.IMAGES, False, 10
+            )
+        plan.append(
+            "/src", "old.jpg", "/dst/archive/Images", "old.jpg", FileCategory.IMAGES, True, 7
+        )
+        plan.append("/src", "x.txt", "/dst/Text", "x.txt", FileCategory.TEXT, False, 1)
+
+        summary = plan.summary
+        assert summary.total_count == 7
+        assert summary.total_bytes == plan.total_bytes == 58
+        assert summary.old_count == 1
+        assert summary.by_category() == {FileCategory.IMAGES: (6, 57), FileCategory.TEXT: (1, 1)}
+        images = summary.buckets["/dst/Images", FileCategory.IMAGES]
+        assert images.count == 5
+        assert images.samples == ["0.jpg", "1.jpg", "2.jpg"]
+
+    def test_from_operations(self):
+        """Test that a summary built from operations matches the plan's."""
+        plan = CompactPlan()
+        plan.append("/src", "a.pdf", "/dst/Documents", "a_1.pdf", FileCategory.DOCUMENTS, False, 3)
+        plan.append("/src", "b.pdf", "/dst/Documents", "b.pdf", FileCategory.DOCUMENTS, False, 4)
+
+        summary = PlanSummary.from_operations(plan)
+
+        assert summary.buckets == plan.summary.buckets
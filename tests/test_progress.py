@@ -0,0 +1,52 @@
+"""Tests for progress reporting."""
+
+import io
+
+from tidydir.progress import ProgressReporter, create_progress, format_duration, format_size
+
+
+class _TTY(io.StringIO):
+    """StringIO that claims to be a terminal."""
+
+    def isatty(self):
+        return True
+
+
+class TestProgress:
+    """Test suite for progress reporting."""
+
+    def test_format_size(self):
+        """Test human-readable sizes."""
+        assert format_size(512) == "512 B"
+        assert format_size(1536) == "1.5 KiB"
+        assert format_size(3 * 1024**3) == "3.0 GiB"
+
+    def test_format_duration(self):
+        """Test human-readable durations."""
+        assert format_duration(42) == "42s"
+        assert format_duration(125) == "2m05s"
+        assert format_duration(3720) == "1h02m"
+
+    def test_disabled_without_tty(self):
+        """Test that progress is only shown on a terminal."""
+        assert create_progress(10, 100, stream=io.StringIO()) is None
+        assert create_progress(10, 100, enabled=False, stream=_TTY()) is None
+        assert isinstance(create_progress(10, 100, stream=_TTY()), ProgressReporter)
+
+    def test_eta_uses_slower_rate(self):
+        """Test that the ETA follows whichever of files or bytes lags behind."""
+        reporter = ProgressReporter(total_files=10, total_bytes=1000, stream=io.StringIO())
+        for _ in range(5):
+            reporter.advance(10)
+
+        # Half the files but only 5% of the bytes are done after 10 seconds
+        assert reporter.eta(10.0) == 190.0
+
+    def test_render_and_final_line(self):
+        """Test that stopping writes a final progress line."""
+        stream = _TTY()
+        with ProgressReporter(total_files=2, total_bytes=2048, stream=stream, interval=60):
+            pass
+
+        assert stream.getvalue().startswith("\rProgress: 0/2 files (0.0%) | 0 B/2.0 KiB")
+        assert stream.getvalue().endswith("\n")
@@ -0,0 +1,290 @@
+"""Tests for capping category directories with shard subdirectories."""
+
+import os
+import time
+from datetime import datetime
+from unittest.mock import patch
+
+import pytest
+
+from tidydir.cli import main
+from tidydir.fs import MemoryFileSystem
+from tidydir.organizer import FileOrganizer
+from tidydir.sharding import ShardBy, Sharder, hash_shard, plan_reshard
+
+NOW = time.time()
+
+
+def month(mtime):
+    """Get the date shard of an mtime."""
+    return datetime.fromtimestamp(mtime).strftime("%Y-%m")
+
+
+@pytest.fixture
+def fs(tmp_path):
+    """Create a source of five images and a target whose Images holds two entries."""
+    fs = MemoryFileSystem()
+    for i in range(5):
+        fs.add_file(tmp_path / "src" / f"img{i}.jpg", 1, NOW)
+    fs.add_file(tmp_path / "out" / "Images" / "old.jpg", 1, NOW)
+    fs.makedirs(str(tmp_path / "out" / "Images" / "sub"))
+    return fs
+
+
+class TestSharder:
+    """Test suite for Sharder."""
+
+    def test_hash_shard(self):
+        """Test that hash shards are two hex digits that only depend on the name."""
+        shard = hash_shard("photo.jpg")
+
+        assert len(shard) == 2
+        assert int(shard, 16) < 256
+        assert hash_shard("photo.jpg") == shard
+        assert hash_shard("caf\udce9.jpg") == hash_shard("caf\udce9.jpg")
+
+    def test_date_shard(self):
+        """Test that date shards are the year and month of the mtime."""
+        sharder = Sharder(1, ShardBy.DATE, MemoryFileSystem())
+        mtime = datetime(2026, 10, 5, 12).timestamp()
+
+        assert sharder.shard("a.jpg", mtime) == "2026-10"
+
+    def test_directory_fills_then_shards(self, fs, tmp_path):
+        """Test that existing entries count and files go to shards once the cap is hit."""
+        images = str(tmp_path / "out" / "Images")
+        sharder = Sharder(3, fs=fs)
+
+        dirs = [sharder.directory(images, f"n{i}.jpg", NOW) for i in range(3)]
+
+        assert dirs[0] == images
+        assert dirs[1] == os.path.join(images, hash_shard("n1.jpg"))
+        assert dirs[2] == os.path.join(images, hash_shard("n2.jpg"))
+        assert sharder.count(images) == 3
+
+    def test_missing_directory_is_empty(self, tmp_path):
+        """Test that a directory that does not exist yet has room."""
+        sharder = Sharder(2, fs=MemoryFileSystem())
+        missing = str(tmp_path / "missing")
+
+        assert sharder.directory(missing, "a.jpg", NOW) == missing
+        assert sharder.directory(missing, "b.jpg", NOW) == missing
+        assert sharder.directory(missing, "c.jpg", NOW) != missing
+
+    def test_local_counting_is_bounded(self, tmp_path):
+        """Test that at most max_entries entries are listed on disk."""
+        for i in range(10):
+            (tmp_path / f"f{i}").touch()
+        sharder = Sharder(4)
+
+        assert sharder.count(str(tmp_path)) == 4
+
+    def test_invalid(self):
+        """Test that a non-positive cap and unknown modes are refused."""
+        with pytest.raises(ValueError, match="positive"):
+            Sharder(0)
+        with pytest.raises(ValueError):
+            Sharder(1, "random")
+
+
+class TestOrganizerSharding:
+    """Test suite for sharding in FileOrganizer."""
+
+    def test_plan(self, fs, tmp_path):
+        """Test that new files fill the category directory, then its shards."""
+        out = tmp_path / "out"
+        organizer = FileOrganizer(tmp_path / "src", out, max_per_dir=3, fs=fs)
+
+        plan = organizer.plan()
+
+        targets = [op.target for op in plan]
+        assert targets[0] == out / "Images" / "img0.jpg"
+        assert targets[1:] == [
+            out / "Images" / hash_shard(f"img{i}.jpg") / f"img{i}.jpg" for i in range(1, 5)
+        ]
+
+    def test_plan_recounts_each_run(self, fs, tmp_path):
+        """Test that every plan counts the directories afresh."""
+        organizer = FileOrganizer(tmp_path / "src", tmp_path / "out", max_per_dir=3, fs=fs)
+
+        assert [op.target for op in organizer.plan()] == [op.target for op in organizer.plan()]
+
+    def test_date_shards_and_execute(self, fs, tmp_path):
+        """Test executing into date shards."""
+        out = tmp_path / "out"
+        organizer = FileOrganizer(tmp_path / "src", out, max_per_dir=2, shard_by="date", fs=fs)
+
+        result = organizer.execute()
+
+        assert result.moved_count == 5
+        assert sorted(fs.listdir(out / "Images" / month(NOW))) == [f"img{i}.jpg" for i in range(5)]
+
+    def test_old_files_not_sharded(self, tmp_path):
+        """Test that archive directories are not capped."""
+        fs = MemoryFileSystem()
+        for i in range(3):
+            fs.add_file(tmp_path / "src" / f"{i}.txt", 1, NOW - 400 * 86400)
+        organizer = FileOrganizer(
+            tmp_path / "src", archive_layout="archive/{category}", max_per_dir=1, fs=fs
+        )
+
+        plan = organizer.plan()
+
+        assert {op.target.parent for op in plan} == {tmp_path / "src" / "archive" / "Text"}
+
+    def test_get_target_path(self, fs, tmp_path):
+        """Test that single target paths are sharded too."""
+        out = tmp_path / "out"
+        organizer = FileOrganizer(tmp_path / "src", out, max_per_dir=2, fs=fs)
+        source = tmp_path / "src" / "img0.jpg"
+
+        target = organizer.get_target_path(source, organizer.get_category(source), False)
+
+        assert target == out / "Images" / hash_shard("img0.jpg") / "img0.jpg"
+
+    def test_parallel_matches_serial(self, tmp_path):
+        """Test that parallel planning shards like a serial plan."""
+        for name in ("a.jpg", "sub/b.jpg", "sub/c.jpg", "other/d.jpg"):
+            (tmp_path / name).parent.mkdir(parents=True, exist_ok=True)
+            (tmp_path / name).write_text("data")
+        (tmp_path / "Images").mkdir()
+        (tmp_path / "Images" / "x.jpg").write_text("existing")
+
+        def targets(processes):
+            organizer = FileOrganizer(
+                tmp_path, include_subdirs=True, max_per_dir=2, processes=processes
+            )
+            return [op.target for op in organizer.plan()]
+
+        serial = targets(1)
+        assert targets(2) == serial
+        assert sum(target.parent.name == "Images" for target in serial) == 1
+
+    def test_preview_lists_shards(self, fs, tmp_path, capsys):
+        """Test that the preview nests shard directories under their category."""
+        organizer = FileOrganizer(tmp_path / "src", tmp_path / "out", max_per_dir=3, fs=fs)
+
+        organizer.print_preview(organizer.plan())
+
+        output = capsys.readouterr().out
+        assert output.count("📁 Images/") == 1
+        assert f"📁 {hash_shard('img1.jpg')}/ (" in output
+
+    def test_invalid_cap(self, tmp_path):
+        """Test that a non-positive cap is refused."""
+        with pytest.raises(ValueError, match="positive"):
+            FileOrganizer(tmp_path, max_per_dir=0)
+
+
+class TestReshard:
+    """Test suite for plan_reshard."""
+
+    @pytest.fixture
+    def full(self, tmp_path):
+        """Create a target whose Images holds six files and Text two."""
+        fs = MemoryFileSystem()
+        for i in range(6):
+            fs.add_file(tmp_path / "out" / "Images" / f"{i}.jpg", 1, NOW)
+        for i in range(2):
+            fs.add_file(tmp_path / "out" / "Text" / f"{i}.txt", 1, NOW)
+        return fs
+
+    def test_back_under_cap(self, full, tmp_path):
+        """Test that an oversized directory is brought down to the cap, shards included."""
+        images = tmp_path / "out" / "Images"
+        organizer = FileOrganizer(tmp_path / "out", max_per_dir=3, shard_by="date", fs=full)
+
+        plan = plan_reshard(organizer)
+        organizer.execute(plan)
+
+        # One date shard is created, so four files leave and two stay
+        assert len(plan) == 4
+        assert {op.target.parent for op in plan} == {images / month(NOW)}
+        assert full.count_entries(str(images)) == 3
+        assert sorted(full.listdir(tmp_path / "out" / "Text")) == ["0.txt", "1.txt"]
+
+    def test_hash_shards(self, tmp_path):
+        """Test that files move to the hash shard of their name."""
+        fs = MemoryFileSystem()
+        for i in range(300):
+            fs.add_file(tmp_path / "Images" / f"{i}.jpg", 1, NOW)
+        organizer = FileOrganizer(tmp_path, max_per_dir=290, fs=fs)
+
+        plan = plan_reshard(organizer)
+        organizer.execute(plan)
+
+        assert plan
+        for op in plan:
+            assert op.target.parent.name == hash_shard(op.source.name)
+            assert op.target.parent.parent == op.source.parent
+        assert fs.count_entries(str(tmp_path / "Images")) == 290
+
+    def test_no_gain_no_shards(self, tmp_path):
+        """Test that files are not moved into new shards of their own."""
+        by_shard = {}
+        for i in range(300):
+            by_shard.setdefault(hash_shard(f"{i}.jpg"), []).append(f"{i}.jpg")
+        pair = next(names[:2] for names in by_shard.values() if len(names) >= 2)
+        singles = [names[0] for shard, names in by_shard.items() if shard != hash_shard(pair[0])]
+        fs = MemoryFileSystem()
+        for name in [*singles[:5], *pair]:
+            fs.add_file(tmp_path / "Images" / name, 1, NOW)
+        organizer = FileOrganizer(tmp_path, max_per_dir=6, fs=fs)
+
+        plan = plan_reshard(organizer)
+
+        # Only the shard taking both files of the pair removes an entry
+        assert sorted(op.source.name for op in plan) == sorted(pair)
+
+    def test_conflicts_renamed(self, full, tmp_path):
+        """Test that files already in a shard are not overwritten."""
+        images = tmp_path / "out" / "Images"
+        full.add_file(images / month(NOW) / "0.jpg", 1, NOW)
+        organizer = FileOrganizer(tmp_path / "out", max_per_dir=4, shard_by="date", fs=full)
+
+        plan = plan_reshard(organizer)
+
+        assert images / month(NOW) / "0_1.jpg" in [op.target for op in plan]
+        assert len(organizer.conflicts) == 1
+
+    def test_needs_cap(self, tmp_path):
+        """Test that resharding without a cap is refused."""
+        with pytest.raises(ValueError, match="maximum"):
+            plan_reshard(FileOrganizer(tmp_path))
+
+
+class TestShardingCLI:
+    """Test suite for the sharding options."""
+
+    def test_reshard(self, tmp_path, capsys):
+        """Test resharding a target from the command line."""
+        images = tmp_path / "Images"
+        images.mkdir()
+        for i in range(4):
+            (images / f"{i}.jpg").write_text("data")
+
+        argv = ["tidydir", str(tmp_path), "--reshard", "--max-per-dir", "2", "--shard-by", "date"]
+        with patch("sys.argv", [*argv, "--yes"]):
+            assert main() == 0
+
+        assert len(os.listdir(images)) == 2
+        assert sum(len(files) for _, _, files in os.walk(images)) == 4
+        assert "Completed" in capsys.readouterr().out
+
+    def test_reshard_needs_cap(self, tmp_path, capsys):
+        """Test that --reshard requires --max-per-dir."""
+        with patch("sys.argv", ["tidydir", str(tmp_path), "--reshard"]), pytest.raises(SystemExit):
+            main()
+
+        assert "--reshard requires --max-per-dir" in capsys.readouterr().err
+
+    def test_max_per_dir(self, tmp_path):
+        """Test organizing with a cap."""
+        for i in range(3):
+            (tmp_path / f"{i}.jpg").write_text("data")
+
+        argv = ["tidydir", str(tmp_path), "--max-per-dir", "1", "--shard-by", "date", "--yes"]
+        with patch("sys.argv", argv):
+            assert main() == 0
+
+        assert sorted(os.listdir(tmp_path / "Images"))[-1] == month(time.time())
@@ -0,0 +1,204 @@
+"""Tests for the free-space preflight."""
+
+import os
+import time
+import zipfile
+from unittest.mock import patch
+
+import pytest
+
+from tidydir.archive_source import ArchiveSource
+from tidydir.batch import BatchEntry, BatchRunner
+from tidydir.cli import main
+from tidydir.fs import MemoryFileSystem
+from tidydir.organizer import FileOrganizer
+from tidydir.space import DeviceUsage, plan_usage
+
+BLOCK = 4096
+OLD = time.time() - 400 * 86400
+
+
+def fake_statvfs(free_bytes, free_inodes=1000, files=10000):
+    """Build a statvfs result with the given free space and inodes."""
+    return os.statvfs_result(
+        (BLOCK, BLOCK, 0, 0, free_bytes // BLOCK, files, free_inodes, free_inodes, 0, 255)
+    )
+
+
+@pytest.fixture
+def tree(tmp_path):
+    """Create a source with two files and an existing target directory."""
+    source = tmp_path / "src"
+    source.mkdir()
+    (source / "a.jpg").write_bytes(b"x" * 1000)
+    (source / "b.txt").write_bytes(b"x" * 10)
+    (tmp_path / "out").mkdir()
+    return tmp_path
+
+
+@pytest.fixture
+def cross_device(tree):
+    """Pretend the source directory is on a device of its own."""
+    source = str(tree / "src")
+    real = os.stat
+
+    def st_dev(path):
+        return -1 if path == source else real(path).st_dev
+
+    with patch("tidydir.space._st_dev", side_effect=st_dev):
+        yield tree
+
+
+class TestPlanUsage:
+    """Test suite for plan_usage."""
+
+    def test_same_device_needs_only_directories(self, tree):
+        """Test that renames need no space, only inodes for new directories."""
+        organizer = FileOrganizer(tree / "src", tree / "out")
+
+        usages = plan_usage(organizer.plan())
+
+        assert [(u.files, u.bytes, u.inodes) for u in usages] == [(0, 0, 2)]
+        assert usages[0].path == str(tree / "out")
+
+    def test_cross_device(self, cross_device):
+        """Test that copied files need their size, a block of slack and an inode each."""
+        organizer = FileOrganizer(cross_device / "src", cross_device / "out")
+
+        with patch("tidydir.space.os.statvfs", return_value=fake_statvfs(1000 * BLOCK)):
+            (usage,) = plan_usage(organizer.plan())
+
+        assert usage.files == 2
+        assert usage.bytes == 1010 + 2 * BLOCK
+        assert usage.inodes == 4
+        assert usage.free_bytes == 1000 * BLOCK
+        assert usage.issues() == []
+
+    def test_packed_old_files(self, tree):
+        """Test that packed files need space even on the same device."""
+        os.utime(tree / "src" / "b.txt", (OLD, OLD))
+        organizer = FileOrganizer(
+            tree / "src", tree / "out", archive_layout="archive/{category}", archive_format="zip"
+        )
+
+        usages = plan_usage(organizer.plan(), pack_old=True)
+
+        # One archive plus the Images and archive directories
+        assert [(u.files, u.bytes, u.inodes) for u in usages] == [(1, 10, 3)]
+
+    def test_archive_members_copied(self, tree):
+        """Test that archive members count even when the archive is on the target device."""
+        archive = tree / "bundle.zip"
+        with zipfile.ZipFile(archive, "w") as zf:
+            zf.writestr("a.jpg", b"x" * 5000)
+            zf.writestr("b.pdf", b"x" * 3000)
+        organizer = FileOrganizer(archive, tree / "out")
+
+        with patch("tidydir.space.os.statvfs", return_value=fake_statvfs(1000 * BLOCK)):
+            (usage,) = plan_usage(ArchiveSource(organizer).plan())
+
+        assert usage.files == 2
+        assert usage.bytes == 8000 + 2 * BLOCK
+
+    def test_summary_only_plan(self, tree):
+        """Test that a plan without operations needs nothing."""
+        organizer = FileOrganizer(tree / "src", tree / "out")
+
+        assert plan_usage(organizer.plan(keep_operations=False)) == []
+
+
+class TestDeviceUsage:
+    """Test suite for DeviceUsage."""
+
+    def test_issues(self):
+        """Test reporting missing space and inodes."""
+        usage = DeviceUsage("/mnt", files=3, bytes=2048, inodes=5, free_bytes=1024, free_inodes=4)
+
+        issues = usage.issues()
+
+        assert issues[0].startswith("Not enough space on /mnt: 2.0 KiB needed for 3 files")
+        assert issues[1] == "Not enough inodes on /mnt: 5 needed, 4 free"
+
+    def test_no_inode_limit(self):
+        """Test that file systems without an inode limit only check space."""
+        usage = DeviceUsage("/mnt", inodes=10**9, free_inodes=None)
+
+        assert usage.issues() == []
+
+
+class TestCheckSpace:
+    """Test suite for the organizer's and CLI's space checks."""
+
+    def test_check_space(self, cross_device):
+        """Test that a full target device is reported."""
+        organizer = FileOrganizer(cross_device / "src", cross_device / "out")
+
+        with patch("tidydir.space.os.statvfs", return_value=fake_statvfs(BLOCK, 1)):
+            issues = organizer.check_space(organizer.plan())
+
+        assert len(issues) == 2
+        assert "preflight" in organizer.stats.phases
+
+    def test_memory_backend_skipped(self, tmp_path):
+        """Test that file systems that are not local are not checked."""
+        fs = MemoryFileSystem()
+        fs.add_file(tmp_path / "a.jpg", 10)
+        organizer = FileOrganizer(tmp_path, fs=fs)
+
+        assert organizer.check_space(organizer.plan()) == []
+
+    def test_cli_refuses(self, cross_device, capsys):
+        """Test that the CLI moves nothing when the target is short of space."""
+        argv = ["tidydir", str(cross_device / "src"), "-t", str(cross_device / "out"), "--yes"]
+        with (
+            patch("tidydir.space.os.statvfs", return_value=fake_statvfs(BLOCK)),
+            patch("sys.argv", argv),
+        ):
+            assert main() == 1
+
+        assert "Not enough space" in capsys.readouterr().out
+        assert (cross_device / "src" / "a.jpg").exists()
+
+    def test_cli_ignore_space(self, cross_device, capsys):
+        """Test that --ignore-space only warns."""
+        argv = ["tidydir", str(cross_device / "src"), "-t", str(cross_device / "out"), "--yes"]
+        with (
+            patch("tidydir.space.os.statvfs", return_value=fake_statvfs(BLOCK)),
+            patch("sys.argv", [*argv, "--ignore-space"]),
+        ):
+            assert main() == 0
+
+        assert "⚠️  Not enough room" in capsys.readouterr().out
+        assert (cross_device / "out" / "Images" / "a.jpg").exists()
+
+    def test_cli_executes_checked_plan(self, tree):
+        """Test that the CLI moves the plan it checked instead of planning again."""
+        argv = ["tidydir", str(tree / "src"), "-t", str(tree / "out"), "--yes"]
+        real_plan = FileOrganizer.plan
+
+        def plan(organizer, *args, **kwargs):
+            # A file that appears after the check is left alone
+            result = real_plan(organizer, *args, **kwargs)
+            (tree / "src" / "late.txt").write_text("late")
+            return result
+
+        with (
+            patch.object(FileOrganizer, "plan", autospec=True, side_effect=plan) as mock_plan,
+            patch("sys.argv", argv),
+        ):
+            assert main() == 0
+
+        assert mock_plan.call_count == 1
+        assert (tree / "out" / "Images" / "a.jpg").exists()
+        assert (tree / "src" / "late.txt").exists()
+
+    def test_batch_root_fails(self, cross_device):
+        """Test that a batch root short of space fails before moving anything."""
+        entry = BatchEntry(source=cross_device / "src", target=cross_device / "out")
+
+        with patch("tidydir.space.os.statvfs", return_value=fake_statvfs(BLOCK)):
+            (result,) = BatchRunner([entry]).run()
+
+        assert "Not enough space" in result.error
+        assert result.result.moved_count == 0
+        assert (cross_device / "src" / "a.jpg").exists()
@@ -0,0 +1,77 @@
+"""Tests for run statistics."""
+
+import json
+
+from tidydir.organizer import FileOrganizer
+from tidydir.stats import PHASES, RunStats
+
+
+class TestRunStats:
+    """Test suite for RunStats."""
+
+    def test_add_and_incr(self):
+        """Test accumulating phase timings and counters."""
+        stats = RunStats()
+        stats.add("move", 0.5, 10)
+        stats.add("move", 0.5, 10)
+        stats.incr("files_moved", 20)
+
+        assert stats.phases["move"].seconds == 1.0
+        assert stats.phases["move"].items == 20
+        assert stats.phases["move"].rate == 20.0
+        assert stats.counters["files_moved"] == 20
+
+    def test_merge(self):
+        """Test adding another run's statistics."""
+        a, b = RunStats(), RunStats()
+        a.add("scan", 1.0, 10)
+        b.add("scan", 0.5, 5)
+        b.incr("files_moved", 3)
+
+        a.merge(b)
+
+        assert a.phases["scan"].seconds == 1.5
+        assert a.phases["scan"].items == 15
+        assert a.counters["files_moved"] == 3
+
+    def test_timer(self):
+        """Test timing a block and counting items inside it."""
+        stats = RunStats()
+        with stats.timer("scan") as scan:
+            scan.items = 3
+
+        assert stats.phases["scan"].items == 3
+        assert stats.phases["scan"].seconds >= 0
+
+    def test_json_report(self):
+        """Test the JSON report lists every phase."""
+        data = json.loads(RunStats().render("json"))
+        assert list(data["phases"]) == list(PHASES)
+        assert data["counters"]["files_moved"] == 0
+
+    def test_prometheus_textfile(self, tmp_path):
+        """Test writing a node-exporter textfile with escaped labels."""
+        stats = RunStats()
+        stats.add("scan", 0.25, 4)
+        path = tmp_path / "tidydir.prom"
+
+        stats.write_textfile(path, {"source": 'C:\\dir "x"'})
+
+        content = path.read_text()
+        assert 'tidydir_phase_seconds{phase="scan",source="C:\\\\dir \\"x\\""} 0.250000' in content
+        assert "# TYPE tidydir_files_moved gauge" in content
+        assert [p.name for p in tmp_path.iterdir()] == ["tidydir.prom"]
+
+    def test_organizer_collects_stats(self, tmp_path):
+        """Test that a run records every phase."""
+        (tmp_path / "photo.jpg").touch()
+        (tmp_path / "notes.txt").touch()
+
+        organizer = FileOrganizer(source_dir=tmp_path)
+        organizer.execute()
+
+        stats = organizer.stats
+        assert stats.counters["files_scanned"] == 2
+        assert stats.counters["files_moved"] == 2
+        for phase in PHASES:
+            assert stats.phases[phase].items > 0
@@ -0,0 +1,184 @@
+"""Tests for link views."""
+
+import os
+import shutil
+import tempfile
+import time
+from pathlib import Path
+
+import pytest
+
+from tidydir.organizer import FileOrganizer
+from tidydir.view import LinkMode, ViewBuilder
+
+needs_symlinks = pytest.mark.skipif(os.name == "nt", reason="symlinks need privileges on Windows")
+
+
+class TestViewBuilder:
+    """Test suite for ViewBuilder."""
+
+    @pytest.fixture
+    def dirs(self):
+        """Create a source directory with a few files and an empty view root."""
+        root = Path(tempfile.mkdtemp()).resolve()
+        source = root / "source"
+        source.mkdir()
+        for name in ("photo.jpg", "report.pdf", "notes.txt"):
+            (source / name).write_text(name)
+        yield source, root / "view"
+        shutil.rmtree(root)
+
+    def test_same_directory_rejected(self, dirs):
+        """Test that the view cannot live in the source directory itself."""
+        source, _view = dirs
+        with pytest.raises(ValueError):
+            ViewBuilder(FileOrganizer(source_dir=source))
+
+    @needs_symlinks
+    def test_symlink_view(self, dirs):
+        """Test building a symlink view leaves the sources in place."""
+        source, view = dirs
+        builder = ViewBuilder(FileOrganizer(source_dir=source, target_dir=view))
+
+        result = builder.sync()
+
+        assert result.created_count == 3
+        assert (view / "Images" / "photo.jpg").is_symlink()
+        assert (view / "Images" / "photo.jpg").read_text() == "photo.jpg"
+        assert (source / "photo.jpg").exists()
+
+    def test_hardlink_view(self, dirs):
+        """Test building a hardlink view shares inodes with the sources."""
+        source, view = dirs
+        builder = ViewBuilder(FileOrganizer(source_dir=source, target_dir=view), LinkMode.HARDLINK)
+
+        result = builder.sync()
+
+        assert result.created_count == 3
+        assert (view / "Documents" / "report.pdf").samefile(source / "report.pdf")
+
+    @pytest.mark.parametrize(
+        "mode", [pytest.param(LinkMode.SYMLINK, marks=needs_symlinks), LinkMode.HARDLINK]
+    )
+    def test_second_sync_creates_nothing(self, dirs, mode):
+        """Test that syncing an unchanged source again leaves the view as it is."""
+        source, view = dirs
+        organizer = FileOrganizer(source_dir=source, target_dir=view)
+        ViewBuilder(organizer, mode).sync()
+
+        result = ViewBuilder(organizer, mode).sync()
+
+        assert (result.created_count, result.kept_count, result.removed_count) == (0, 3, 0)
+        assert sum(len(files) for _, _, files in os.walk(view)) == 3
+
+    def test_max_per_dir_rejected(self, dirs):
+        """Test that a view refuses to shard its category directories."""
+        source, view = dirs
+        with pytest.raises(ValueError, match="max_per_dir"):
+            ViewBuilder(FileOrganizer(source_dir=source, target_dir=view, max_per_dir=2))
+
+    @needs_symlinks
+    def test_incremental_update(self, dirs):
+        """Test that re-running only applies the difference."""
+        source, view = dirs
+        organizer = FileOrganizer(source_dir=source, target_dir=view)
+        ViewBuilder(organizer).sync()
+
+        (source / "notes.txt").unlink()
+        (source / "song.mp3").touch()
+
+        builder = ViewBuilder(organizer)
+        diff = builder.diff()
+        assert len(diff.keep) == 2
+        assert len(diff.create) == 1
+        assert diff.remove == [view / "Text" / "notes.txt"]
+
+        result = builder.sync()
+        assert (result.created_count, result.kept_count, result.removed_count) == (1, 2, 1)
+        assert (view / "Audio" / "song.mp3").is_symlink()
+        assert not (view / "Text").exists()
+
+    @needs_symlinks
+    def test_archive_layout(self, dirs):
+        """Test that archived entries are kept by a second sync."""
+        source, view = dirs
+        mtime = time.mktime((2000, 6, 1, 12, 0, 0, 0, 0, -1))
+        os.utime(source / "report.pdf", (mtime, mtime))
+        organizer = FileOrganizer(
+            source_dir=source, target_dir=view, archive_layout="old/{year}/{category}"
+        )
+        ViewBuilder(organizer).sync()
+
+        result = ViewBuilder(organizer).sync()
+
+        assert (view / "old" / "2000" / "Documents" / "report.pdf").is_symlink()
+        assert (result.created_count, result.kept_count, result.removed_count) == (0, 3, 0)
+
+    @needs_symlinks
+    def test_unrelated_entries_untouched(self, dirs):
+        """Test that files outside category folders are left alone."""
+        source, view = dirs
+        view.mkdir()
+        (view / "README").write_text("mine")
+        (view / "Images").mkdir()
+        (view / "Images" / "photo.jpg").write_text("not a link")
+
+        result = ViewBuilder(FileOrganizer(source_dir=source, target_dir=view)).sync()
+
+        assert result.removed_count == 0
+        assert (view / "README").read_text() == "mine"
+        assert (view / "Images" / "photo.jpg").read_text() == "not a link"
+        assert (view / "Images" / "photo_1.jpg").is_symlink()
+
+    def test_hardlink_unrelated_files_kept(self, dirs):
+        """Test that a hardlink sync never unlinks files it did not create."""
+        source, view = dirs
+        (view / "Images").mkdir(parents=True)
+        (view / "Images" / "real.jpg").write_text("mine")
+
+        result = ViewBuilder(
+            FileOrganizer(source_dir=source, target_dir=view), LinkMode.HARDLINK
+        ).sync()
+
+        assert (result.created_count, result.removed_count) == (3, 0)
+        assert (view / "Images" / "real.jpg").read_text() == "mine"
+
+    def test_hardlink_last_copy_kept(self, dirs):
+        """Test that the hardlink of a deleted source is not removed."""
+        source, view = dirs
+        organizer = FileOrganizer(source_dir=source, target_dir=view)
+        ViewBuilder(organizer, LinkMode.HARDLINK).sync()
+        (source / "report.pdf").unlink()
+
+        result = ViewBuilder(organizer, LinkMode.HARDLINK).sync()
+
+        assert (result.created_count, result.kept_count, result.removed_count) == (0, 2, 0)
+        assert (view / "Documents" / "report.pdf").read_text() == "report.pdf"
+
+    @needs_symlinks
+    def test_foreign_symlinks_kept(self, dirs, tmp_path):
+        """Test that symlinks pointing outside the source tree survive a sync."""
+        source, view = dirs
+        elsewhere = tmp_path / "elsewhere.jpg"
+        elsewhere.write_text("mine")
+        (view / "Images").mkdir(parents=True)
+        (view / "Images" / "mine.jpg").symlink_to(elsewhere)
+
+        result = ViewBuilder(FileOrganizer(source_dir=source, target_dir=view)).sync()
+
+        assert (result.created_count, result.removed_count) == (3, 0)
+        assert (view / "Images" / "mine.jpg").read_text() == "mine"
+
+    def test_hardlink_replaced_source(self, dirs):
+        """Test that a replaced source keeps its old link and gets a new one."""
+        source, view = dirs
+        organizer = FileOrganizer(source_dir=source, target_dir=view)
+        ViewBuilder(organizer, LinkMode.HARDLINK).sync()
+        (source / "notes.txt").unlink()
+        (source / "notes.txt").write_text("new")
+
+        result = ViewBuilder(organizer, LinkMode.HARDLINK).sync()
+
+        assert (result.created_count, result.removed_count) == (1, 0)
+        assert (view / "Text" / "notes.txt").read_text() == "notes.txt"
+        assert (view / "Text" / "notes_1.txt").read_text() == "new"